@@ -84,78 +84,2477 @@ import signal
 import re
 import unicodedata
 import hashlib
+import math
 import random
+import mmap
+import socket
+import ssl
+import select
+import struct
+import shutil
+import sqlite3
+import functools
+import subprocess
+import ctypes
+import ctypes.util
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import NamedTuple
 
-# YouTube API imports
+# YouTube API imports are deferred to load_youtube_api() so dry runs and planning never pay for them
+HAS_YOUTUBE_API = None  # None until load_youtube_api() has run
+_youtube_api_lock = threading.Lock()
+
+
+class HttpError(Exception):
+    """Placeholder until load_youtube_api() binds googleapiclient.errors.HttpError"""
+
+
+def load_youtube_api():
+    """Import the Google client stack on first use; returns False if it is not installed"""
+    global HAS_YOUTUBE_API, Request, Credentials, InstalledAppFlow, build, build_from_document
+    global get_static_doc, AnonymousCredentials, HttpError, MediaFileUpload, GrowingFileUpload
+    with _youtube_api_lock:
+        if HAS_YOUTUBE_API is None:
+            try:
+                from google.auth.transport.requests import Request
+                from google.oauth2.credentials import Credentials
+                from google_auth_oauthlib.flow import InstalledAppFlow
+                from googleapiclient.discovery import build, build_from_document
+                from googleapiclient.discovery_cache import get_static_doc
+                from google.auth.credentials import AnonymousCredentials
+                from googleapiclient.errors import HttpError
+                from googleapiclient.http import MediaFileUpload, MediaUpload
+                # The client only accepts MediaUpload instances as media bodies
+                GrowingFileUpload = type('GrowingFileUpload', (GrowingFile, MediaUpload), {})
+                HAS_YOUTUBE_API = True
+                print("✅ YouTube API libraries loaded")
+            except ImportError:
+                HAS_YOUTUBE_API = False
+                print("❌ YouTube API libraries not installed. Run: pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client")
+    return HAS_YOUTUBE_API
+
+
+YOUTUBE_DISCOVERY_URL = "https://youtube.googleapis.com/$discovery/rest?version=v3"
+# (resource, method) pairs the uploader calls; a discovery document without them is unusable
+_DISCOVERY_METHODS = (('videos', 'insert'), ('videos', 'list'), ('videos', 'update'), ('playlists', 'list'),
+                      ('playlists', 'insert'), ('playlistItems', 'insert'))
+_discovery_lock = threading.Lock()
+_discovery_document = None
+
+
+def _discovery_usable(document):
+    if not isinstance(document, dict) or document.get('version') != 'v3' or 'rootUrl' not in document:
+        return False
+    try:
+        resources = document['resources']
+        return (all(method in resources[resource]['methods'] for resource, method in _DISCOVERY_METHODS)
+                and resources['videos']['methods']['insert'].get('supportsMediaUpload', False))
+    except (KeyError, TypeError):
+        return False
+
+
+def youtube_discovery_document(cache_path=None):
+    """Parsed YouTube Data API v3 discovery document, shared by every service built in this process.
+
+    The copy bundled with googleapiclient and the cache file are compared by
+    revision and the newer usable one wins. Google is only asked for the
+    document when neither is usable, and the result is written to the cache.
+    """
+    global _discovery_document
+    with _discovery_lock:
+        if _discovery_document is not None:
+            return _discovery_document
+        
+        candidates = []
+        bundled = get_static_doc('youtube', 'v3')
+        if bundled:
+            candidates.append(json.loads(bundled))
+        cache_file = Path(cache_path) if cache_path else None
+        if cache_file and cache_file.exists():
+            candidates.append(_safe_read_json(cache_file))
+        candidates = [doc for doc in candidates if _discovery_usable(doc)]
+        
+        if candidates:
+            document = max(candidates, key=lambda doc: str(doc.get('revision', '')))
+        else:
+            import httplib2
+            response, content = httplib2.Http(timeout=30).request(YOUTUBE_DISCOVERY_URL)
+            document = json.loads(content) if response.status == 200 else None
+            if not _discovery_usable(document):
+                raise RuntimeError(f"Could not load the YouTube discovery document (HTTP {response.status})")
+            if cache_file:
+                _safe_write_json(cache_file, document)
+        
+        _discovery_document = document
+        return document
+
+# Use local timezone instead of forcing UTC
+import datetime as dt
+LOCAL_TZ = dt.datetime.now().astimezone().tzinfo
+UTC = timezone.utc
+
+# YouTube Data API quota resets at midnight Pacific time
 try:
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-    from googleapiclient.http import MediaFileUpload
-    HAS_YOUTUBE_API = True
-    print("✅ YouTube API libraries loaded")
-except ImportError:
-    HAS_YOUTUBE_API = False
-    print("❌ YouTube API libraries not installed. Run: pip install google-auth google-auth-oauthlib google-auth-httplib2 google-api-python-client")
-    sys.exit(1)
+    from zoneinfo import ZoneInfo
+    PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:
+    PACIFIC_TZ = timezone(timedelta(hours=-8), "PST")  # no tz database (e.g. Windows without tzdata)
+
+def _nfc(s: str) -> str:
+    return unicodedata.normalize("NFC", s)
+
+def _file_key(p: Path, size: int | None = None) -> str:
+    if size is None:
+        size = p.stat().st_size
+    raw = f"{str(p.resolve())}|{size}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def rfc3339(dt):
+    return dt.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+# Raw control characters other than tab/newline/carriage return make a sidecar suspect
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+def _safe_read_json(path: Path) -> dict | None:
+    try:
+        with open(path, 'r', encoding='utf-8', errors='strict') as f:
+            data = f.read()
+            if _CONTROL_CHARS.search(data):
+                raise ValueError(f"Control characters found in {path}")
+            return json.loads(data)
+    except Exception as e:
+        print(f"❌ Error reading JSON from {path}: {e}")
+        return None
+
+def _safe_write_json(path: Path, data: dict) -> bool:
+    # Write to a temp file and rename over the target so a crash never leaves a half-written file
+    tmp_path = Path(path).with_name(f".{Path(path).name}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', errors='replace') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        print(f"❌ Error writing JSON to {path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return False
+
+OTHER_VIDEO_EXTENSIONS = ('.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm')
+
+
+class VideoEntry(NamedTuple):
+    """One video in a directory manifest, paired with its JSON sidecar"""
+    path: str
+    metadata_path: str | None
+    size: int
+    mtime: float
+
+
+def _sidecar_for(name: str, sidecars: set) -> str | None:
+    """Pick the JSON sidecar for a video name using the find_metadata preference order"""
+    stem = name.rsplit('.', 1)[0] if '.' in name else name
+    base_stem = stem[:-6] if stem.endswith('-audio') else stem
+    for candidate in (f"{base_stem}.json", f"{stem}.json", f"{name}.json"):
+        if candidate in sidecars:
+            return candidate
+    return None
+
+
+def scan_video_directory(directory, recursive=False) -> list[VideoEntry]:
+    """Index videos and their JSON sidecars with one os.scandir pass per directory.
+
+    Each directory keeps the find_video_files preference: *-audio.mp4 files,
+    otherwise other video containers, otherwise plain *.mp4. With recursive=True
+    date-partitioned subdirectories are indexed too (hidden ones are skipped).
+    """
+    manifest = []
+    pending_dirs = [str(directory)]
+    
+    while pending_dirs:
+        current = pending_dirs.pop()
+        audio, other, mp4 = [], [], []
+        sidecars = set()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not name.startswith('.'):
+                            pending_dirs.append(entry.path)
+                        continue
+                    lower = name.lower()
+                    if lower.endswith('.json'):
+                        sidecars.add(name)
+                    elif not entry.is_file():
+                        continue
+                    elif lower.endswith('-audio.mp4'):
+                        audio.append(entry)
+                    elif lower.endswith(OTHER_VIDEO_EXTENSIONS):
+                        other.append(entry)
+                    elif lower.endswith('.mp4'):
+                        mp4.append(entry)
+        except OSError as e:
+            print(f"⚠️ Could not scan {current}: {e}")
+            continue
+        
+        for entry in audio or other or mp4:
+            st = entry.stat()
+            sidecar = _sidecar_for(entry.name, sidecars)
+            manifest.append(VideoEntry(
+                entry.path,
+                os.path.join(current, sidecar) if sidecar else None,
+                st.st_size,
+                st.st_mtime
+            ))
+    
+    manifest.sort(key=lambda e: e.path)
+    return manifest
+
+
+ISO_MEDIA_EXTENSIONS = ('.mp4', '.m4v', '.mov')
+MAX_YOUTUBE_DURATION = 12 * 3600  # seconds; longer uploads are rejected by YouTube
+
+
+def mp4_top_level_boxes(path):
+    """Walk the top-level ISO BMFF boxes of an MP4/MOV file.
+
+    Returns ([(box_type, offset, size)], truncated). A render cut short leaves
+    its last box claiming more bytes than the file holds, which this catches
+    without reading any media data.
+    """
+    boxes = []
+    with open(path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        offset = 0
+        while offset < file_size:
+            f.seek(offset)
+            header = f.read(16)
+            if len(header) < 8:
+                return boxes, True
+            size, box_type = struct.unpack('>I4s', header[:8])
+            if size == 1:
+                if len(header) < 16:
+                    return boxes, True
+                size = struct.unpack('>Q', header[8:16])[0]
+            elif size == 0:
+                size = file_size - offset  # box runs to end of file
+            if size < 8:
+                return boxes, True
+            boxes.append((box_type.decode('latin-1'), offset, size))
+            if offset + size > file_size:
+                return boxes, True
+            offset += size
+    return boxes, False
+
+
+def probe_media(path, ffprobe="ffprobe", min_duration=1.0, timeout=120):
+    """Check that a video is complete and uploadable: container, duration, codecs, resolution.
+
+    Module-level so ProcessPoolExecutor workers can run it. Returns a plain
+    dict with 'ok' and, for rejected files, a human-readable 'reason'.
+    """
+    result = {'ok': False, 'reason': None, 'format': None, 'duration': None, 'video_codec': None,
+              'audio_codec': None, 'width': None, 'height': None, 'faststart': None}
+    path = str(path)
+    
+    try:
+        if path.lower().endswith(ISO_MEDIA_EXTENSIONS):
+            boxes, truncated = mp4_top_level_boxes(path)
+            if truncated:
+                last = boxes[-1][0] if boxes else 'header'
+                result['reason'] = f"truncated container ('{last}' box runs past end of file)"
+                return result
+            types = [box[0] for box in boxes]
+            if 'moov' not in types:
+                result['reason'] = "no moov atom (render never finalized)"
+                return result
+            result['faststart'] = 'mdat' not in types or types.index('moov') < types.index('mdat')
+    except OSError as e:
+        result['reason'] = f"unreadable: {e}"
+        return result
+    
+    try:
+        proc = subprocess.run([ffprobe, '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', path],
+                              capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        result['reason'] = f"ffprobe timed out after {timeout}s"
+        return result
+    except OSError as e:
+        result['reason'] = f"ffprobe failed to run: {e}"
+        return result
+    
+    errors = proc.stderr.strip()
+    if proc.returncode != 0 or errors:
+        result['reason'] = f"corrupt container: {(errors.splitlines() or ['ffprobe exit code %d' % proc.returncode])[0]}"
+        return result
+    
+    try:
+        info = json.loads(proc.stdout or '{}')
+    except json.JSONDecodeError:
+        result['reason'] = "unparseable ffprobe output"
+        return result
+    
+    fmt = info.get('format', {})
+    streams = info.get('streams', [])
+    video = next((st for st in streams if st.get('codec_type') == 'video'
+                  and not st.get('disposition', {}).get('attached_pic')), None)
+    audio = next((st for st in streams if st.get('codec_type') == 'audio'), None)
+    result['format'] = fmt.get('format_name')
+    if video:
+        result.update(video_codec=video.get('codec_name'), width=video.get('width'), height=video.get('height'))
+    if audio:
+        result['audio_codec'] = audio.get('codec_name')
+    
+    durations = [fmt.get('duration')] + [st.get('duration') for st in (video, audio) if st]
+    for value in durations:
+        try:
+            result['duration'] = float(value)
+            break
+        except (TypeError, ValueError):
+            continue
+    
+    if not video:
+        result['reason'] = "no video stream"
+    elif not video.get('codec_name') or video.get('codec_name') == 'none':
+        result['reason'] = "unknown video codec"
+    elif not result['width'] or not result['height']:
+        result['reason'] = "unknown resolution"
+    elif result['duration'] is None:
+        result['reason'] = "unknown duration"
+    elif result['duration'] < min_duration:
+        result['reason'] = f"too short ({result['duration']:.1f}s)"
+    elif result['duration'] > MAX_YOUTUBE_DURATION:
+        result['reason'] = f"longer than YouTube's 12 hour limit ({result['duration'] / 3600:.1f}h)"
+    else:
+        result['ok'] = True
+    return result
+
+
+def faststart_state(path):
+    """(needs_remux, note) for one video, judged from its top-level box layout"""
+    if not str(path).lower().endswith(ISO_MEDIA_EXTENSIONS):
+        return False, "not MP4/MOV"
+    try:
+        boxes, truncated = mp4_top_level_boxes(path)
+    except OSError as e:
+        return False, f"unreadable: {e}"
+    if truncated:
+        return False, "truncated, left as is"
+    types = [box[0] for box in boxes]
+    if 'moov' not in types or 'mdat' not in types:
+        return False, "no moov/mdat, left as is"
+    if types.index('moov') < types.index('mdat'):
+        return False, "already faststart"
+    return True, "moov after mdat"
+
+
+def faststart_copy(source, target, ffmpeg="ffmpeg", timeout=3600):
+    """Remux source to target with stream copy and +faststart, never touching source.
+
+    Module-level so ProcessPoolExecutor workers can run it. ffmpeg writes a
+    .partial file that is checked and renamed into place, so target only
+    ever holds a complete remux and is reused by later runs. Returns
+    (path to upload, note); on any failure the original path is returned.
+    """
+    needed, note = faststart_state(source)
+    if not needed:
+        return source, note
+    if os.path.exists(target):
+        return target, "reused earlier remux"
+    
+    partial = f"{target}.partial"
+    container = 'mov' if source.lower().endswith('.mov') else 'mp4'
+    try:
+        proc = subprocess.run([ffmpeg, '-v', 'error', '-nostdin', '-y', '-i', source, '-map', '0', '-c', 'copy',
+                               '-map_metadata', '0', '-ignore_unknown', '-movflags', '+faststart', '-f', container,
+                               partial], capture_output=True, text=True, timeout=timeout)
+        if proc.returncode != 0:
+            return source, f"remux failed: {(proc.stderr.strip().splitlines() or ['exit code %d' % proc.returncode])[-1]}"
+        boxes, truncated = mp4_top_level_boxes(partial)
+        types = [box[0] for box in boxes]
+        if truncated or 'moov' not in types or ('mdat' in types and types.index('mdat') < types.index('moov')):
+            return source, "remux output failed the faststart check"
+        os.replace(partial, target)
+        return target, "remuxed"
+    except (OSError, subprocess.SubprocessError) as e:
+        return source, f"remux failed: {e}"
+    finally:
+        if os.path.exists(partial):
+            try:
+                os.remove(partial)
+            except OSError:
+                pass
+
+
+def describe_media(media):
+    """One-line summary of a probe_media result for reports"""
+    codecs = "/".join(codec for codec in (media.get('video_codec'), media.get('audio_codec')) if codec)
+    duration = f"{media['duration']:.1f}s" if media.get('duration') is not None else "?s"
+    return f"{media.get('width')}x{media.get('height')} {codecs} {duration}"
+
+
+class PlannedUpload(NamedTuple):
+    """One file scheduled for upload in a bulk run"""
+    index: int
+    video_path: Path
+    metadata_path: str | None
+    release_time: datetime | None
+    file_key: str
+    content_sha256: str | None = None
+    content: dict | None = None  # rendered title/description/tags from the metadata preload
+    channel: str | None = None  # ChannelPool shard name when uploading through --channels
+    media: dict | None = None  # probe_media result when --validate is on
+    growing: object | None = None  # RenderCompletion when streaming a render that is still being written
+
+
+class MetadataManifest:
+    """Rendered upload metadata keyed by video fingerprint.
+
+    Each entry remembers the sidecar path, size and mtime it was rendered
+    from, so later runs reuse the title, description and tags of unchanged
+    sidecars without reading or parsing them again.
+    """
+    
+    RENDER_VERSION = 2  # bump when title/description rendering changes
+    
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        data = _safe_read_json(self.path) if self.path and self.path.exists() else None
+        if data and data.get('render_version') == self.RENDER_VERSION:
+            self.entries = data.get('entries', {})
+    
+    @staticmethod
+    def sidecar_state(metadata_path):
+        if not metadata_path:
+            return None, None
+        try:
+            st = os.stat(metadata_path)
+            return st.st_size, st.st_mtime
+        except OSError:
+            return None, None
+    
+    def get(self, file_key, metadata_path):
+        cached = self.entries.get(file_key)
+        if not cached or cached.get('sidecar') != metadata_path:
+            return None
+        size, mtime = self.sidecar_state(metadata_path)
+        if (cached.get('sidecar_size'), cached.get('sidecar_mtime')) != (size, mtime):
+            return None
+        return cached['content']
+    
+    def put(self, file_key, metadata_path, content, sidecar_state=None):
+        size, mtime = sidecar_state or self.sidecar_state(metadata_path)
+        with self._lock:
+            self.entries[file_key] = {
+                'sidecar': metadata_path,
+                'sidecar_size': size,
+                'sidecar_mtime': mtime,
+                'content': content
+            }
+            self._dirty = True
+    
+    def save(self):
+        with self._lock:
+            if not self.path or not self._dirty:
+                return True
+            self._dirty = False
+            return _safe_write_json(self.path, {'render_version': self.RENDER_VERSION, 'entries': self.entries})
+
+
+class FaststartRemuxer:
+    """Remuxes planned videos with +faststart in a process pool running ahead of the uploaders.
+
+    At most `lookahead` remuxes are outstanding, so the working directory
+    never holds a copy of the whole batch. Uploaders call upload_path(),
+    which waits for that file's remux and returns the path to send; history,
+    fingerprints and sessions keep using the original file's key. A copy is
+    deleted once its upload succeeds and kept otherwise, so a resumed
+    session continues with the same bytes.
+    """
+    
+    def __init__(self, work_dir, ffmpeg="ffmpeg", workers=2, lookahead=None):
+        self.work_dir = Path(work_dir)
+        self.ffmpeg = ffmpeg
+        self.lookahead = lookahead or workers * 2
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self._lock = threading.Lock()
+        self._queue = {}
+        self._futures = {}
+        self._outstanding = set()
+    
+    def target_for(self, planned):
+        return self.work_dir / f"{planned.file_key[:32]}{planned.video_path.suffix.lower()}"
+    
+    def start(self, plan):
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            for planned in plan:
+                self._queue[planned.file_key] = planned
+        self._fill()
+    
+    def _submit(self, planned):
+        self._futures[planned.file_key] = self.pool.submit(faststart_copy, str(planned.video_path),
+                                                           str(self.target_for(planned)), self.ffmpeg)
+        self._outstanding.add(planned.file_key)
+    
+    def _fill(self):
+        with self._lock:
+            while self._queue and len(self._outstanding) < self.lookahead:
+                file_key = next(iter(self._queue))
+                self._submit(self._queue.pop(file_key))
+    
+    def upload_path(self, planned, log_prefix=""):
+        """Path to upload for this planned file, waiting for its remux if needed"""
+        with self._lock:
+            if planned.file_key in self._queue:
+                # Uploaders can overtake the lookahead window; remux this one now
+                self._submit(self._queue.pop(planned.file_key))
+            future = self._futures.get(planned.file_key)
+        if future is None:
+            return planned.video_path
+        
+        try:
+            path, note = future.result()
+        except Exception as e:
+            path, note = str(planned.video_path), f"remux failed: {e}"
+        finally:
+            with self._lock:
+                self._outstanding.discard(planned.file_key)
+            self._fill()
+        
+        if note not in ("not MP4/MOV", "already faststart"):
+            print(_console(f"   {log_prefix}🧰 Faststart: {note}"))
+        return Path(path)
+    
+    def discard(self, planned):
+        """Delete the remuxed copy after a successful upload"""
+        try:
+            self.target_for(planned).unlink(missing_ok=True)
+        except OSError:
+            pass
+    
+    def close(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+
+class MediaProbeCache:
+    """probe_media results keyed by video fingerprint.
+
+    Size and mtime are stored with each result, so a file is probed again
+    only when it changes; results for the same render survive moves.
+    """
+    
+    PROBE_VERSION = 1  # bump when probe_media checks change
+    
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.entries = {}
+        self._dirty = False
+        data = _safe_read_json(self.path) if self.path and self.path.exists() else None
+        if data and data.get('probe_version') == self.PROBE_VERSION:
+            self.entries = data.get('entries', {})
+    
+    def get(self, file_key, size, mtime, min_duration):
+        cached = self.entries.get(file_key)
+        if not cached or (cached.get('size'), cached.get('mtime'), cached.get('min_duration')) != (size, mtime, min_duration):
+            return None
+        return cached['result']
+    
+    def put(self, file_key, size, mtime, min_duration, result):
+        self.entries[file_key] = {'size': size, 'mtime': mtime, 'min_duration': min_duration, 'result': result}
+        self._dirty = True
+    
+    def save(self):
+        if not self.path or not self._dirty:
+            return True
+        self._dirty = False
+        return _safe_write_json(self.path, {'probe_version': self.PROBE_VERSION, 'entries': self.entries})
+
+
+class FingerprintIndex:
+    """Rename/move-safe content fingerprints, cached in a sidecar file.
+
+    A fingerprint is the file size plus SHA-256 over sampled head, middle and
+    tail blocks read through mmap, so the same render gets the same key in any
+    folder. Size and mtime are stored with each cached fingerprint and only
+    used to decide whether the file must be read again.
+    """
+    
+    SAMPLE_BYTES = 1024 * 1024
+    
+    def __init__(self, path=None, verify=False):
+        self.path = Path(path) if path else None
+        self.verify = verify
+        self.entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if self.path and self.path.exists():
+            self.entries = _safe_read_json(self.path) or {}
+    
+    def _sampled_hash(self, video_path, size):
+        digest = hashlib.sha256(f"{size}|".encode("ascii"))
+        if size == 0:
+            return digest.hexdigest()
+        with open(video_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            block = self.SAMPLE_BYTES
+            if size <= block * 3:
+                digest.update(view)
+            else:
+                middle = (size // 2) - (block // 2)
+                for start in (0, middle, size - block):
+                    digest.update(view[start:start + block])
+        return digest.hexdigest()
+    
+    @staticmethod
+    def full_hash(video_path):
+        """SHA-256 of the whole file, for --verify-hash"""
+        digest = hashlib.sha256()
+        with open(video_path, 'rb') as f:
+            for block in iter(lambda: f.read(8 * 1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _cached(self, video_path, size, mtime):
+        cache_key = os.path.abspath(video_path)
+        with self._lock:
+            cached = self.entries.get(cache_key)
+        if cached and cached.get('size') == size and cached.get('mtime') == mtime:
+            return cache_key, cached
+        return cache_key, None
+    
+    def fingerprint(self, video_path, size=None, mtime=None):
+        """Return the sampled content fingerprint, reading the file only when it changed"""
+        if size is None or mtime is None:
+            st = os.stat(video_path)
+            size, mtime = st.st_size, st.st_mtime
+        
+        cache_key, cached = self._cached(video_path, size, mtime)
+        if cached and cached.get('fingerprint'):
+            return cached['fingerprint']
+        
+        fingerprint = self._sampled_hash(video_path, size)
+        with self._lock:
+            self.entries[cache_key] = {'size': size, 'mtime': mtime, 'fingerprint': fingerprint}
+            self._dirty = True
+        return fingerprint
+    
+    def content_sha256(self, video_path, size=None, mtime=None):
+        """Return the full-file SHA-256, cached alongside the sampled fingerprint"""
+        if size is None or mtime is None:
+            st = os.stat(video_path)
+            size, mtime = st.st_size, st.st_mtime
+        
+        fingerprint = self.fingerprint(video_path, size, mtime)
+        cache_key, cached = self._cached(video_path, size, mtime)
+        if cached and cached.get('sha256'):
+            return cached['sha256']
+        
+        full = self.full_hash(video_path)
+        with self._lock:
+            self.entries[cache_key] = {'size': size, 'mtime': mtime, 'fingerprint': fingerprint, 'sha256': full}
+            self._dirty = True
+        return full
+    
+    def save(self):
+        with self._lock:
+            if not self.path or not self._dirty:
+                return True
+            self._dirty = False
+            return _safe_write_json(self.path, self.entries)
+
+
+args = None  # Global for console helper
+
+def _console(s: str) -> str:
+    global args
+    return s.encode("ascii", "ignore").decode("ascii") if args and getattr(args, 'ascii_console', False) else s
+
+
+class UploadLedger:
+    """Crash-safe upload history.
+
+    The legacy JSON file is kept as a snapshot and every completed upload is
+    appended to a JSONL journal next to it and fsynced immediately, so a run
+    killed half way never forgets the uploads it already finished. Loading
+    reads the snapshot and replays the journal once, which is O(n).
+    """
+    
+    COMPACT_THRESHOLD = 1000  # journal records before folding them into the snapshot
+    
+    def __init__(self, snapshot_path):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_suffix('.jsonl')
+        self.entries = {}
+        self._journal_records = 0
+        self._lock = threading.Lock()
+    
+    def __contains__(self, key):
+        return key in self.entries
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get(self, key, default=None):
+        return self.entries.get(key, default)
+    
+    def items(self):
+        return self.entries.items()
+    
+    def _quarantine(self, path):
+        """Move an unreadable history file aside instead of deleting it"""
+        target = path.with_name(f"{path.name}.corrupt-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+        try:
+            os.replace(path, target)
+            print(f"⚠️ Unreadable upload history moved to {target.name}")
+        except OSError as e:
+            print(f"⚠️ Could not move unreadable upload history {path.name}: {e}")
+    
+    def load(self):
+        """Load the legacy snapshot, then replay the append-only journal on top of it"""
+        self.entries = {}
+        self._journal_records = 0
+        
+        if self.snapshot_path.exists():
+            snapshot = _safe_read_json(self.snapshot_path)
+            if isinstance(snapshot, dict):
+                self.entries.update(snapshot)
+            else:
+                self._quarantine(self.snapshot_path)
+        
+        if self.journal_path.exists():
+            with open(self.journal_path, 'r', encoding='utf-8', errors='replace') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                        self.entries[record['key']] = record['entry']
+                        self._journal_records += 1
+                    except (ValueError, KeyError, TypeError):
+                        # A torn final line is expected after a crash mid-write
+                        print(f"⚠️ Skipping damaged upload journal line {line_no} in {self.journal_path.name}")
+        
+        return self
+    
+    def record(self, key, entry):
+        """Durably append one completed upload before returning"""
+        line = json.dumps({'key': key, 'entry': entry}, ensure_ascii=False)
+        with self._lock:
+            with open(self.journal_path, 'a+b') as f:
+                # Start on a fresh line if the previous run died mid-record
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+                f.write(line.encode('utf-8') + b'\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[key] = entry
+            self._journal_records += 1
+    
+    def __setitem__(self, key, entry):
+        self.record(key, entry)
+    
+    def compact(self, force=False):
+        """Fold the journal into the JSON snapshot once it has grown large.
+
+        The snapshot is replaced atomically before the journal is cleared, and
+        replaying a journal over a snapshot that already contains it is harmless.
+        """
+        with self._lock:
+            if not self._journal_records or (not force and self._journal_records < self.COMPACT_THRESHOLD):
+                return True
+            if not _safe_write_json(self.snapshot_path, self.entries):
+                return False
+            self.journal_path.unlink(missing_ok=True)
+            self._journal_records = 0
+            return True
+
+
+def _utc_text(value):
+    """ISO timestamp -> sortable UTC text 'YYYY-MM-DDTHH:MM:SSZ' (naive values are local time)"""
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=LOCAL_TZ)
+    return rfc3339(moment)
+
+
+class BlockedIntervals:
+    """Disjoint open intervals (start, end) in epoch seconds, merged on insert.
+
+    Kept in a treap keyed by start (a binary search tree balanced by random
+    priorities), so add() and blocked_until() take O(log n) expected time
+    however many intervals are booked; overlapping intervals are absorbed
+    into the new one as it is inserted.
+    """
+    
+    class _Node:
+        __slots__ = ('start', 'end', 'priority', 'left', 'right')
+        
+        def __init__(self, start, end):
+            self.start, self.end = start, end
+            self.priority = random.random()
+            self.left = self.right = None
+    
+    def __init__(self):
+        self.root = None
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    @classmethod
+    def _split(cls, node, key):
+        """(intervals starting before key, the rest)"""
+        if node is None:
+            return None, None
+        if node.start < key:
+            node.right, right = cls._split(node.right, key)
+            return node, right
+        left, node.left = cls._split(node.left, key)
+        return left, node
+    
+    @classmethod
+    def _merge(cls, left, right):
+        """Join two treaps where every start in left is below every start in right"""
+        if left is None or right is None:
+            return left or right
+        if left.priority > right.priority:
+            left.right = cls._merge(left.right, right)
+            return left
+        right.left = cls._merge(left, right.left)
+        return right
+    
+    @classmethod
+    def _pop_last(cls, node):
+        """(treap without its last interval, that interval)"""
+        if node.right is None:
+            rest, node.left = node.left, None
+            return rest, node
+        node.right, last = cls._pop_last(node.right)
+        return node, last
+    
+    @staticmethod
+    def _size(node):
+        count, stack = 0, [node] if node else []
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(child for child in (node.left, node.right) if child)
+        return count
+    
+    def add(self, start, end):
+        before, after = self._split(self.root, start)
+        if before is not None:
+            before, last = self._pop_last(before)
+            if last.end > start:
+                start, end = last.start, max(end, last.end)
+                self.count -= 1
+            else:
+                before = self._merge(before, last)
+        overlapping, after = self._split(after, end)
+        if overlapping is not None:
+            # Intervals are disjoint and sorted, so the last one absorbed ends latest
+            rest, last = self._pop_last(overlapping)
+            end = max(end, last.end)
+            self.count -= self._size(rest) + 1
+        self.root = self._merge(self._merge(before, self._Node(start, end)), after)
+        self.count += 1
+    
+    def blocked_until(self, t):
+        """End of the interval holding t, or None if t is free"""
+        node, found = self.root, None
+        while node is not None:
+            if node.start <= t:
+                found, node = node, node.right
+            else:
+                node = node.left
+        if found is not None and found.start < t < found.end:
+            return found.end
+        return None
+
+
+class ReleaseSlotAllocator:
+    """Hands out release times at least `spacing` apart from every booked one.
+
+    Each booked slot blocks the open interval (slot - spacing, slot + spacing)
+    in a BlockedIntervals treap, so a back-to-back run of earlier bookings is
+    one interval and booking or finding the next free time is O(log n).
+    Candidates also skip daily local blackout windows and days that already
+    hold daily_cap releases. Once a day has a booking, its blackout windows
+    (and its neighbours', for windows past midnight) are blocked in the treap
+    too, and a day that reaches the cap is blocked whole, so a stretch of
+    booked days is also one interval and allocate() crosses it in one jump.
+    """
+    
+    MAX_STEPS = 1000  # jumps past blackouts and blocked runs; only reached if blackouts cover whole days
+    
+    def __init__(self, spacing_minutes=10, blackouts=None, daily_cap=None):
+        self.spacing = max(1, int(spacing_minutes)) * 60
+        self.blackouts = blackouts or []
+        self.daily_cap = daily_cap
+        self.blocked = BlockedIntervals()
+        self.per_day = {}  # local date -> releases booked that day
+        self.booked = 0
+        self._blackout_days = set()  # local dates whose blackout windows are in self.blocked
+    
+    @staticmethod
+    def parse_blackouts(text):
+        """'00:00-07:00,12:00-12:30' -> [(start_minute, end_minute)] in local time"""
+        windows = []
+        for part in filter(None, (p.strip() for p in (text or '').split(','))):
+            match = re.fullmatch(r'(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})', part)
+            if not match:
+                raise ValueError(f"Invalid blackout window: {part!r} (use HH:MM-HH:MM)")
+            h1, m1, h2, m2 = map(int, match.groups())
+            start, end = h1 * 60 + m1, h2 * 60 + m2
+            if start >= 24 * 60 or end > 24 * 60 or start == end:
+                raise ValueError(f"Invalid time in blackout window: {part!r}")
+            windows.append((start, end))
+        return windows
+    
+    @staticmethod
+    def _midnight(day):
+        return int(datetime.combine(day, datetime.min.time(), LOCAL_TZ).timestamp())
+    
+    def _block_day(self, day, start_minute, end_minute):
+        """Block [start, end) minutes from local midnight of day; end may run past midnight"""
+        midnight = self._midnight(day)
+        # The intervals are open, so start one second early to block the start minute itself
+        self.blocked.add(midnight + start_minute * 60 - 1, midnight + end_minute * 60)
+    
+    def book(self, slot):
+        """Mark a release time as taken"""
+        t = int(slot.timestamp())
+        day = slot.astimezone(LOCAL_TZ).date()
+        self.per_day[day] = self.per_day.get(day, 0) + 1
+        self.booked += 1
+        self.blocked.add(t - self.spacing, t + self.spacing)
+        for near in (day - timedelta(days=1), day, day + timedelta(days=1)):
+            if self.blackouts and near not in self._blackout_days:
+                self._blackout_days.add(near)
+                for start, end in self.blackouts:
+                    self._block_day(near, start, end if start < end else end + 24 * 60)
+        if self.daily_cap and self.per_day[day] == self.daily_cap:
+            self._block_day(day, 0, 24 * 60)
+    
+    def _blocked_until(self, t):
+        return self.blocked.blocked_until(t)
+    
+    def _blackout_until(self, t):
+        local = datetime.fromtimestamp(t, LOCAL_TZ)
+        midnight = local.replace(hour=0, minute=0, second=0, microsecond=0)
+        minute = (local - midnight).total_seconds() / 60
+        for start, end in self.blackouts:
+            if start < end and start <= minute < end:
+                return int((midnight + timedelta(minutes=end)).timestamp())
+            if start > end and (minute >= start or minute < end):
+                day = midnight + timedelta(days=1) if minute >= start else midnight
+                return int((day + timedelta(minutes=end)).timestamp())
+        return None
+    
+    def allocate(self, not_before):
+        """Book and return the earliest free slot at or after not_before (rounded up to the minute)"""
+        t = -(-int(not_before.timestamp()) // 60) * 60
+        for _ in range(self.MAX_STEPS):
+            # Booked days have their blackouts and a reached cap in self.blocked; other days only need the windows
+            moved = self._blocked_until(t) or self._blackout_until(t)
+            if moved is None:
+                slot = datetime.fromtimestamp(t, LOCAL_TZ)
+                self.book(slot)
+                return slot
+            t = moved
+        raise ValueError("No free release slot found; check --blackout and --daily-cap")
+
+
+class UploadHistoryDB:
+    """Upload history in an indexed SQLite database.
+
+    Same interface as UploadLedger (membership, get, items, record, compact),
+    but lookups are index queries, so a run touches only the rows it asks
+    about instead of parsing and rewriting the whole history. Indexed
+    columns: key (fingerprint), content_sha256, video_id, scheduled_utc and
+    file_name; the full entry is kept as JSON. A legacy JSON snapshot and
+    JSONL journal are imported automatically, and again if they change, so
+    an older uploader writing them is never lost.
+    
+    The slots table holds release times reserved by runs whose uploads have
+    not been recorded yet, so concurrent batches do not book the same slot.
+    
+    read_only (dry runs) works on an in-memory copy of the database and the
+    legacy import, so nothing is created or changed on disk.
+    """
+    
+    SLOT_RESERVATION_TTL = timedelta(days=1)  # reservations of crashed runs stop blocking after this
+    COLUMNS = ("key", "video_id", "upload_time", "scheduled_utc", "title", "file_name", "file_size",
+               "content_sha256", "channel", "entry", "processing_state")
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS uploads (
+            key TEXT PRIMARY KEY,
+            video_id TEXT,
+            upload_time TEXT,
+            scheduled_utc TEXT,
+            title TEXT,
+            file_name TEXT,
+            file_size INTEGER,
+            content_sha256 TEXT,
+            channel TEXT,
+            entry TEXT NOT NULL,
+            processing_state TEXT
+        );
+        CREATE INDEX IF NOT EXISTS uploads_content_sha256 ON uploads(content_sha256);
+        CREATE INDEX IF NOT EXISTS uploads_video_id ON uploads(video_id);
+        CREATE INDEX IF NOT EXISTS uploads_scheduled_utc ON uploads(scheduled_utc);
+        CREATE INDEX IF NOT EXISTS uploads_file_name ON uploads(file_name);
+        CREATE TABLE IF NOT EXISTS slots (
+            key TEXT PRIMARY KEY,
+            scheduled_utc TEXT NOT NULL,
+            reserved_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS slots_scheduled_utc ON slots(scheduled_utc);
+        CREATE TABLE IF NOT EXISTS imports (
+            path TEXT PRIMARY KEY,
+            size INTEGER,
+            mtime REAL,
+            imported_at TEXT
+        );
+    """
+    
+    def __init__(self, db_path, legacy_path=None, read_only=False):
+        self.db_path = Path(db_path)
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self.conn = None
+    
+    def _snapshot(self):
+        """In-memory copy of the database file, read without writing anything next to it"""
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        if not self.db_path.exists():
+            return conn
+        uri = self.db_path.resolve().as_uri()
+        # mode=ro sees rows still in the WAL; a WAL database with no -shm file can only be read as immutable
+        for options in ("mode=ro", "immutable=1"):
+            source = None
+            try:
+                source = sqlite3.connect(f"{uri}?{options}", uri=True)
+                source.backup(conn)
+                return conn
+            except sqlite3.DatabaseError as e:
+                error = e
+            finally:
+                if source:
+                    source.close()
+        print(f"⚠️ Unreadable upload history database ({error}); dry run continues without it")
+        return conn
+    
+    def _connect(self):
+        if self.read_only:
+            conn = self._snapshot()
+        else:
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=FULL")  # a recorded upload must survive a crash, like the fsynced journal
+        conn.executescript(self.SCHEMA)
+        if 'processing_state' not in {row[1] for row in conn.execute("PRAGMA table_info(uploads)")}:
+            conn.execute("ALTER TABLE uploads ADD COLUMN processing_state TEXT")  # databases from before tracking
+        conn.execute("CREATE INDEX IF NOT EXISTS uploads_processing_state ON uploads(processing_state, upload_time)")
+        conn.commit()
+        return conn
+    
+    def load(self):
+        """Open (or create) the database and import legacy JSON history that is new or changed"""
+        try:
+            self.conn = self._connect()
+            self.conn.execute("SELECT COUNT(*) FROM uploads").fetchone()
+        except sqlite3.DatabaseError as e:
+            if self.conn:
+                self.conn.close()
+            target = self.db_path.with_name(f"{self.db_path.name}.corrupt-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+            print(f"⚠️ Unreadable upload history database ({e}) moved to {target.name}")
+            os.replace(self.db_path, target)
+            for suffix in ('-wal', '-shm'):
+                Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+            self.conn = self._connect()
+        
+        if self.legacy_path:
+            self._import_legacy()
+        return self
+    
+    def _import_legacy(self):
+        sources = [path for path in (self.legacy_path, self.legacy_path.with_suffix('.jsonl')) if path.exists()]
+        changed = []
+        for path in sources:
+            st = path.stat()
+            row = self.conn.execute("SELECT size, mtime FROM imports WHERE path = ?", (str(path),)).fetchone()
+            if row != (st.st_size, st.st_mtime):
+                changed.append((path, st))
+        if not changed:
+            return
+        
+        legacy = UploadLedger(self.legacy_path).load()
+        with self._lock, self.conn:
+            before = self.conn.total_changes
+            # Rows written by this database are newer than anything in the legacy files
+            self.conn.executemany(f"INSERT OR IGNORE INTO uploads {self._insert_columns}",
+                                  (self._row(key, entry) for key, entry in legacy.items() if isinstance(entry, dict)))
+            imported = self.conn.total_changes - before
+            for path, st in changed:
+                self.conn.execute("INSERT OR REPLACE INTO imports VALUES (?, ?, ?, ?)",
+                                  (str(path), st.st_size, st.st_mtime, datetime.now().isoformat()))
+        print(f"🗃️ Imported {imported} upload(s) from {', '.join(path.name for path, _ in changed)} into {self.db_path.name}")
+    
+    _insert_columns = f"({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+    
+    @staticmethod
+    def _row(key, entry):
+        return (key, entry.get('video_id'), entry.get('upload_time'), _utc_text(entry.get('scheduled_time')),
+                entry.get('title'), entry.get('file_name'), entry.get('file_size'), entry.get('content_sha256'),
+                entry.get('channel'), json.dumps(entry, ensure_ascii=False),
+                (entry.get('processing') or {}).get('state', 'pending' if entry.get('video_id') else None))
+    
+    def __contains__(self, key):
+        with self._lock:
+            return self.conn.execute("SELECT 1 FROM uploads WHERE key = ?", (key,)).fetchone() is not None
+    
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM uploads").fetchone()[0]
+    
+    def get(self, key, default=None):
+        with self._lock:
+            row = self.conn.execute("SELECT entry FROM uploads WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+    
+    def items(self):
+        with self._lock:
+            rows = self.conn.execute("SELECT key, entry FROM uploads").fetchall()
+        return [(key, json.loads(entry)) for key, entry in rows]
+    
+    def record(self, key, entry):
+        """Durably store one completed upload before returning"""
+        with self._lock, self.conn:
+            self.conn.execute(f"INSERT OR REPLACE INTO uploads {self._insert_columns}", self._row(key, entry))
+            self.conn.execute("DELETE FROM slots WHERE key = ?", (key,))
+    
+    def __setitem__(self, key, entry):
+        self.record(key, entry)
+    
+    def compact(self, force=False):
+        """Every record is already committed; only fold the WAL back into the database file"""
+        with self._lock:
+            self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        return True
+    
+    def query(self, where, params=(), order="upload_time"):
+        """Entries matching an SQL condition on the indexed columns, e.g. query('video_id = ?', (vid,))"""
+        with self._lock:
+            rows = self.conn.execute(f"SELECT entry FROM uploads WHERE {where} ORDER BY {order}", params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+    
+    def tracking_candidates(self, since):
+        """(key, entry) for uploads since `since` whose YouTube processing has not settled yet"""
+        with self._lock:
+            rows = self.conn.execute("SELECT key, entry FROM uploads WHERE processing_state = 'pending' "
+                                     "AND upload_time >= ?", (since.isoformat(),)).fetchall()
+        return [(key, json.loads(entry)) for key, entry in rows]
+    
+    def scheduled_between(self, start, end):
+        """Entries whose release time falls in [start, end), in release order"""
+        return self.query("scheduled_utc >= ? AND scheduled_utc < ?", (rfc3339(start), rfc3339(end)),
+                          order="scheduled_utc")
+    
+    def allocate_slots(self, allocator, requests, since, dry_run=False):
+        """Give each (key, not_before) the allocator's next free release slot and reserve it.
+
+        Booked release times (recorded uploads and live reservations from
+        `since` on) are read and the new reservations written inside one
+        IMMEDIATE transaction, so two planners never hand out the same slot.
+        A dry run allocates the same way but reserves nothing.
+        Returns {key: release datetime}.
+        """
+        keys = {key for key, _ in requests}
+        since_utc = rfc3339(since)
+        fresh = rfc3339(datetime.now(UTC) - self.SLOT_RESERVATION_TTL)
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                booked = [row[0] for row in self.conn.execute(
+                    "SELECT scheduled_utc FROM uploads WHERE scheduled_utc >= ?", (since_utc,))]
+                booked += [utc for key, utc in self.conn.execute(
+                    "SELECT key, scheduled_utc FROM slots WHERE scheduled_utc >= ? AND reserved_at >= ?",
+                    (since_utc, fresh)) if key not in keys]
+                for utc in booked:
+                    allocator.book(datetime.strptime(utc, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=UTC))
+                slots = {key: allocator.allocate(not_before) for key, not_before in requests}
+                if not dry_run:
+                    reserved_at = rfc3339(datetime.now(UTC))
+                    self.conn.executemany("INSERT OR REPLACE INTO slots VALUES (?, ?, ?)",
+                                          [(key, rfc3339(slot), reserved_at) for key, slot in slots.items()])
+                self.conn.execute("ROLLBACK" if dry_run else "COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        return slots
+    
+    def release_slots(self, keys):
+        """Drop reservations of uploads that did not happen, freeing their slots for later runs"""
+        with self._lock, self.conn:
+            self.conn.executemany("DELETE FROM slots WHERE key = ?", [(key,) for key in keys])
+    
+    def close(self):
+        with self._lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+
+
+class UploadSessionStore:
+    """Persisted resumable-upload sessions keyed by file fingerprint.
+
+    The session URI and the last offset the server confirmed are saved after
+    every chunk, so an interrupted upload continues from that offset on the
+    next run instead of starting again from byte 0.
+    """
+    
+    MAX_SESSION_AGE = timedelta(days=6)  # YouTube upload session URIs live for about a week
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.sessions = {}
+        if self.path.exists():
+            self.sessions = _safe_read_json(self.path) or {}
+    
+    def get(self, file_key, file_size):
+        """Return a saved session for this file, or None if there is no usable one"""
+        with self._lock:
+            session = self.sessions.get(file_key)
+        if not session:
+            return None
+        
+        try:
+            created = datetime.fromisoformat(session['created'])
+        except (KeyError, TypeError, ValueError):
+            created = None
+        
+        if session.get('file_size') != file_size or not created or datetime.now() - created > self.MAX_SESSION_AGE:
+            print(f"   ⌛ Discarding expired upload session for {session.get('file_name', file_key[:12])}")
+            self.discard(file_key)
+            return None
+        return session
+    
+    def channel(self, file_key):
+        """Channel that opened the saved session for this file, if any"""
+        with self._lock:
+            return (self.sessions.get(file_key) or {}).get('channel')
+    
+    def save(self, file_key, uri, offset, video_path, channel=None, growing=False):
+        """Record the session URI and the byte offset confirmed by the server.
+
+        Sessions of files still being written are saved with file_size None,
+        since their size only becomes known when the writer finishes.
+        """
+        with self._lock:
+            session = self.sessions.get(file_key)
+            if not session or session.get('uri') != uri:
+                session = {
+                    'uri': uri,
+                    'created': datetime.now().isoformat(),
+                    'file_name': Path(video_path).name,
+                    'file_size': None if growing else Path(video_path).stat().st_size
+                }
+                if channel:
+                    session['channel'] = channel
+            session['offset'] = offset
+            session['updated'] = datetime.now().isoformat()
+            self.sessions[file_key] = session
+            _safe_write_json(self.path, self.sessions)
+    
+    def discard(self, file_key):
+        with self._lock:
+            if self.sessions.pop(file_key, None) is not None:
+                _safe_write_json(self.path, self.sessions)
+
+
+class WorkClaims:
+    """Lease files that let several uploader processes, on one or many hosts, share a directory.
+
+    A file is claimed by creating <key>.lease in the claims directory with
+    O_EXCL, and finished by writing <key>.done with its video id. While a
+    node works it touches its leases every heartbeat_interval. A lease whose
+    mtime this node has watched stand still for lease_seconds belongs to a
+    dead node; the mtime is only compared with itself and the wait is timed
+    on the observer's monotonic clock, so clock skew between hosts does not
+    matter. A lease left by a node that died before this one started is
+    therefore reclaimed lease_seconds after it is first seen. It is
+    reclaimed by renaming it aside, and the rename only counts if the moved
+    file is still the expired one, so two reclaimers never both win.
+    """
+    
+    def __init__(self, claims_dir, node_id=None, lease_seconds=120, heartbeat_interval=None):
+        self.dir = Path(claims_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.node = node_id or socket.gethostname()
+        self.owner = f"{self.node}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval or max(1.0, lease_seconds / 4)
+        self.held = {}     # key -> token of leases this process owns
+        self.waiting = set()  # keys leased by other live nodes when we last tried
+        self._seen = {}    # key -> (lease mtime_ns, monotonic time first seen with that mtime)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.stats = {'claimed': 0, 'reclaimed': 0, 'busy': 0, 'done_elsewhere': 0, 'lost': 0}
+    
+    def _lease(self, key):
+        return self.dir / f"{key}.lease"
+    
+    def _done(self, key):
+        return self.dir / f"{key}.done"
+    
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def done(self, key):
+        return self._done(key).exists()
+    
+    def _create(self, key, token, file_name):
+        record = {'owner': self.owner, 'token': token, 'file_name': file_name,
+                  'claimed': datetime.now().isoformat()}
+        fd = os.open(self._lease(key), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    def _expired(self, key, lease):
+        """True once this node has watched the lease mtime stand still for lease_seconds"""
+        try:
+            st = lease.stat()
+        except FileNotFoundError:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            seen = self._seen.get(key)
+            if not seen or seen[0] != st.st_mtime_ns:
+                self._seen[key] = seen = (st.st_mtime_ns, now)
+        return now - seen[1] >= self.lease_seconds
+    
+    def _steal(self, key, lease):
+        with self._lock:
+            observed = self._seen.get(key, (None,))[0]
+        aside = lease.with_name(f"{lease.name}.{self.owner.replace(':', '-')}.{os.urandom(4).hex()}")
+        try:
+            os.rename(lease, aside)
+        except FileNotFoundError:
+            return False  # another node got there first
+        if aside.stat().st_mtime_ns != observed:
+            # The owner heartbeated in between: put the live lease back
+            try:
+                os.link(aside, lease)
+            except OSError:
+                pass
+            aside.unlink(missing_ok=True)
+            return False
+        stale = self._read(aside) or {}
+        aside.unlink(missing_ok=True)
+        print(_console(f"♻️ Reclaiming {stale.get('file_name', key[:12])} from {stale.get('owner', 'an unknown node')} "
+                       f"(no heartbeat for {self.lease_seconds:.0f}s)"))
+        return True
+    
+    def claim(self, key, file_name=""):
+        """Take the lease for key; False if the file is done or leased by a live node"""
+        if self.done(key):
+            self.waiting.discard(key)
+            self.stats['done_elsewhere'] += 1
+            return False
+        token = os.urandom(8).hex()
+        lease = self._lease(key)
+        for _ in range(2):
+            try:
+                self._create(key, token, file_name)
+            except FileExistsError:
+                if self._expired(key, lease) and self._steal(key, lease):
+                    self.stats['reclaimed'] += 1
+                    continue
+                self.waiting.add(key)
+                self.stats['busy'] += 1
+                return False
+            if self.done(key):
+                # Finished by its previous owner between our check and the create
+                lease.unlink(missing_ok=True)
+                self.waiting.discard(key)
+                return False
+            with self._lock:
+                self.held[key] = token
+                self.waiting.discard(key)
+                self.stats['claimed'] += 1
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._heartbeat, name="claims-heartbeat", daemon=True)
+                    self._thread.start()
+            return True
+        return False
+    
+    def _heartbeat(self):
+        while not self._stop.wait(self.heartbeat_interval):
+            with self._lock:
+                held = dict(self.held)
+            for key, token in held.items():
+                lease = self._lease(key)
+                current = self._read(lease)
+                try:
+                    if current is None and not lease.exists():
+                        self._create(key, token, "")  # mid-steal check by another node; it will back off
+                    elif (current or {}).get('token') == token:
+                        os.utime(lease)
+                    else:
+                        raise FileExistsError
+                except FileExistsError:
+                    with self._lock:
+                        if self.held.pop(key, None):
+                            self.stats['lost'] += 1
+                    print(_console(f"⚠️ Lost the lease on {key[:12]}; another node may upload it too"))
+                except OSError as e:
+                    print(_console(f"⚠️ Lease heartbeat failed for {key[:12]}: {e}"))
+    
+    def complete(self, key, video_id, file_name=""):
+        """Mark key uploaded for every node, then drop our lease"""
+        _safe_write_json(self._done(key), {'video_id': video_id, 'owner': self.owner, 'file_name': file_name,
+                                           'time': datetime.now().isoformat()})
+        self.release(key)
+    
+    def release(self, key):
+        """Give up our lease so another node can take the file at once"""
+        with self._lock:
+            token = self.held.pop(key, None)
+        lease = self._lease(key)
+        if token and (self._read(lease) or {}).get('token') == token:
+            lease.unlink(missing_ok=True)
+    
+    def close(self):
+        self._stop.set()
+        for key in list(self.held):
+            self.release(key)
+
+
+class QuotaBudget:
+    """YouTube Data API quota model for one Google Cloud project.
+
+    Units are taken from a daily bucket per call type and the bucket refills
+    at the Pacific-midnight reset. Usage is persisted so consecutive cron runs
+    on the same credentials share one budget.
+    """
+    
+    COSTS = {
+        'videos.insert': 1600,
+        'videos.list': 1,
+        'videos.update': 50,
+        'playlists.list': 1,
+        'playlists.insert': 50,
+        'playlistItems.insert': 50,
+    }
+    
+    def __init__(self, state_path=None, daily_limit=10000, costs=None):
+        self.state_path = Path(state_path) if state_path else None
+        self.daily_limit = daily_limit
+        self.costs = dict(self.COSTS, **(costs or {}))
+        self.used = 0
+        self.day = self._pacific_day()
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        
+        state = _safe_read_json(self.state_path) if self.state_path and self.state_path.exists() else None
+        if state and state.get('day') == self.day:
+            self.used = int(state.get('used', 0))
+    
+    @staticmethod
+    def _pacific_day():
+        return datetime.now(PACIFIC_TZ).date().isoformat()
+    
+    def next_reset(self):
+        """Return the next Pacific-midnight quota reset as a local datetime"""
+        now = datetime.now(PACIFIC_TZ)
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=PACIFIC_TZ)
+        return midnight.astimezone(LOCAL_TZ)
+    
+    def _roll_over(self):
+        day = self._pacific_day()
+        if day != self.day:
+            self.day = day
+            self.used = 0
+    
+    def _save(self):
+        if self.state_path:
+            _safe_write_json(self.state_path, {'day': self.day, 'used': self.used, 'daily_limit': self.daily_limit})
+    
+    def remaining(self):
+        with self._lock:
+            self._roll_over()
+            return max(0, self.daily_limit - self.used)
+    
+    def try_acquire(self, call, count=1):
+        """Take the units for `count` calls if they fit in today's budget"""
+        units = self.costs.get(call, 1) * count
+        with self._lock:
+            self._roll_over()
+            if self.used + units > self.daily_limit:
+                return False
+            self.used += units
+            self._save()
+            return True
+    
+    def acquire(self, call, wait=False, log_prefix=""):
+        """Take quota for a call, optionally sleeping until the daily reset when it is exhausted"""
+        while not self.try_acquire(call):
+            if not wait or self._cancelled.is_set():
+                return False
+            reset = self.next_reset()
+            print(_console(f"   {log_prefix}😴 YouTube quota exhausted, sleeping until reset at {reset.strftime('%Y-%m-%d %H:%M')}"))
+            delay = max(1.0, (reset - datetime.now(LOCAL_TZ)).total_seconds() + 60)
+            if self._cancelled.wait(delay):
+                return False
+        return True
+    
+    def mark_exhausted(self):
+        """The API reported quotaExceeded; trust it over our own accounting"""
+        with self._lock:
+            self._roll_over()
+            self.used = max(self.used, self.daily_limit)
+            self._save()
+    
+    def cancel(self):
+        """Wake up anything sleeping for a quota reset"""
+        self._cancelled.set()
+    
+    def plan(self, uploads, call='videos.insert'):
+        """Project how a batch fits into the daily quota.
+
+        Returns (uploads possible today, uploads per full day, projected completion datetime).
+        """
+        cost = self.costs.get(call, 1)
+        today = min(uploads, self.remaining() // cost)
+        per_day = self.daily_limit // cost
+        left = uploads - today
+        if left <= 0:
+            return today, per_day, datetime.now(LOCAL_TZ)
+        if per_day <= 0:
+            return today, per_day, None
+        extra_days = (left + per_day - 1) // per_day
+        return today, per_day, self.next_reset() + timedelta(days=extra_days - 1)
+
+
+class RetryPolicy:
+    """Retry, backoff and circuit breaker shared by every API call and upload worker.
+
+    Errors are classified as quota, rate limit, transient or fatal. Rate limits
+    and transient errors back off exponentially with jitter, or for as long as
+    the server's Retry-After asks. When transient failures pile up across the
+    whole batch the circuit opens and every worker waits out the outage,
+    without spending its own retry budget. Waits use an Event so a shutdown
+    signal interrupts them.
+    """
+    
+    QUOTA = 'quota'
+    RATE_LIMIT = 'rate_limit'
+    TRANSIENT = 'transient'
+    FATAL = 'fatal'
+    
+    QUOTA_REASONS = {'quotaExceeded', 'dailyLimitExceeded'}
+    RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded', 'uploadRateLimitExceeded'}
+    TRANSIENT_STATUSES = {408, 500, 502, 503, 504}
+    
+    def __init__(self, max_retries=8, base_delay=1.0, max_delay=120.0,
+                 breaker_threshold=5, breaker_cooldown=60.0, max_breaker_cooldown=900.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.max_breaker_cooldown = max_breaker_cooldown
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._cooldown = breaker_cooldown
+        self.stats = {'retries': 0, 'backoff_seconds': 0.0, 'breaker_trips': 0}
+    
+    @staticmethod
+    def _error_reason(exc):
+        try:
+            error = json.loads(exc.content.decode('utf-8') if isinstance(exc.content, bytes) else exc.content)['error']
+            return (error.get('errors') or [{}])[0].get('reason', '')
+        except Exception:
+            return ''
+    
+    @staticmethod
+    def _retry_after(exc):
+        """Seconds requested by a Retry-After header (delta-seconds or HTTP-date)"""
+        resp = getattr(exc, 'resp', None)
+        value = resp.get('retry-after') if hasattr(resp, 'get') else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+    
+    def classify(self, exc):
+        """Return (kind, retry_after_seconds) for an exception raised by an API call"""
+        if isinstance(exc, HttpError):
+            status = exc.resp.status
+            reason = self._error_reason(exc)
+            if reason in self.QUOTA_REASONS:
+                return self.QUOTA, None
+            if status == 429 or reason in self.RATE_LIMIT_REASONS:
+                return self.RATE_LIMIT, self._retry_after(exc)
+            if status in self.TRANSIENT_STATUSES:
+                return self.TRANSIENT, self._retry_after(exc)
+            return self.FATAL, None
+        if isinstance(exc, (ConnectionError, TimeoutError, socket.timeout, ssl.SSLError)):
+            return self.TRANSIENT, None
+        if type(exc).__module__.startswith('httplib2'):
+            return self.TRANSIENT, None
+        return self.FATAL, None
+    
+    def cancel(self):
+        """Interrupt every backoff and breaker wait, e.g. on shutdown"""
+        self._cancelled.set()
+    
+    def sleep(self, seconds):
+        """Interruptible sleep for other waits in an upload; False if cancelled"""
+        return not self._cancelled.wait(seconds)
+    
+    def wait_for_circuit(self, log_prefix=""):
+        """Block while the circuit is open. Returns False if cancelled"""
+        announced = False
+        while True:
+            with self._lock:
+                remaining = self._open_until - time.monotonic()
+            if remaining <= 0:
+                return not self._cancelled.is_set()
+            if not announced:
+                print(_console(f"   {log_prefix}🔌 YouTube API circuit open, pausing {remaining:.0f}s"))
+                announced = True
+            if self._cancelled.wait(remaining):
+                return False
+    
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            self._cooldown = self.breaker_cooldown
+    
+    def _record_failure(self, kind):
+        with self._lock:
+            if kind != self.TRANSIENT:
+                return
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.breaker_threshold and time.monotonic() >= self._open_until:
+                # Half-open after the cooldown: one more failure reopens for longer
+                self._open_until = time.monotonic() + self._cooldown
+                self._cooldown = min(self.max_breaker_cooldown, self._cooldown * 2)
+                self._consecutive_failures = self.breaker_threshold - 1
+                self.stats['breaker_trips'] += 1
+    
+    def handle_error(self, exc, attempt, log_prefix=""):
+        """Classify a failed attempt and back off if it is worth retrying.
+
+        Returns (retry, kind). `attempt` is the number of failures so far for
+        this operation; waits for an open circuit do not count against it.
+        """
+        kind, retry_after = self.classify(exc)
+        self._record_failure(kind)
+        if kind in (self.QUOTA, self.FATAL) or attempt > self.max_retries:
+            return False, kind
+        
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)) + random.uniform(0, 1))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        
+        label = "Rate limited" if kind == self.RATE_LIMIT else "Server/network error"
+        print(_console(f"   {log_prefix}⏳ {label}, retry {attempt}/{self.max_retries} in {delay:.1f}s"))
+        with self._lock:
+            self.stats['retries'] += 1
+            self.stats['backoff_seconds'] += delay
+        if self._cancelled.wait(delay):
+            return False, kind
+        return self.wait_for_circuit(log_prefix), kind
+    
+    def call(self, fn, log_prefix="", quota=None):
+        """Run one API call (e.g. lambda: request.execute()) under this policy"""
+        attempt = 0
+        while True:
+            if not self.wait_for_circuit(log_prefix):
+                raise InterruptedError("Shutdown requested")
+            try:
+                result = fn()
+                self.record_success()
+                return result
+            except Exception as e:
+                attempt += 1
+                retry, kind = self.handle_error(e, attempt, log_prefix)
+                if kind == self.QUOTA and quota:
+                    quota.mark_exhausted()
+                if not retry:
+                    raise
+
+
+UPLOAD_CHUNK_ALIGN = 256 * 1024  # resumable upload chunks must be multiples of 256 KiB
+
+
+class TokenBucket:
+    """Thread-safe byte budget refilled at `rate` bytes/sec; rate None means unlimited.
+
+    Tokens may go negative, so a caller taking a large chunk pays for it by
+    waiting instead of blocking smaller callers forever.
+    """
+    
+    def __init__(self, rate=None, burst_seconds=1.0):
+        self.rate = rate
+        self.burst_seconds = burst_seconds
+        self.tokens = float(rate or 0) * burst_seconds
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def set_rate(self, rate):
+        with self._lock:
+            self._refill()
+            self.rate = rate
+    
+    def _refill(self):
+        now = time.monotonic()
+        if self.rate:
+            self.tokens = min(self.rate * self.burst_seconds, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def reserve(self, nbytes):
+        """Take nbytes and return how long the caller must wait before sending them"""
+        with self._lock:
+            self._refill()
+            if not self.rate:
+                return 0.0
+            self.tokens -= nbytes
+            return max(0.0, -self.tokens / self.rate)
+
+
+class ChunkSizer:
+    """Resumable-upload chunk size tuned from measured throughput and error rate.
+
+    Shared by all workers. Each confirmed chunk updates a moving average of
+    per-connection throughput and the size aims for chunks of about
+    TARGET_SECONDS, so per-request overhead stays small on fast links.
+    The initial size is the floor while the link is clean, so adaptive
+    chunking never sends smaller chunks than the fixed default would.
+    A failed chunk is sent again in full, so every failure halves the size
+    and, while the per-chunk error-rate average is above FLAKY_ERROR_RATE,
+    chunks do not grow past the initial size however fast the link is.
+    Connection failures mid-chunk are the ones a smaller chunk avoids: their
+    rate per byte sent, averaged over about the last ERROR_HORIZON bytes,
+    caps the size (down to MIN_CHUNK) so a chunk fails at most MAX_FAILURE
+    of the time. Growth is limited to 4x per chunk, and sizes are 256 KiB
+    multiples between MIN_CHUNK and MAX_CHUNK. fixed=True keeps the initial size.
+    """
+    
+    MIN_CHUNK = UPLOAD_CHUNK_ALIGN
+    MAX_CHUNK = 64 * 1024 * 1024  # each in-flight chunk is held in memory, per worker
+    TARGET_SECONDS = 4.0
+    ALPHA = 0.3
+    FLAKY_ERROR_RATE = 0.05  # about six clean chunks after a failure before chunks grow again
+    MAX_FAILURE = 0.1
+    FORGET_ERRORS = 0.05  # a single drop is forgotten after about 3 * ERROR_HORIZON clean bytes
+    ERROR_HORIZON = 256 * 1024 * 1024
+    
+    def __init__(self, initial=8 * 1024 * 1024, fixed=False):
+        self.fixed = fixed
+        self.size = self._align(initial)
+        self.initial = self.size
+        self.throughput = None
+        self.error_rate = 0.0
+        self.errors = 0.0  # chunks lost to connection failures, decayed per byte sent
+        self.sent = 4.0 * self.size  # bytes sent, same decay; starts as a clean prior so one early error is no panic
+        self._lock = threading.Lock()
+        self.stats = {'chunks': 0, 'errors': 0, 'bytes': 0, 'min_size': self.size, 'max_size': self.size}
+    
+    @classmethod
+    def _align(cls, size):
+        size = int(size) // UPLOAD_CHUNK_ALIGN * UPLOAD_CHUNK_ALIGN
+        return max(cls.MIN_CHUNK, min(cls.MAX_CHUNK, size))
+    
+    def current(self):
+        with self._lock:
+            return self.size
+    
+    def _resize(self, size):
+        if self.fixed:
+            return
+        self.size = self._align(size)
+        self.stats['min_size'] = min(self.stats['min_size'], self.size)
+        self.stats['max_size'] = max(self.stats['max_size'], self.size)
+    
+    def _sent(self, nbytes, failed):
+        decay = math.exp(-nbytes / self.ERROR_HORIZON)
+        self.errors = self.errors * decay + failed
+        self.sent = self.sent * decay + nbytes
+    
+    def _error_cap(self):
+        """Largest size expected to fail at most MAX_FAILURE of the time at the observed drops per byte"""
+        if self.errors > self.FORGET_ERRORS:
+            # Any size fails more often than a smaller one, so a link that drops stays at or below the initial size
+            return min(self.initial, self.MAX_FAILURE * self.sent / self.errors)
+        return self.initial if self.error_rate > self.FLAKY_ERROR_RATE else self.MAX_CHUNK
+    
+    def record_chunk(self, nbytes, seconds):
+        with self._lock:
+            self.stats['chunks'] += 1
+            self.stats['bytes'] += nbytes
+            self.error_rate *= 1 - self.ALPHA
+            self._sent(nbytes, 0)
+            # A short tail chunk (or a small file) is mostly request overhead and would undersell the link
+            if seconds <= 0 or nbytes < self.size // 2:
+                return
+            rate = nbytes / seconds
+            self.throughput = rate if self.throughput is None else self.throughput + self.ALPHA * (rate - self.throughput)
+            target = max(self.initial, min(self.size * 4, self.throughput * self.TARGET_SECONDS))
+            self._resize(min(target, self._error_cap()))
+    
+    def record_error(self, nbytes=None, dropped=True):
+        """A chunk of nbytes (default: the current size) failed and goes out again.
+
+        dropped=False is for a chunk the server answered with an error: that
+        says the link is unreliable, but not that a smaller chunk would pass.
+        """
+        with self._lock:
+            self.stats['errors'] += 1
+            self.error_rate += self.ALPHA * (1 - self.error_rate)
+            if dropped:
+                self._sent(nbytes or self.size, 1)
+            self._resize(min(self.size // 2, self._error_cap()))
+    
+    def summary(self):
+        """Per-run record of the chunk sizes chosen and why"""
+        with self._lock:
+            attempts = self.stats['chunks'] + self.stats['errors']
+            return {
+                'mode': 'fixed' if self.fixed else 'adaptive',
+                'initial_size': self.initial,
+                'final_size': self.size,
+                'min_size': self.stats['min_size'],
+                'max_size': self.stats['max_size'],
+                'mean_size': self.stats['bytes'] // self.stats['chunks'] if self.stats['chunks'] else None,
+                'chunks': self.stats['chunks'],
+                'errors': self.stats['errors'],
+                'error_rate': round(self.stats['errors'] / attempts, 4) if attempts else 0.0,
+                'stream_throughput': round(self.throughput, 1) if self.throughput else None
+            }
+
+
+class BandwidthShaper:
+    """Upload bandwidth limits shared by every worker, plus measured throughput.
+
+    One global token bucket caps the combined rate of all uploads; its rate
+    follows time-of-day profiles (e.g. full speed overnight, throttled during
+    live shows) and falls back to max_rate. per_upload_rate additionally caps
+    each file. Chunks are shrunk to about a second of the current rate so a
+    throttled upload sends small bursts rather than 8 MB at line speed.
+    """
+    
+    def __init__(self, max_rate=None, per_upload_rate=None, profiles=()):
+        self.max_rate = max_rate
+        self.per_upload_rate = per_upload_rate
+        self.profiles = list(profiles)
+        self.bucket = TokenBucket(self.rate_now())
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self.stats = {'bytes': 0, 'send_seconds': 0.0, 'throttled_seconds': 0.0, 'first_send': None, 'last_send': None}
+    
+    @staticmethod
+    def parse_rate(text):
+        """'2M', '500K', '20Mbit', '0'/'unlimited' -> bytes/sec (None = unlimited); K/M/G are powers of 1024"""
+        value = str(text).strip().lower().replace('/s', '')
+        if value.endswith('bps'):
+            value = value[:-3] + 'bit'
+        if value in ('', '0', 'unlimited', 'none', 'off'):
+            return None
+        match = re.fullmatch(r'(\d+(?:\.\d+)?)\s*([kmg]?)(i?b|bit)?', value)
+        if not match:
+            raise ValueError(f"Invalid rate: {text!r} (use e.g. 2M, 500K or 20Mbit)")
+        number, prefix, unit = match.groups()
+        rate = float(number) * {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}[prefix]
+        if unit == 'bit':
+            rate /= 8
+        return rate or None
+    
+    @classmethod
+    def parse_profiles(cls, text):
+        """'18:00-23:30=1M,23:30-07:00=unlimited' -> [(start_minute, end_minute, rate)] in local time"""
+        profiles = []
+        for part in filter(None, (p.strip() for p in (text or '').split(','))):
+            match = re.fullmatch(r'(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})=(.+)', part)
+            if not match:
+                raise ValueError(f"Invalid bandwidth profile: {part!r} (use HH:MM-HH:MM=RATE)")
+            h1, m1, h2, m2, rate = match.groups()
+            start, end = int(h1) * 60 + int(m1), int(h2) * 60 + int(m2)
+            if start >= 24 * 60 or end > 24 * 60:
+                raise ValueError(f"Invalid time in bandwidth profile: {part!r}")
+            profiles.append((start, end, cls.parse_rate(rate)))
+        return profiles
+    
+    @staticmethod
+    def format_rate(rate):
+        return "unlimited" if not rate else f"{rate / 1048576:.2f} MiB/s"
+    
+    def rate_now(self, now=None):
+        """Global rate for the current local time: first matching profile, else max_rate"""
+        now = now or datetime.now(LOCAL_TZ)
+        minute = now.hour * 60 + now.minute
+        for start, end, rate in self.profiles:
+            inside = start <= minute < end if start < end else (minute >= start or minute < end)
+            if inside:
+                return rate
+        return self.max_rate
+    
+    def upload_bucket(self):
+        """Per-file bucket for one upload, or None without a per-upload cap"""
+        return TokenBucket(self.per_upload_rate) if self.per_upload_rate else None
+    
+    def chunk_limit(self, upload_bucket=None):
+        """Largest chunk (256 KiB aligned) that is about one second of the tightest active rate"""
+        rates = [rate for rate in (self.bucket.rate, upload_bucket.rate if upload_bucket else None) if rate]
+        if not rates:
+            return None
+        return max(UPLOAD_CHUNK_ALIGN, int(min(rates)) // UPLOAD_CHUNK_ALIGN * UPLOAD_CHUNK_ALIGN)
+    
+    def throttle(self, nbytes, upload_bucket=None):
+        """Wait until nbytes may be sent; False if cancelled while waiting"""
+        rate = self.rate_now()
+        if rate != self.bucket.rate:
+            self.bucket.set_rate(rate)
+        delay = self.bucket.reserve(nbytes)
+        if upload_bucket:
+            delay = max(delay, upload_bucket.reserve(nbytes))
+        if delay > 0:
+            with self._lock:
+                self.stats['throttled_seconds'] += delay
+            if self._cancel.wait(delay):
+                return False
+        return True
+    
+    def record(self, nbytes, seconds):
+        """Account bytes the server confirmed and the wall time spent sending them"""
+        now = time.monotonic()
+        with self._lock:
+            self.stats['bytes'] += nbytes
+            self.stats['send_seconds'] += seconds
+            if self.stats['first_send'] is None:
+                self.stats['first_send'] = now - seconds
+            self.stats['last_send'] = now
+    
+    def throughput(self):
+        """Aggregate bytes/sec across all workers, from first to last confirmed chunk"""
+        with self._lock:
+            if not self.stats['bytes'] or self.stats['first_send'] is None:
+                return None
+            elapsed = self.stats['last_send'] - self.stats['first_send']
+            return self.stats['bytes'] / elapsed if elapsed > 0 else None
+    
+    def cancel(self):
+        self._cancel.set()
+
+
+class DirectoryWatcher:
+    """Report new or changed files under an output directory.
+
+    Uses inotify on Linux (through libc, no extra dependency) and falls back
+    to periodic rescans elsewhere or when inotify is unavailable. wait()
+    returns the paths touched since the last call, plus a flag telling the
+    caller to rescan because events may have been missed.
+    """
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    _EVENT = struct.Struct('iIII')
+    
+    def __init__(self, directory, recursive=False, poll_interval=30.0):
+        self.directory = str(directory)
+        self.recursive = recursive
+        self.poll_interval = poll_interval
+        self.mode = 'polling'
+        self._fd = None
+        self._watches = {}
+        self._last_poll = time.monotonic()
+        
+        if sys.platform.startswith('linux'):
+            try:
+                self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+                if fd < 0:
+                    raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+                self._fd = fd
+                self._watch_tree(self.directory)
+                self.mode = 'inotify'
+            except (OSError, AttributeError) as e:
+                print(f"⚠️ inotify unavailable ({e}), falling back to polling every {poll_interval:.0f}s")
+                self.close()
+    
+    def _add_watch(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self._watches[wd] = path
+    
+    def _watch_tree(self, root):
+        self._add_watch(root)
+        if not self.recursive:
+            return
+        for current, dirs, _files in os.walk(root):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            for d in dirs:
+                self._add_watch(os.path.join(current, d))
+    
+    def wait(self, timeout):
+        """Wait up to `timeout` seconds. Returns (changed paths, rescan needed)"""
+        if self.mode != 'inotify':
+            time.sleep(timeout)
+            if time.monotonic() - self._last_poll >= self.poll_interval:
+                self._last_poll = time.monotonic()
+                return set(), True
+            return set(), False
+        
+        changed, rescan = set(), False
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return changed, rescan
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed, rescan
+        
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            wd, mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+            offset += length
+            
+            if mask & self.IN_Q_OVERFLOW:
+                rescan = True
+                continue
+            parent = self._watches.get(wd)
+            if not parent or not name:
+                continue
+            path = os.path.join(parent, name)
+            if mask & self.IN_ISDIR:
+                if self.recursive and mask & (self.IN_CREATE | self.IN_MOVED_TO) and not name.startswith('.'):
+                    try:
+                        self._watch_tree(path)
+                    except OSError as e:
+                        print(f"⚠️ Could not watch {path}: {e}")
+                    rescan = True  # files may have landed before the watch existed
+                continue
+            changed.add(path)
+        return changed, rescan
+    
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self.mode = 'polling'
+
+
+DISCLAIMER_TEMPLATE = """
+
+📋 What's This?
+An unsupervised AI hooked to the news, muttering into a microphone about what it sees,  with its own backing band.
+100% Satire, NOT REAL NEWS, No humans. No edits. Just Doomscroll.fm's autonomous broadcast, riding the Memescreamer engine.
+
+🤖 Signal Chain
+• 100% AI-generated, zero human curation
+• Fully automated Memescreamer production pipeline
+
+🌐 Links
+Website: https://doomscroll.fm
+Generator: https://memescreamer.com
+Contact: info@doomscroll.fm
+
+📄 License & Attribution
+License: CC BY-NC-SA 4.0
+Company: CreativeMayhem, Ltd.
+Generator: Memescreamer v0.5-dev
+
+#AI #News #Satire #Entertainment"""
+
+
+class MetadataRenderer:
+    """Turns SpiderCat scripts into YouTube titles, descriptions and hashtags.
+
+    Replacement tables and regexes are built once at import, and rendered
+    scripts are memoized by script hash, since reruns and dry-runs render the
+    same sidecars again and again.
+    """
+    
+    FALLBACK_TITLE = "AI Generated Content"
+    FALLBACK_DESCRIPTION = "Automated content from Doomscroll.FM"
+    CORE_HASHTAGS = ('#AI', '#News', '#Satire', '#Entertainment')
+    SKIP_HASHTAG_WORDS = frozenset({'news', 'update', 'latest', 'breaking', 'daily'})
+    
+    # Typographic dashes and quotes to their ASCII equivalents. Chained str.replace is
+    # ~70x faster than str.translate here (punctuation_* stages in render_benchmark.py).
+    _PUNCTUATION = (
+        ('\u2014', '-'), ('\u2013', '-'),
+        ('\u201c', '"'), ('\u201d', '"'),
+        ('\u2018', "'"), ('\u2019', "'"),
+    )
+    _HASHTAG_WORDS = re.compile(r'\b[A-Za-z]{4,}\b')
+    # YouTube titles keep only alphanumerics, spaces and basic punctuation
+    _TITLE_DISALLOWED = re.compile(r'[^A-Za-z0-9 .,!?\-:()\[\]]+')
+    
+    def __init__(self, cache_size=16384):
+        self.cache_size = cache_size
+        self._cache = {}
+    
+    def _clean(self, text):
+        if text.isascii():
+            return text
+        for old, new in self._PUNCTUATION:
+            text = text.replace(old, new)
+        return _nfc(text)
+    
+    def _render(self, gpt_script):
+        title_line, has_description, rest = gpt_script.strip().partition('\n')
+        
+        # Title from the first line without # symbols
+        title = self._clean(title_line.replace('#', '').strip())
+        if len(title) < 3:
+            title = self.FALLBACK_TITLE
+        
+        description = self.FALLBACK_DESCRIPTION
+        if has_description:
+            # Remove # symbols from the first three description lines, leave the rest untouched
+            parts = rest.split('\n', 3)
+            head = [line.replace('#', '') for line in parts[:3]]
+            description = self._clean('\n'.join(head + parts[3:]).strip())
+            if len(description) < 10:
+                description = self.FALLBACK_DESCRIPTION
+        
+        return title, description
+    
+    def render_script(self, gpt_script):
+        """Return (title, description) for a GPT script, memoized by script hash"""
+        if not gpt_script:
+            return self.FALLBACK_TITLE, self.FALLBACK_DESCRIPTION
+        
+        # str caches its own hash, so the script itself is the cheapest memo key
+        cached = self._cache.get(gpt_script)
+        if cached:
+            return cached
+        
+        try:
+            rendered = self._render(gpt_script)
+        except Exception as e:
+            print(f"⚠️ Error processing GPT script: {e}")
+            return self.FALLBACK_TITLE, self.FALLBACK_DESCRIPTION
+        
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[gpt_script] = rendered
+        return rendered
+    
+    def hashtags(self, title):
+        """Core hashtags plus up to three keywords (4+ letters) from the title"""
+        hashtags = list(self.CORE_HASHTAGS)
+        if title:
+            for word in self._HASHTAG_WORDS.findall(title)[:3]:  # Limit to 3 additional hashtags from title
+                if word.lower() not in self.SKIP_HASHTAG_WORDS:
+                    hashtags.append(f"#{word.capitalize()}")
+        return hashtags[:15]  # YouTube hashtag limit
+    
+    @classmethod
+    def sanitize_title(cls, title):
+        """Reduce a title to what the YouTube API reliably accepts, max 100 chars"""
+        title = ' '.join(cls._TITLE_DISALLOWED.sub('', str(title or '').strip()).split())
+        
+        # Ensure title is reasonable length (YouTube max is 100 chars)
+        if len(title) > 100:
+            title = title[:97] + "..."
+        
+        if len(title) < 3:
+            title = cls.FALLBACK_TITLE
+        return title
 
-# Use local timezone instead of forcing UTC
-import datetime as dt
-LOCAL_TZ = dt.datetime.now().astimezone().tzinfo
-UTC = timezone.utc
 
-def _nfc(s: str) -> str:
-    return unicodedata.normalize("NFC", s)
+class PooledHttp:
+    """httplib2-compatible transport over one requests session with a keep-alive connection pool.
 
-def _file_key(p: Path) -> str:
-    st = p.stat()
-    raw = f"{str(p.resolve())}|{st.st_size}"
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    googleapiclient only calls request(), so this adapter can stand in for
+    httplib2.Http. It sends through one google.auth AuthorizedSession shared
+    by every worker, so TCP/TLS connections are reused across chunks, files,
+    retries and workers instead of each worker's Http keeping its own.
+    """
+    
+    def __init__(self, credentials, pool_size=16, timeout=120):
+        import requests
+        from google.auth.transport.requests import AuthorizedSession
+        self.session = AuthorizedSession(credentials)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.timeout = timeout
+    
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None):
+        import httplib2
+        import requests
+        try:
+            # 308 is "resume incomplete" for resumable uploads, never a redirect to follow
+            response = self.session.request(method, uri, data=body, headers=headers, timeout=self.timeout,
+                                            allow_redirects=method in ('GET', 'HEAD'))
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError(str(e)) from e
+        except requests.exceptions.ConnectionError as e:
+            raise ConnectionError(str(e)) from e
+        
+        info = {key.lower(): value for key, value in response.headers.items()}
+        info['status'] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+    
+    def close(self):
+        self.session.close()
 
-def rfc3339(dt):
-    return dt.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def _safe_read_json(path: Path) -> dict | None:
-    try:
-        with open(path, 'r', encoding='utf-8', errors='strict') as f:
-            data = f.read()
-            if any(ord(c) < 32 and c not in '\t\n\r' for c in data):
-                raise ValueError(f"Control characters found in {path}")
-            return json.load(io.StringIO(data))
-    except Exception as e:
-        print(f"❌ Error reading JSON from {path}: {e}")
-        return None
+class TokenRefresher:
+    """Refreshes OAuth credentials in the background shortly before they expire.
 
-def _safe_write_json(path: Path, data: dict) -> bool:
-    try:
-        with open(path, 'w', encoding='utf-8', errors='replace') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    Workers then always find a valid token, so a long batch never stalls
+    mid-file while one of them runs creds.refresh(). Refreshed tokens are
+    written back to the token file for the next run.
+    """
+    
+    MARGIN = timedelta(minutes=5)
+    
+    def __init__(self, credentials, token_path=None, check_interval=60):
+        self.credentials = credentials
+        self.token_path = token_path
+        self.check_interval = check_interval
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        if getattr(self.credentials, 'refresh_token', None) and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="token-refresh", daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+    
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh_if_needed()
+            except Exception as e:
+                print(f"⚠️ Background token refresh failed: {e}")
+            self._stop.wait(self.check_interval)
+    
+    def refresh_if_needed(self):
+        expiry = getattr(self.credentials, 'expiry', None)  # naive UTC in google-auth
+        if not expiry or expiry - datetime.now(UTC).replace(tzinfo=None) > self.MARGIN:
+            return False
+        self.credentials.refresh(Request())
+        if self.token_path:
+            try:
+                with open(self.token_path, 'w', encoding='utf-8', errors='replace') as token:
+                    token.write(self.credentials.to_json())
+            except OSError as e:
+                print(f"⚠️ Warning: Could not save refreshed token: {e}")
         return True
-    except Exception as e:
-        print(f"❌ Error writing JSON to {path}: {e}")
+
+
+class WriterStalled(Exception):
+    """A render being streamed stopped growing without being marked complete"""
+
+
+class GrowingFile:
+    """Tail-following media source for a render that is still being written.
+
+    Implements the MediaUpload interface; load_youtube_api() mixes it into
+    GrowingFileUpload. Until complete() reports the writer done, size() is
+    None (Content-Range total '*') and getbytes() blocks until more than a
+    full chunk exists past the offset, so every chunk sent before the end is
+    whole and 256 KiB aligned. Afterwards the size is final and a short read
+    ends the upload. A writer that adds nothing for stall_timeout raises
+    WriterStalled; the resumable session stays saved for a later resume.
+    """
+    
+    def __init__(self, path, chunksize, complete, stall_timeout=600, poll_interval=1.0, sleep=None):
+        self.path = Path(path)
+        self._chunksize = chunksize
+        self.complete = complete
+        self.stall_timeout = stall_timeout
+        self.poll_interval = poll_interval
+        self.sleep = sleep or (lambda seconds: time.sleep(seconds) or True)
+        self.total = None
+        self._file = None
+        self._lock = threading.Lock()
+    
+    def chunksize(self):
+        return self._chunksize
+    
+    def mimetype(self):
+        return 'video/*'
+    
+    def resumable(self):
+        return True
+    
+    def has_stream(self):
         return False
+    
+    def stream(self):
+        return None
+    
+    def size(self):
+        """Final size once the writer has finished, None while the file is still growing"""
+        if self.total is None and self.complete():
+            self.total = self.path.stat().st_size
+        return self.total
+    
+    def getbytes(self, begin, length):
+        last_size, last_growth = -1, time.monotonic()
+        while self.size() is None:
+            current = self.path.stat().st_size
+            if current > begin + length:
+                break
+            if current != last_size:
+                last_size, last_growth = current, time.monotonic()
+            elif time.monotonic() - last_growth > self.stall_timeout:
+                raise WriterStalled(f"{self.path.name} stopped growing at {current:,} bytes for "
+                                    f"{self.stall_timeout:.0f}s without completing")
+            if not self.sleep(self.poll_interval):
+                raise WriterStalled("Upload interrupted")
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'rb')
+            self._file.seek(begin)
+            return self._file.read(length)
+    
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
 
-args = None  # Global for console helper
 
-def _console(s: str) -> str:
-    global args
-    return s.encode("ascii", "ignore").decode("ascii") if args and getattr(args, 'ascii_console', False) else s
+class RenderCompletion:
+    """Decides when a render that is being streamed has been fully written.
+
+    Done when the completion marker (video path + marker suffix) exists, or
+    when the JSON sidecar appears after streaming started. If the sidecar was
+    already there, a size unchanged for settle_seconds counts, the same rule
+    the daemon uses for finished files.
+    """
+    
+    def __init__(self, video_path, find_metadata, marker_suffix='.done', settle_seconds=15, stall_timeout=600):
+        self.video_path = Path(video_path)
+        self.marker = Path(str(video_path) + marker_suffix)
+        self.find_metadata = find_metadata
+        self.sidecar_at_start = find_metadata(video_path)
+        self.settle_seconds = settle_seconds
+        self.stall_timeout = stall_timeout
+        self._last = None  # (size, mtime, since)
+    
+    def __call__(self):
+        if self.marker.exists():
+            return True
+        if not self.sidecar_at_start:
+            return bool(self.find_metadata(self.video_path))
+        st = self.video_path.stat()
+        now = time.monotonic()
+        if not self._last or self._last[:2] != (st.st_size, st.st_mtime):
+            self._last = (st.st_size, st.st_mtime, now)
+            return False
+        return now - self._last[2] >= self.settle_seconds
 
 
 class YouTubeUploader:
     """Direct YouTube uploader"""
     
+    DISCOVERY_CACHE = "spidercat_discovery_youtube_v3.json"  # kept next to the OAuth token
+    READONLY_SCOPE = 'https://www.googleapis.com/auth/youtube.readonly'  # videos.list (--track)
+    MANAGE_SCOPE = 'https://www.googleapis.com/auth/youtube'  # playlists (--auto-playlist)
+    
+    @classmethod
+    def feature_scopes(cls, track=False, auto_playlist=False):
+        """Scopes beyond youtube.upload that the requested features need"""
+        return ([cls.READONLY_SCOPE] if track else []) + ([cls.MANAGE_SCOPE] if auto_playlist else [])
+    
     def __init__(self):
         self.scopes = ['https://www.googleapis.com/auth/youtube.upload']
         self.youtube_service = None
+        self.credentials = None
+        self.session_store = None
+        self.quota = None
+        self.quota_wait = False
+        self.retry_policy = RetryPolicy()
+        self.api_root = None  # e.g. http://127.0.0.1:8765/ for benchmarks/fake_youtube_api.py
+        self.channel = None  # name from the --channels pool; None for the single default channel
+        self.discovery_cache = None
+        self.bandwidth = BandwidthShaper()
+        self.chunk_sizer = ChunkSizer()
+        self.transport = 'httplib2'  # or 'pooled': one keep-alive PooledHttp shared by all workers
+        self.pool_size = 16
+        self.http_pool = None
+        self.token_refresher = None
+        self.playlists = None  # PlaylistAssigner that finished uploads are queued on (--auto-playlist)
         
+    def request_scopes(self, scopes, token_path):
+        """Ask for extra scopes when the token is first granted.
+
+        An existing token keeps the scopes it was granted; refreshing it with
+        more would be refused, so those features report the missing scope.
+        """
+        if scopes and not Path(token_path).exists():
+            self.scopes = self.scopes + [scope for scope in scopes if scope not in self.scopes]
+    
     def setup_youtube_service(self, credentials_path, token_path):
         """Setup YouTube API service"""
-        if not HAS_YOUTUBE_API:
+        if not load_youtube_api():
             return False, "YouTube API libraries not installed"
         
+        self.discovery_cache = Path(token_path).parent / self.DISCOVERY_CACHE
+        if self.api_root:
+            # Local stand-in servers do not check OAuth
+            try:
+                self.use_credentials(AnonymousCredentials())
+                return True, f"YouTube API service initialized against {self.api_root}"
+            except Exception as e:
+                return False, f"Failed to build YouTube service: {e}"
+        
         creds = None
         token_file = Path(token_path)
         
@@ -191,37 +2590,90 @@ class YouTubeUploader:
                 print(f"⚠️ Warning: Could not save token: {e}")
         
         try:
-            self.youtube_service = build('youtube', 'v3', credentials=creds)
+            self.use_credentials(creds)
+            self.token_refresher = TokenRefresher(creds, token_path).start()
             return True, "YouTube API service initialized"
         except Exception as e:
             return False, f"Failed to build YouTube service: {e}"
     
+    def _build_service(self, credentials):
+        document = youtube_discovery_document(self.discovery_cache)
+        if self.api_root:
+            # Point the discovery document at the alternate root; upload URLs derive from rootUrl
+            root = self.api_root.rstrip('/') + '/'
+            document = dict(document, rootUrl=root, baseUrl=root + document.get('servicePath', ''))
+        if self.transport == 'pooled':
+            if self.http_pool is None:
+                self.http_pool = PooledHttp(credentials, pool_size=self.pool_size)
+            return build_from_document(document, http=self.http_pool)
+        return build_from_document(document, credentials=credentials)
+    
+    def use_credentials(self, creds):
+        """Build the YouTube service for already-authorized credentials"""
+        self.youtube_service = self._build_service(creds)
+        self.credentials = creds
+    
+    def clone(self):
+        """Create a worker uploader sharing these credentials with its own service object.
+
+        httplib2 is not thread-safe, so every upload worker needs its own
+        service object instead of sharing self.youtube_service. With the
+        pooled transport the workers share one connection pool instead.
+        """
+        worker = YouTubeUploader()
+        worker.scopes = self.scopes
+        worker.credentials = self.credentials
+        worker.session_store = self.session_store
+        worker.quota = self.quota
+        worker.quota_wait = self.quota_wait
+        worker.retry_policy = self.retry_policy
+        worker.api_root = self.api_root
+        worker.channel = self.channel
+        worker.discovery_cache = self.discovery_cache
+        worker.bandwidth = self.bandwidth
+        worker.chunk_sizer = self.chunk_sizer
+        worker.transport = self.transport
+        worker.http_pool = self.http_pool
+        worker.playlists = self.playlists
+        worker.use_credentials(self.credentials)
+        return worker
+    
+    def probe_upload(self, request, media):
+        """Ask the server how much of a resumable upload it holds, without sending media.
+
+        Sends "Content-Range: bytes */<size>" over the request's authorized
+        http and moves request.resumable_progress to the committed offset.
+        Returns the video resource if that finished the upload, else None.
+        """
+        size = media.size()
+        headers = {'Content-Range': f"bytes */{'*' if size is None else size}", 'Content-Length': '0'}
+        resp, content = request.http.request(request.resumable_uri, 'PUT', headers=headers)
+        if resp.status in (200, 201):
+            return request.postproc(resp, content)
+        if resp.status != 308:
+            raise HttpError(resp, content, uri=request.resumable_uri)
+        # "Range: bytes=0-N" is the last committed byte; no Range means nothing arrived yet
+        committed = resp.get('range')
+        request.resumable_progress = int(committed.rsplit('-', 1)[1]) + 1 if committed else 0
+        if 'location' in resp:
+            request.resumable_uri = resp['location']
+        return None
+    
     def upload_video(self, video_path, title, description, privacy_status="private", 
-                    category_id="25", tags=None, scheduled_publish_time=None):
-        """Upload video to YouTube"""
+                    category_id="25", tags=None, scheduled_publish_time=None, log_prefix="",
+                    file_key=None, growing=None, stall_timeout=600):
+        """Upload video to YouTube.
+
+        growing: completion test (e.g. RenderCompletion) for a file that is
+        still being written; the upload then follows the file as it grows.
+        """
+        media = None
         try:
             if not self.youtube_service:
                 return None, "YouTube service not initialized"
             
             # Validate and clean title - YouTube is VERY picky
-            if not title or not title.strip():
-                title = "AI Generated Content"
-            
-            title = str(title).strip()
-            
-            # Remove any characters that might be problematic
-            # Keep only alphanumeric, spaces, and basic punctuation
-            import string
-            allowed_chars = string.ascii_letters + string.digits + ' .,!?-:()[]'
-            title = ''.join(c for c in title if c in allowed_chars)
-            title = ' '.join(title.split())  # Normalize whitespace
-            
-            # Ensure title is reasonable length (YouTube max is 100 chars)
-            if len(title) > 100:
-                title = title[:97] + "..."
-            
-            if not title or len(title) < 3:
-                title = "AI Generated Content"
+            title = MetadataRenderer.sanitize_title(title)
             
             body = {
                 'snippet': {
@@ -245,21 +2697,26 @@ class YouTubeUploader:
                         publish_time = scheduled_publish_time
                     
                     body['status']['publishAt'] = rfc3339(publish_time)
-                    print(f"   🔍 DEBUG - Scheduling for: {publish_time}")
-                    print(f"   🔍 DEBUG - RFC3339: {rfc3339(publish_time)}")
+                    print(f"   {log_prefix}🔍 DEBUG - Scheduling for: {publish_time}")
+                    print(f"   {log_prefix}🔍 DEBUG - RFC3339: {rfc3339(publish_time)}")
                     
                 except Exception as schedule_error:
                     print(f"⚠️ Schedule parsing error: {schedule_error}")
                     print("⚠️ Uploading without schedule")
             else:
-                print(f"   🔍 DEBUG - No scheduled_publish_time provided")
+                print(f"   {log_prefix}🔍 DEBUG - No scheduled_publish_time provided")
             
-            media = MediaFileUpload(
-                video_path,
-                chunksize=1024*1024*8,
-                resumable=True,
-                mimetype='video/*'
-            )
+            sizer = self.chunk_sizer
+            if growing:
+                media = GrowingFileUpload(video_path, sizer.current(), growing, stall_timeout=stall_timeout,
+                                          sleep=self.retry_policy.sleep)
+            else:
+                media = MediaFileUpload(
+                    video_path,
+                    chunksize=sizer.current(),
+                    resumable=True,
+                    mimetype='video/*'
+                )
             
             request = self.youtube_service.videos().insert(
                 part='snippet,status',
@@ -267,26 +2724,107 @@ class YouTubeUploader:
                 media_body=media
             )
             
+            sessions = self.session_store if file_key else None
+            resuming = False
+            if sessions:
+                session = sessions.get(file_key, None if growing else media.size())
+                # Session URIs belong to the channel whose token opened them
+                if session and session.get('channel') != self.channel:
+                    session = None
+                if session:
+                    # Ask the server for the committed offset before sending data
+                    request.resumable_uri = session['uri']
+                    resuming = True
+                    print(f"   {log_prefix}♻️ Resuming upload session from byte {session.get('offset', 0):,}")
+            
+            # A resumed session was already paid for when it was created
+            if self.quota and not resuming:
+                if not self.quota.acquire('videos.insert', wait=self.quota_wait, log_prefix=log_prefix):
+                    return None, "Daily YouTube quota exhausted"
+            
+            policy = self.retry_policy
+            shaper = self.bandwidth
+            upload_bucket = shaper.upload_bucket()
             response = None
             retry = 0
+            probe = resuming
             
             while response is None:
+                if not policy.wait_for_circuit(log_prefix):
+                    return None, "Upload interrupted"
+                pending = None
                 try:
+                    chunk_size = sizer.current()
+                    limit = shaper.chunk_limit(upload_bucket)
+                    media._chunksize = min(chunk_size, limit) if limit else chunk_size
+                    sent_from = request.resumable_progress
+                    total = media.size()
+                    if growing and total is not None and sent_from >= total:
+                        # The last chunk went out before the end was known; "bytes */total" finalizes
+                        probe = True
+                    if probe:
+                        response = self.probe_upload(request, media)
+                        probe = resuming = False
+                        retry = 0
+                        policy.record_success()
+                        if response is None and request.resumable_progress != sent_from:
+                            print(f"   {log_prefix}♻️ Server holds {request.resumable_progress:,} bytes, continuing from there")
+                        continue
+                    pending = min(media._chunksize, total - sent_from) if total is not None else media._chunksize
+                    if not shaper.throttle(pending, upload_bucket):
+                        return None, "Upload interrupted"
+                    started = time.monotonic()
                     status, response = request.next_chunk()
-                    if status:
-                        print(f"   📊 Upload progress: {int(status.progress() * 100)}%")
-                except HttpError as e:
-                    if e.resp.status in [403, 500, 502, 503, 504] and retry < 5:
-                        retry += 1
-                        backoff = min(120, (2 ** retry) + random.uniform(0, 1))
-                        print(f"   ⏳ Rate limit/server error, retry {retry}/5 in {backoff:.1f}s")
-                        time.sleep(backoff)
+                    confirmed = (media.size() if response is not None else request.resumable_progress) - sent_from
+                    if confirmed > 0:
+                        elapsed = time.monotonic() - started
+                        shaper.record(confirmed, elapsed)
+                        sizer.record_chunk(confirmed, elapsed)
+                    resuming = False
+                    retry = 0
+                    policy.record_success()
+                    if sessions and response is None:
+                        sessions.save(file_key, request.resumable_uri, request.resumable_progress, video_path,
+                                      channel=self.channel, growing=bool(growing))
+                    if status and status.total_size is None:
+                        print(f"   {log_prefix}📊 Upload progress: {status.resumable_progress / 1048576:,.1f} MiB (render still growing)")
+                    elif status:
+                        print(f"   {log_prefix}📊 Upload progress: {int(status.progress() * 100)}%")
+                except WriterStalled as e:
+                    # The session and its committed offset stay saved; the upload resumes when the file grows
+                    return None, f"Render not finished: {e}"
+                except Exception as e:
+                    if resuming and isinstance(e, HttpError) and e.resp.status in [400, 404, 410]:
+                        # The server no longer knows the session, start a fresh upload
+                        print(f"   {log_prefix}⌛ Upload session expired (HTTP {e.resp.status}), restarting from byte 0")
+                        sessions.discard(file_key)
+                        request.resumable_uri = None
+                        request.resumable_progress = 0
+                        probe = resuming = False
+                        # The restart opens a new session, which is a new videos.insert
+                        if self.quota and not self.quota.acquire('videos.insert', wait=self.quota_wait,
+                                                                 log_prefix=log_prefix):
+                            return None, "Daily YouTube quota exhausted"
                         continue
-                    else:
+                    retry += 1
+                    should_retry, kind = policy.handle_error(e, retry, log_prefix)
+                    if pending is not None and kind in (RetryPolicy.TRANSIENT, RetryPolicy.RATE_LIMIT):
+                        # The rejected chunk is sent again in full, whichever failure rejected it
+                        sizer.record_error(pending, dropped=not isinstance(e, HttpError))
+                    if kind == RetryPolicy.QUOTA:
+                        # Retrying cannot help until the daily reset
+                        if self.quota:
+                            self.quota.mark_exhausted()
+                        return None, "Daily YouTube quota exhausted (quotaExceeded)"
+                    if should_retry:
+                        continue
+                    if isinstance(e, HttpError):
                         return None, f"HTTP error {e.resp.status}: {e}"
-                except Exception as e:
                     return None, f"Upload error: {e}"
             
+            if sessions:
+                sessions.discard(file_key)
+            
             if response and 'id' in response:
                 return response['id'], "Upload successful"
             else:
@@ -294,6 +2832,475 @@ class YouTubeUploader:
                 
         except Exception as e:
             return None, f"Upload failed: {e}"
+        finally:
+            if growing and media is not None:
+                media.close()
+    
+    def update_metadata(self, video_id, title, description, category_id="25", tags=None, log_prefix=""):
+        """Replace title, description and tags of an uploaded video (videos.update, 50 quota units).
+
+        Needs a token with the youtube scope; youtube.upload alone is refused.
+        """
+        snippet = {
+            'title': MetadataRenderer.sanitize_title(title),
+            'description': description or "Automated content",
+            'categoryId': str(category_id)
+        }
+        if tags:
+            snippet['tags'] = tags
+        if self.quota and not self.quota.acquire('videos.update', wait=self.quota_wait, log_prefix=log_prefix):
+            return False, "Daily YouTube quota exhausted"
+        request = self.youtube_service.videos().update(part='snippet', body={'id': video_id, 'snippet': snippet})
+        try:
+            self.retry_policy.call(request.execute, log_prefix, quota=self.quota)
+            return True, "Metadata updated"
+        except InterruptedError:
+            return False, "Metadata update interrupted"
+        except Exception as e:
+            kind = self.retry_policy.classify(e)[0]
+            if kind == RetryPolicy.QUOTA:
+                return False, "Daily YouTube quota exhausted (quotaExceeded)"
+            if kind == RetryPolicy.FATAL and isinstance(e, HttpError) and e.resp.status in (401, 403):
+                return False, f"Not allowed to edit videos with this token (needs the youtube scope): {e}"
+            return False, f"Metadata update failed: {e}"
+
+
+class ProcessingTracker:
+    """Follows YouTube-side processing of uploaded videos with batched videos.list calls.
+
+    One videos.list call costs 1 quota unit for up to 50 ids, so every poll
+    sends as few calls as the due videos need and fills them up with ids
+    that are not due yet. Each video is checked again after the time
+    YouTube estimates it has left, or with a doubling interval when there is
+    no estimate. Results are stored in the history entry under 'processing',
+    and the entry leaves the pending set once YouTube has processed,
+    rejected or failed it. Only uploads of the uploader's own channel are
+    checked, since private videos can only be read with their owner's token.
+    """
+    
+    BATCH = 50
+    FIRST_CHECK = 60
+    MAX_INTERVAL = 3600
+    RESCAN_INTERVAL = 30  # how often to look for newly recorded uploads
+    FAILED_UPLOAD = {'failed', 'rejected', 'deleted'}
+    FAILED_PROCESSING = {'failed', 'terminated'}
+    MISSING_LIMIT = 3  # consecutive polls a video may be absent from videos.list before it counts as gone
+    
+    def __init__(self, uploader, history, track_days=7):
+        self.uploader = uploader
+        self.history = history
+        self.track_days = track_days
+        self.next_due = 0.0
+        self.disabled = None
+        self.stats = {'calls': 0, 'checks': 0, 'processed': 0, 'failed': 0}
+    
+    def _next_check(self, entry):
+        processing = entry.get('processing') or {}
+        if processing.get('next_check'):
+            return datetime.fromisoformat(processing['next_check'])
+        try:
+            return datetime.fromisoformat(entry['upload_time']) + timedelta(seconds=self.FIRST_CHECK)
+        except (KeyError, TypeError, ValueError):
+            return datetime.now()
+    
+    def candidates(self, since):
+        channel = self.uploader.channel
+        return [(key, entry) for key, entry in self.history.tracking_candidates(since)
+                if entry.get('channel') == channel]
+    
+    def due(self):
+        return not self.disabled and time.monotonic() >= self.next_due
+    
+    def poll(self, log_prefix=""):
+        """Check every due video (and free riders) once; returns the number still pending"""
+        now = datetime.now()
+        candidates = sorted(self.candidates(now - timedelta(days=self.track_days)),
+                            key=lambda item: self._next_check(item[1]))
+        due = sum(1 for _, entry in candidates if self._next_check(entry) <= now)
+        calls = -(-due // self.BATCH)
+        batches = [candidates[i:i + self.BATCH] for i in range(0, calls * self.BATCH, self.BATCH)]
+        
+        quota, policy = self.uploader.quota, self.uploader.retry_policy
+        for batch in batches:
+            if quota and not quota.acquire('videos.list', wait=False, log_prefix=log_prefix):
+                break
+            ids = [entry['video_id'] for _, entry in batch]
+            request = self.uploader.youtube_service.videos().list(
+                part='status,processingDetails', id=','.join(ids), maxResults=self.BATCH)
+            try:
+                response = policy.call(request.execute, log_prefix, quota=quota)
+            except InterruptedError:
+                break
+            except Exception as e:
+                kind = policy.classify(e)[0]
+                if kind == RetryPolicy.QUOTA:
+                    print(_console(f"   {log_prefix}😴 YouTube quota exhausted, processing checks wait for the reset"))
+                    break
+                if kind == RetryPolicy.FATAL and isinstance(e, HttpError) and e.resp.status in (401, 403):
+                    self.disabled = (f"this token cannot read videos (needs youtube.readonly); delete the token "
+                                     f"file and run with --track to grant it: {e}")
+                    print(_console(f"   {log_prefix}⚠️ Processing tracking off: {self.disabled}"))
+                    return len(candidates)
+                # Retries are spent for this batch; the others may still get through
+                print(_console(f"   {log_prefix}⚠️ Processing status check failed: {e}"))
+                continue
+            self.stats['calls'] += 1
+            items = {item['id']: item for item in response.get('items', [])}
+            for key, entry in batch:
+                self._update(key, entry, items.get(entry['video_id']), now, log_prefix)
+        
+        remaining = self.candidates(now - timedelta(days=self.track_days))
+        soonest = min((self._next_check(entry) for _, entry in remaining), default=None)
+        wait = (soonest - datetime.now()).total_seconds() if soonest else self.RESCAN_INTERVAL
+        self.next_due = time.monotonic() + min(max(wait, 1.0), self.RESCAN_INTERVAL)
+        return len(remaining)
+    
+    def _update(self, key, entry, item, now, log_prefix=""):
+        previous = entry.get('processing') or {}
+        checks = previous.get('checks', 0) + 1
+        self.stats['checks'] += 1
+        processing = {'checks': checks, 'checked': now.isoformat(timespec='seconds')}
+        if item is None:
+            missing = previous.get('missing', 0) + 1
+            processing.update(missing=missing, upload_status='missing')
+            state = 'failed' if missing >= self.MISSING_LIMIT else 'pending'
+            time_left = None
+        else:
+            status = item.get('status', {})
+            details = item.get('processingDetails', {})
+            processing.update(upload_status=status.get('uploadStatus'), privacy_status=status.get('privacyStatus'),
+                              processing_status=details.get('processingStatus'))
+            for field, value in (('failure_reason', status.get('failureReason')),
+                                 ('rejection_reason', status.get('rejectionReason')),
+                                 ('processing_failure_reason', details.get('processingFailureReason'))):
+                if value:
+                    processing[field] = value
+            time_left = (details.get('processingProgress') or {}).get('timeLeftMs')
+            if (status.get('uploadStatus') in self.FAILED_UPLOAD
+                    or details.get('processingStatus') in self.FAILED_PROCESSING):
+                state = 'failed'
+            elif status.get('uploadStatus') == 'processed':
+                state = 'done'
+            else:
+                state = 'pending'
+        
+        processing['state'] = state
+        if state == 'pending':
+            interval = int(time_left) / 1000 if time_left else self.FIRST_CHECK * 2 ** (checks - 1)
+            interval = min(max(interval, self.FIRST_CHECK), self.MAX_INTERVAL)
+            processing['next_check'] = (now + timedelta(seconds=interval)).isoformat(timespec='seconds')
+        entry = dict(entry, processing=processing)
+        self.history.record(key, entry)
+        
+        name = entry.get('title') or entry.get('file_name', key[:12])
+        if state == 'done':
+            self.stats['processed'] += 1
+            print(_console(f"   {log_prefix}✅ Processed on YouTube: {name} ({entry['video_id']})"))
+        elif state == 'failed':
+            self.stats['failed'] += 1
+            reason = (processing.get('rejection_reason') or processing.get('failure_reason')
+                      or processing.get('processing_failure_reason') or processing.get('upload_status'))
+            print(_console(f"   {log_prefix}❌ YouTube processing failed: {name} ({entry['video_id']}): {reason}"))
+    
+    def wait(self, keys=None, timeout=3600, sleep=None):
+        """Poll until the given history keys (default: everything pending) have settled or timeout passes"""
+        sleep = sleep or self.uploader.retry_policy.sleep
+        deadline = time.monotonic() + timeout
+        while not self.disabled:
+            if self.due():
+                pending = self.poll()
+                if keys is not None:
+                    pending = sum(1 for key, _ in self.candidates(
+                        datetime.now() - timedelta(days=self.track_days)) if key in keys)
+                if not pending:
+                    return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if not sleep(min(max(self.next_due - time.monotonic(), 0.1), remaining)):
+                return False
+        return False
+
+
+class PlaylistAssigner:
+    """Adds uploads to daily playlists ("<prefix> YYYY-MM-DD") with the fewest API calls.
+
+    Playlist ids are cached in a JSON file next to the OAuth token, so a
+    day's playlist is looked up (playlists.list, 1 unit per 50 playlists)
+    at most once per run and created (playlists.insert, 50 units) at most
+    once. Videos are queued as their uploads are recorded and added after
+    the batch with playlistItems.insert (50 units each), grouped by
+    playlist and in release order. The queue is saved with the cache, so
+    additions that ran out of quota or failed are sent by the next run.
+    """
+    
+    SCOPE_HINT = ("this token cannot manage playlists (needs the youtube scope); "
+                  "delete the token file and run with --auto-playlist to grant it")
+    
+    def __init__(self, uploader, cache_path, prefix="Doomscroll.FM", description="", privacy_status="public"):
+        self.uploader = uploader
+        self.path = Path(cache_path)
+        self.prefix = prefix
+        self.description = description
+        self.privacy_status = privacy_status
+        self.disabled = None
+        self._listed = False
+        self._lock = threading.Lock()
+        self.stats = {'added': 0, 'created': 0, 'found': 0, 'list_calls': 0, 'deferred': 0}
+        state = _safe_read_json(self.path) if self.path.exists() else None
+        self.playlists = (state or {}).get('playlists', {})  # title -> {'id', 'created' or 'found'}
+        self.pending = (state or {}).get('pending', [])      # queued playlistItems.insert calls
+    
+    def _save(self):
+        _safe_write_json(self.path, {'playlists': self.playlists, 'pending': self.pending})
+    
+    def title_for(self, release_time=None):
+        """Playlist of the day a video is released, or of today for immediate releases"""
+        when = release_time.astimezone(LOCAL_TZ) if release_time else datetime.now(LOCAL_TZ)
+        return f"{self.prefix} {when.strftime('%Y-%m-%d')}"
+    
+    def queue(self, key, video_id, release_time=None):
+        with self._lock:
+            if any(item['video_id'] == video_id for item in self.pending):
+                return
+            self.pending.append({'key': key, 'video_id': video_id, 'playlist': self.title_for(release_time),
+                                 'release': release_time.isoformat() if release_time else None,
+                                 'queued': datetime.now().isoformat()})
+            self._save()
+    
+    def _execute(self, call, request, log_prefix=""):
+        """Charge the call to the quota and run it under the retry policy; None if the quota is spent"""
+        quota = self.uploader.quota
+        if quota and not quota.acquire(call, wait=False, log_prefix=log_prefix):
+            return None
+        return self.uploader.retry_policy.call(request.execute, log_prefix, quota=quota)
+    
+    def _list_existing(self, log_prefix=""):
+        """Cache the ids of this channel's playlists that carry our prefix (one call per 50 playlists)"""
+        self._listed = True
+        page_token = None
+        while True:
+            response = self._execute('playlists.list', self.uploader.youtube_service.playlists().list(
+                part='snippet', mine=True, maxResults=50, pageToken=page_token), log_prefix)
+            if response is None:
+                return
+            self.stats['list_calls'] += 1
+            for item in response.get('items', []):
+                title = item.get('snippet', {}).get('title', '')
+                if title.startswith(self.prefix) and title not in self.playlists:
+                    self.playlists[title] = {'id': item['id'], 'found': datetime.now().isoformat()}
+                    self.stats['found'] += 1
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+        self._save()
+    
+    def playlist_id(self, title, log_prefix=""):
+        """Id of the playlist called `title`, looking it up or creating it when it is not cached"""
+        if title not in self.playlists and not self._listed:
+            self._list_existing(log_prefix)
+        if title in self.playlists:
+            return self.playlists[title]['id']
+        
+        response = self._execute('playlists.insert', self.uploader.youtube_service.playlists().insert(
+            part='snippet,status',
+            body={'snippet': {'title': title, 'description': self.description},
+                  'status': {'privacyStatus': self.privacy_status}}), log_prefix)
+        if response is None:
+            return None
+        self.playlists[title] = {'id': response['id'], 'created': datetime.now().isoformat()}
+        self.stats['created'] += 1
+        self._save()
+        print(_console(f"   {log_prefix}📂 Created playlist: {title}"))
+        return response['id']
+    
+    def _add(self, playlist_id, video_id, log_prefix=""):
+        return self._execute('playlistItems.insert', self.uploader.youtube_service.playlistItems().insert(
+            part='snippet',
+            body={'snippet': {'playlistId': playlist_id,
+                              'resourceId': {'kind': 'youtube#video', 'videoId': video_id}}}), log_prefix)
+    
+    def flush(self, history=None, log_prefix=""):
+        """Send every queued addition the quota allows; returns the number added"""
+        with self._lock:
+            queued = sorted(self.pending, key=lambda item: (item['playlist'], item.get('release') or item['queued']))
+        if not queued or self.disabled:
+            return 0
+        
+        added = set()
+        stopped = False
+        for item in queued:
+            title = item['playlist']
+            try:
+                playlist_id = self.playlist_id(title, log_prefix)
+                if playlist_id is None:
+                    stopped = True
+                    break
+                try:
+                    response = self._add(playlist_id, item['video_id'], log_prefix)
+                except HttpError as e:
+                    if e.resp.status != 404 or 'playlist' not in str(e).lower():
+                        raise
+                    # Deleted on YouTube since it was cached: create it again once
+                    self.playlists.pop(title, None)
+                    playlist_id = self.playlist_id(title, log_prefix)
+                    response = self._add(playlist_id, item['video_id'], log_prefix) if playlist_id else None
+            except Exception as e:
+                kind = self.uploader.retry_policy.classify(e)[0]
+                if kind == RetryPolicy.QUOTA:
+                    stopped = True
+                    break
+                if isinstance(e, HttpError) and e.resp.status in (401, 403):
+                    self.disabled = f"{self.SCOPE_HINT}: {e}"
+                    print(_console(f"   {log_prefix}⚠️ Playlist assignment off: {self.disabled}"))
+                    break
+                print(_console(f"   {log_prefix}⚠️ Could not add {item['video_id']} to {title}: {e}"))
+                continue
+            if response is None:
+                stopped = True
+                break
+            added.add(item['video_id'])
+            self.stats['added'] += 1
+            if history is not None and item.get('key'):
+                entry = history.get(item['key'])
+                if entry and entry.get('video_id') == item['video_id']:
+                    history.record(item['key'], dict(entry, playlist=title, playlist_id=playlist_id))
+        
+        with self._lock:
+            self.pending = [item for item in self.pending if item['video_id'] not in added]
+            self.stats['deferred'] = len(self.pending)
+            self._save()
+        if stopped and self.pending:
+            print(_console(f"   {log_prefix}⏳ YouTube quota spent; {len(self.pending)} playlist addition(s) "
+                           f"queued for the next run"))
+        return len(added)
+
+
+class ChannelShard:
+    """One channel of a credentials pool with its own token, uploader, quota bucket and workers"""
+    
+    def __init__(self, name, credentials_path, token_path, workers=1, quota_limit=None, match=()):
+        self.name = name
+        self.credentials_path = credentials_path
+        self.token_path = token_path
+        self.workers = max(1, int(workers))
+        self.quota_limit = quota_limit
+        self.match = {str(value) for value in match}
+        self.uploader = YouTubeUploader()
+        self.uploader.channel = name
+        self.quota = None
+        self.authenticated = False
+
+
+class ChannelPool:
+    """Routes uploads across several channels/OAuth tokens configured in a JSON file (--channels).
+
+    {
+      "route_field": "channel",
+      "channels": [
+        {"name": "spidercat", "credentials": "credentials.json", "token": "token_spidercat.json",
+         "workers": 2, "quota_limit": 10000, "match": ["spidercat", "news"]},
+        {"name": "overflow", "token": "token_overflow.json"}
+      ]
+    }
+
+    A file whose sidecar has route_field (a dotted path) goes to the channel with
+    that name or listing the value in "match"; other files are dealt round-robin
+    to channels that still have quota today. A file with a saved upload session
+    stays on the channel that opened it. Relative paths are resolved against the
+    config file's directory.
+    """
+    
+    def __init__(self, shards, route_field=None):
+        self.shards = shards
+        self.route_field = route_field
+        self.by_name = {shard.name: shard for shard in shards}
+    
+    @classmethod
+    def load(cls, config_path, default_credentials, scopes=()):
+        """Read the pool config; `scopes` are extra scopes each shard asks for when its token is new"""
+        config_path = Path(config_path)
+        config = _safe_read_json(config_path)
+        if not config or not config.get('channels'):
+            raise ValueError(f"No channels configured in {config_path}")
+        
+        base = config_path.parent
+        shards = []
+        for i, channel in enumerate(config['channels']):
+            name = str(channel.get('name') or f"channel{i + 1}")
+            if not channel.get('token'):
+                raise ValueError(f"Channel '{name}' has no token file")
+            if any(shard.name == name for shard in shards):
+                raise ValueError(f"Duplicate channel name '{name}'")
+            credentials = channel.get('credentials') or default_credentials
+            match = channel.get('match') or ()
+            shards.append(ChannelShard(
+                name,
+                str(base / credentials),
+                str(base / channel['token']),
+                workers=channel.get('workers', 1),
+                quota_limit=channel.get('quota_limit'),
+                match=[match] if isinstance(match, str) else match
+            ))
+            shards[-1].uploader.request_scopes(scopes, shards[-1].token_path)
+        return cls(shards, config.get('route_field'))
+    
+    def route_value(self, metadata):
+        """Sidecar value named by route_field, or None"""
+        if not self.route_field or not isinstance(metadata, dict):
+            return None
+        value = metadata
+        for part in self.route_field.split('.'):
+            if not isinstance(value, dict) or part not in value:
+                return None
+            value = value[part]
+        return None if value in (None, "") else str(value)
+    
+    def shard_for(self, value):
+        if value in self.by_name:
+            return self.by_name[value]
+        for shard in self.shards:
+            if value in shard.match:
+                return shard
+        return None
+    
+    def assign(self, pending_files, pinned, capacity):
+        """Map each pending file to a shard.
+
+        pinned: {file_key: channel name or sidecar route value} decided up front;
+        capacity: {shard name: uploads left today}. Unpinned files go round-robin
+        to shards with room, or plain round-robin once every shard is full.
+        Unknown route values are returned separately rather than guessed.
+        """
+        assignment = {}
+        unroutable = []
+        load = {shard.name: 0 for shard in self.shards}
+        for entry, file_key, _ in pending_files:
+            value = pinned.get(file_key)
+            if value is None:
+                continue
+            shard = self.shard_for(value)
+            if shard is None:
+                unroutable.append((entry, value))
+                continue
+            assignment[file_key] = shard
+            load[shard.name] += 1
+        
+        turn = 0
+        count = len(self.shards)
+        for entry, file_key, _ in pending_files:
+            if file_key in assignment or pinned.get(file_key) is not None:
+                continue
+            for step in range(count):
+                shard = self.shards[(turn + step) % count]
+                if load[shard.name] < capacity[shard.name]:
+                    break
+            else:
+                shard = self.shards[turn % count]
+            turn = self.shards.index(shard) + 1
+            assignment[file_key] = shard
+            load[shard.name] += 1
+        return assignment, unroutable
 
 
 class SpiderCatYouTubeUploaderCLI:
@@ -302,12 +3309,25 @@ class SpiderCatYouTubeUploaderCLI:
     def __init__(self):
         self.uploader = YouTubeUploader()
         self.uploaded_log = "spidercat_uploaded_videos.json"
+        self.sessions_log = "spidercat_upload_sessions.json"
+        self.fingerprint_log = "spidercat_fingerprints.json"
+        self.quota_log = "spidercat_quota.json"
+        self.manifest_log = "spidercat_metadata_manifest.json"
+        self.probe_log = "spidercat_media_probe.json"
+        self.runs_log = "spidercat_upload_runs.jsonl"
+        self.playlist_log = "spidercat_playlists.json"
+        self.quarantine_dir = ".spidercat_quarantine"  # hidden, so recursive scans skip it
+        self.faststart_dir = ".spidercat_faststart"
+        self.remuxer = None
+        self.claims_dir = ".spidercat_claims"
+        self.claims = None  # WorkClaims when several uploader nodes share the directory
         self.stats = {
             'found': 0,
             'already_uploaded': 0,
             'uploaded': 0,
             'failed': 0,
             'skipped': 0,
+            'rejected': 0,
             'with_metadata': 0
         }
         self.stop_daemon = False
@@ -315,30 +3335,13 @@ class SpiderCatYouTubeUploaderCLI:
         self.token_path = "../youtube_config/token.json"
         self._auth_initialized = False
         self._metadata_cache = {}
+        self._history_lock = threading.Lock()
+        self.renderer = MetadataRenderer()
+        self.channel_pool = None
 
     def get_disclaimer_template(self):
         """Get the standard disclaimer template that must be appended to all descriptions"""
-        return """
-
-📋 What's This?
-An unsupervised AI hooked to the news, muttering into a microphone about what it sees,  with its own backing band.
-100% Satire, NOT REAL NEWS, No humans. No edits. Just Doomscroll.fm's autonomous broadcast, riding the Memescreamer engine.
-
-🤖 Signal Chain
-• 100% AI-generated, zero human curation
-• Fully automated Memescreamer production pipeline
-
-🌐 Links
-Website: https://doomscroll.fm
-Generator: https://memescreamer.com
-Contact: info@doomscroll.fm
-
-📄 License & Attribution
-License: CC BY-NC-SA 4.0
-Company: CreativeMayhem, Ltd.
-Generator: Memescreamer v0.5-dev
-
-#AI #News #Satire #Entertainment"""
+        return DISCLAIMER_TEMPLATE
 
     def process_gpt_script(self, gpt_script):
         """
@@ -347,83 +3350,11 @@ Generator: Memescreamer v0.5-dev
         - Lines 2+: Description
         - Remove # symbols from lines 1-3
         """
-        if not gpt_script:
-            return "AI Generated Content", "Automated content from Doomscroll.FM"
-            
-        try:
-            # Split into lines
-            script_lines = gpt_script.strip().split('\n')
-            
-            if not script_lines:
-                return "AI Generated Content", "Automated content from Doomscroll.FM"
-                
-            # Extract title from first line and remove # symbols
-            title = script_lines[0].strip()
-            title = re.sub(r'#', '', title).strip()
-            
-            # Replace problematic Unicode characters with ASCII equivalents
-            title = title.replace('—', '-')  # em-dash to hyphen
-            title = title.replace('–', '-')  # en-dash to hyphen
-            title = title.replace('"', '"')  # smart quotes to regular quotes
-            title = title.replace('"', '"')
-            title = title.replace(''', "'")  # smart apostrophes
-            title = title.replace(''', "'")
-            
-            title = _nfc(title)
-            
-            # Ensure title is not empty after processing
-            if not title or len(title) < 3:
-                title = "AI Generated Content"
-            
-            # Extract description from remaining lines
-            if len(script_lines) > 1:
-                description_lines = script_lines[1:]
-                
-                # Remove # symbols from lines 1-3 (which are now indices 0-2 in description_lines)
-                for i in range(min(3, len(description_lines))):
-                    description_lines[i] = re.sub(r'#', '', description_lines[i])
-                
-                description = '\n'.join(description_lines).strip()
-                
-                # Replace problematic Unicode in description too
-                description = description.replace('—', '-')
-                description = description.replace('–', '-')
-                description = description.replace('"', '"')
-                description = description.replace('"', '"')
-                description = description.replace(''', "'")
-                description = description.replace(''', "'")
-                
-                description = _nfc(description)
-            else:
-                description = "Automated content from Doomscroll.FM"
-                
-            # Ensure description is not empty
-            if not description or len(description) < 10:
-                description = "Automated content from Doomscroll.FM"
-                
-            return title, description
-            
-        except Exception as e:
-            print(f"⚠️ Error processing GPT script: {e}")
-            return "AI Generated Content", "Automated content from Doomscroll.FM"
+        return self.renderer.render_script(gpt_script)
 
     def generate_hashtags(self, title, description):
         """Generate hashtags from title and description content"""
-        hashtags = []
-        
-        # Use custom specified hashtags
-        core_hashtags = ['#AI', '#News', '#Satire', '#Entertainment']
-        hashtags.extend(core_hashtags)
-        
-        # Extract keywords from title for additional hashtags
-        if title:
-            # Extract words that could be hashtags (4+ characters, alphabetic)
-            title_words = re.findall(r'\b[A-Za-z]{4,}\b', title)
-            for word in title_words[:3]:  # Limit to 3 additional hashtags from title
-                if word.lower() not in ['news', 'update', 'latest', 'breaking', 'daily']:
-                    hashtags.append(f"#{word.capitalize()}")
-        
-        return hashtags[:15]  # YouTube hashtag limit
+        return self.renderer.hashtags(title)
 
     def ensure_authentication(self, credentials_path="", token_path=""):
         """Ensure authentication is setup once and reused"""
@@ -435,16 +3366,256 @@ Generator: Memescreamer v0.5-dev
         if not token_path:
             token_path = self.token_path
         
-        success, msg = self.uploader.setup_youtube_service(credentials_path, token_path)
-        if success:
-            self._auth_initialized = True
+        success, msg = self.uploader.setup_youtube_service(credentials_path, token_path)
+        if success:
+            self._auth_initialized = True
+        
+        return success, msg
+
+    def _watched_video(self, path):
+        """Daemon mode uploads finished *-audio.mp4 renders and other containers, not silent *.mp4 intermediates"""
+        lower = os.path.basename(path).lower()
+        return lower.endswith('-audio.mp4') or lower.endswith(OTHER_VIDEO_EXTENSIONS)
+    
+    def run_daemon(self, directory_path, privacy_status="private", credentials_path="", token_path="",
+                   dry_run=False, auto_spread=False, schedule_delay=10, workers=1, recursive=False,
+                   history_path=None, verify_hash=False, quota_limit=10000, insert_cost=1600,
+                   settle_seconds=15, sidecar_timeout=600, poll_interval=30, blackouts=None, daily_cap=None,
+                   stream=False, stream_marker='.done', stall_timeout=600, track=False):
+        """Watch a directory and upload renders as soon as they are finished.
+
+        A file is ready once its size has stayed the same for settle_seconds and
+        its JSON sidecar exists; after sidecar_timeout it is uploaded with
+        fallback metadata. With stream=True uploads start as soon as a render
+        appears and follow it while it grows (see RenderCompletion); each
+        stream holds a worker until the render is done. SIGINT/SIGTERM stop
+        watching, interrupt in-flight uploads between chunks (their sessions
+        stay resumable) and flush state. With track=True YouTube processing of
+        recent uploads is polled in between (ProcessingTracker).
+        """
+        directory = Path(directory_path)
+        if not directory.is_dir():
+            print(f"❌ Directory not found: {directory_path}")
+            return False
+        
+        signal.signal(signal.SIGINT, self.signal_handler)
+        if hasattr(signal, 'SIGTERM'):
+            signal.signal(signal.SIGTERM, self.signal_handler)
+        
+        upload_history = self.load_upload_history(directory, history_path, read_only=dry_run)
+        fingerprints = FingerprintIndex(directory / self.fingerprint_log, verify=verify_hash)
+        if not dry_run:
+            success, setup_msg = self.ensure_authentication(credentials_path, token_path)
+            if not success:
+                print(_console(f"❌ YouTube setup failed: {setup_msg}"))
+                return False
+            self.uploader.session_store = UploadSessionStore(directory / self.sessions_log)
+            # A daemon has nowhere better to be, so it always sleeps through quota resets
+            self.uploader.quota = QuotaBudget(Path(token_path or self.token_path).parent / self.quota_log,
+                                              daily_limit=quota_limit, costs={'videos.insert': insert_cost})
+            self.uploader.quota_wait = True
+        
+        watcher = DirectoryWatcher(directory, recursive=recursive, poll_interval=poll_interval)
+        print(_console(f"👁️ Daemon watching {directory} ({watcher.mode}, {workers} worker(s)). Ctrl+C to stop."))
+        
+        pending = {}   # path -> (size, mtime, stable since, first seen)
+        handled = {}   # path -> (size, mtime) already queued or skipped
+        queued_keys = set()
+        streaming = set()  # paths with a streamed upload in flight
+        retry_at = {}  # path -> monotonic time a failed upload is looked at again
+        local = threading.local()
+        count = 0
+        
+        def worker_uploader():
+            if not hasattr(local, 'uploader'):
+                local.uploader = self.uploader.clone() if workers > 1 else self.uploader
+            return local.uploader
+        
+        def upload_task(planned):
+            log_prefix = f"[{planned.index}] "
+            with self._history_lock:
+                print(_console(f"🎬 Processing {log_prefix}{planned.video_path.name}"))
+            video_id = None
+            try:
+                video_id = self._upload_planned_file(worker_uploader(), planned, privacy_status, upload_history,
+                                                     log_prefix, fingerprints)
+            finally:
+                if planned.release_time and planned.file_key not in upload_history:
+                    upload_history.release_slots([planned.file_key])
+                path = str(planned.video_path)
+                with self._history_lock:
+                    queued_keys.discard(planned.file_key)
+                    streaming.discard(path)
+                    if not video_id and not self.stop_daemon:
+                        # Forget the failure so the file is picked up again; inotify sends no new event for it
+                        handled.pop(path, None)
+                        retry_at[path] = time.monotonic() + poll_interval
+        
+        def queue(planned):
+            nonlocal count
+            if planned.release_time is None and auto_spread:
+                releases = self.plan_releases(upload_history, [planned.file_key], datetime.now(LOCAL_TZ) + timedelta(minutes=2),
+                                              schedule_delay, blackouts, daily_cap, dry_run, verbose=False)
+                if not releases:
+                    return False
+                planned = planned._replace(release_time=releases[planned.file_key])
+            count += 1
+            planned = planned._replace(index=count)
+            
+            if dry_run:
+                when = f" for {planned.release_time.strftime('%Y-%m-%d %H:%M')}" if planned.release_time else ""
+                verb = "stream" if planned.growing else "upload"
+                print(_console(f"🧪 DRY RUN - Would {verb} {planned.video_path.name}{when}"))
+                return False
+            pool.submit(upload_task, planned)
+            return True
+        
+        def discover(paths):
+            for path in paths:
+                if path not in pending and self._watched_video(path):
+                    pending[path] = None
         
-        return success, msg
-
+        # The tracker polls from this thread, so it gets a service object of its own
+        tracker = ProcessingTracker(self.uploader.clone(), upload_history) if track and not dry_run else None
+        
+        discover(entry.path for entry in scan_video_directory(directory, recursive=recursive))
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="upload")
+        try:
+            while not self.stop_daemon:
+                if tracker and tracker.due():
+                    tracker.poll()
+                changed, rescan = watcher.wait(1.0)
+                discover(changed)
+                with self._history_lock:
+                    retry = [path for path, when in retry_at.items() if time.monotonic() >= when]
+                    for path in retry:
+                        retry_at.pop(path)
+                if retry:
+                    print(_console(f"🔁 Retrying {len(retry)} failed upload(s)"))
+                    discover(retry)
+                if rescan:
+                    discover(entry.path for entry in scan_video_directory(directory, recursive=recursive)
+                             if handled.get(entry.path) != (entry.size, entry.mtime))
+                
+                now = time.monotonic()
+                for path in list(pending):
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        pending.pop(path)  # deleted or renamed away
+                        continue
+                    
+                    if stream:
+                        pending.pop(path)
+                        if path in streaming or not st.st_size or handled.get(path) == (st.st_size, st.st_mtime):
+                            continue
+                        handled[path] = (st.st_size, st.st_mtime)
+                        if self.dedupe_key(VideoEntry(path, None, st.st_size, st.st_mtime), fingerprints,
+                                           upload_history)[0] is None:
+                            continue
+                        # A growing file has no stable fingerprint; its session is keyed by path until it is done
+                        stream_key = "stream:" + _file_key(Path(path), 0)
+                        with self._history_lock:
+                            if stream_key in queued_keys:
+                                continue
+                            queued_keys.add(stream_key)
+                            streaming.add(path)
+                        completion = RenderCompletion(path, self.find_metadata, stream_marker, settle_seconds, stall_timeout)
+                        if not completion.sidecar_at_start:
+                            print(_console(f"⚠️ No sidecar yet for {Path(path).name}, streaming with fallback metadata"))
+                        planned = PlannedUpload(0, Path(path), completion.sidecar_at_start, None, stream_key,
+                                                growing=completion)
+                        if not queue(planned):
+                            with self._history_lock:
+                                queued_keys.discard(stream_key)
+                                streaming.discard(path)
+                        continue
+                    
+                    previous = pending[path]
+                    if not previous or previous[:2] != (st.st_size, st.st_mtime):
+                        # Files untouched for a while (e.g. the backlog at startup) count as settled already
+                        stable_since = now - max(0.0, time.time() - st.st_mtime) if not previous else now
+                        pending[path] = (st.st_size, st.st_mtime, stable_since, previous[3] if previous else stable_since)
+                        continue
+                    if handled.get(path) == (st.st_size, st.st_mtime):
+                        pending.pop(path)
+                        continue
+                    if now - previous[2] < settle_seconds:
+                        continue
+                    
+                    metadata_path = self.find_metadata(path)
+                    if not metadata_path and now - previous[3] < sidecar_timeout:
+                        continue
+                    
+                    pending.pop(path)
+                    handled[path] = (st.st_size, st.st_mtime)
+                    entry = VideoEntry(path, metadata_path, st.st_size, st.st_mtime)
+                    file_key, content_sha256 = self.dedupe_key(entry, fingerprints, upload_history)
+                    with self._history_lock:
+                        if file_key is None or file_key in queued_keys:
+                            continue
+                        queued_keys.add(file_key)
+                    if not dry_run:
+                        fingerprints.save()
+                    
+                    if not metadata_path and not dry_run:
+                        print(_console(f"⚠️ No sidecar for {Path(path).name} after {sidecar_timeout}s, using fallback metadata"))
+                    planned = PlannedUpload(0, Path(path), metadata_path, None, file_key, content_sha256)
+                    if not queue(planned):
+                        with self._history_lock:
+                            queued_keys.discard(file_key)
+        finally:
+            print(_console("🛑 Shutting down daemon..."))
+            watcher.close()
+            pool.shutdown(wait=True, cancel_futures=True)
+            if not dry_run:
+                fingerprints.save()
+                self.save_upload_history(directory, upload_history)
+            print(_console(f"📊 Daemon stopped: {self.stats['uploaded']} uploaded, {self.stats['failed']} failed"))
+        
+        return True
+    
     def signal_handler(self, signum, frame):
         """Handle Ctrl+C gracefully"""
         print(f"\n🛑 Received signal {signum}. Stopping daemon...")
         self.stop_daemon = True
+        uploaders = [self.uploader] + ([shard.uploader for shard in self.channel_pool.shards] if self.channel_pool else [])
+        for uploader in uploaders:
+            uploader.retry_policy.cancel()
+            uploader.bandwidth.cancel()
+            if uploader.quota:
+                uploader.quota.cancel()
+    
+    def plan_releases(self, upload_history, file_keys, not_before, schedule_delay, blackouts=None, daily_cap=None,
+                      dry_run=False, verbose=True):
+        """Reserve collision-free release slots for file_keys, in order, from not_before on.
+
+        Slots keep schedule_delay minutes from each other and from every
+        release already booked in the history (earlier runs, and runs still
+        in flight), skip blackout windows and respect the daily cap.
+        Returns {file_key: release datetime}, or None if no slot could be found.
+        """
+        allocator = ReleaseSlotAllocator(schedule_delay, blackouts, daily_cap)
+        try:
+            releases = upload_history.allocate_slots(allocator, [(key, not_before) for key in file_keys],
+                                                     since=not_before - timedelta(minutes=max(1, schedule_delay)),
+                                                     dry_run=dry_run)
+        except ValueError as e:
+            print(_console(f"❌ {e}"))
+            return None
+        
+        if verbose:
+            existing = allocator.booked - len(releases)
+            print(_console(f"📅 Release slots: {len(releases)} new, avoiding {existing} already booked"
+                           + (f", daily cap {daily_cap}" if daily_cap else "")
+                           + (f", {len(blackouts)} blackout window(s)" if blackouts else "")))
+            new_per_day = {}
+            for release in releases.values():
+                day = release.date()
+                new_per_day[day] = new_per_day.get(day, 0) + 1
+            for day, new in sorted(new_per_day.items()):
+                print(_console(f"   {day.isoformat()}: {new} new + {allocator.per_day[day] - new} booked"))
+        return releases
     
     def parse_schedule_start(self, time_str):
         """Parse schedule start time in HH:MM format"""
@@ -466,26 +3637,75 @@ Generator: Memescreamer v0.5-dev
     
     def bulk_upload(self, directory_path, privacy_status="private", algorithm_optimization="trending",
                    category_id="25", credentials_path="", token_path="", dry_run=False, auto_spread=False,
-                   schedule_delay=10, schedule_start="", batch=False, auto_playlist=False, limit=None):
-        """Bulk upload videos from directory with SpiderCat metadata"""
+                   schedule_delay=10, schedule_start="", batch=False, auto_playlist=False, limit=None,
+                   workers=1, recursive=False, history_path=None, verify_hash=False,
+                   quota_limit=10000, quota_wait=False, insert_cost=1600, channels_config=None,
+                   validate=False, quarantine=None, ffprobe="ffprobe", min_duration=1.0,
+                   faststart=False, ffmpeg="ffmpeg", blackouts=None, daily_cap=None,
+                   distributed=False, node_id=None, lease_seconds=120, track=False, track_timeout=3600,
+                   playlist_prefix="Doomscroll.FM", playlist_description="", playlist_privacy=None):
+        """Bulk upload videos from directory with SpiderCat metadata.
+
+        distributed: share the directory with other uploader processes (on
+        this or other hosts) by claiming each file through WorkClaims leases.
+        auto_playlist: add each upload to the daily playlist of its release
+        day once the batch is done (PlaylistAssigner); new playlists get
+        playlist_privacy, or privacy_status when it is not given.
+        """
         
         directory = Path(directory_path)
         if not directory.exists():
             print(f"❌ Directory not found: {directory_path}")
             return False
         
-        video_files = self.find_video_files(directory)
-        if not video_files:
+        self.uploader.request_scopes(YouTubeUploader.feature_scopes(track, auto_playlist), token_path or self.token_path)
+        if channels_config:
+            try:
+                self.channel_pool = ChannelPool.load(channels_config, credentials_path or self.credentials_path,
+                                                     YouTubeUploader.feature_scopes(track, auto_playlist))
+            except ValueError as e:
+                print(_console(f"❌ Invalid channels config: {e}"))
+                return False
+        
+        video_entries = scan_video_directory(directory, recursive=recursive)
+        if not video_entries:
             print(f"📁 No video files found in {directory_path}")
             return False
         
-        upload_history = self.load_upload_history(directory)
+        upload_history = self.load_upload_history(directory, history_path, read_only=dry_run)
+        sessions_path = directory / self.sessions_log
+        if distributed and not dry_run:
+            self.claims = WorkClaims(directory / self.claims_dir, node_id, lease_seconds)
+            # Session files are rewritten whole, so every node keeps its own
+            sessions_path = sessions_path.with_name(f"{sessions_path.stem}.{self.claims.node}{sessions_path.suffix}")
+            print(_console(f"🤝 Distributed mode: node {self.claims.owner}, {lease_seconds:.0f}s leases"))
+        session_store = UploadSessionStore(sessions_path)
+        if not dry_run:
+            self.uploader.session_store = session_store
         
+        fingerprints = FingerprintIndex(directory / self.fingerprint_log, verify=verify_hash)
         pending_files = []
-        for video_file in video_files:
-            file_key = _file_key(Path(video_file))
-            if file_key not in upload_history:
-                pending_files.append(video_file)
+        seen = {}  # file_key -> index into pending_files
+        for entry in video_entries:
+            file_key, content_sha256 = self.dedupe_key(entry, fingerprints, upload_history)
+            if file_key is None:
+                continue
+            if self.claims and self.claims.done(file_key):
+                self.stats['already_uploaded'] += 1
+                continue
+            if file_key in seen:
+                # Identical renders: keep the copy with a metadata sidecar, else the first by path
+                kept = pending_files[seen[file_key]][0]
+                if entry.metadata_path and not kept.metadata_path:
+                    pending_files[seen[file_key]] = (entry, file_key, content_sha256)
+                    entry = kept
+                print(_console(f"♊ Skipping duplicate render: {Path(entry.path).name}"))
+                self.stats['skipped'] += 1
+                continue
+            seen[file_key] = len(pending_files)
+            pending_files.append((entry, file_key, content_sha256))
+        if not dry_run:
+            fingerprints.save()
         
         if not pending_files:
             print("✅ All files have been uploaded!")
@@ -497,6 +3717,28 @@ Generator: Memescreamer v0.5-dev
         
         print(f"📹 Found {len(pending_files)} videos to upload")
         
+        media_of = {}
+        if validate:
+            pending_files, media_of = self.validate_media(directory, pending_files, dry_run, quarantine,
+                                                          ffprobe, min_duration)
+            if not pending_files:
+                print("❌ No valid videos left to upload")
+                return False
+        
+        channel_of = {}
+        if self.channel_pool:
+            pending_files, channel_of = self.plan_channels(pending_files, session_store, dry_run, quota_limit,
+                                                           quota_wait, insert_cost)
+        else:
+            quota = QuotaBudget(Path(token_path or self.token_path).parent / self.quota_log,
+                                daily_limit=quota_limit, costs={'videos.insert': insert_cost})
+            pending_files = self.plan_quota(quota, pending_files, quota_wait)
+            if not dry_run:
+                self.uploader.quota = quota
+                self.uploader.quota_wait = quota_wait
+        if not pending_files:
+            return False
+        
         if auto_spread and schedule_start:
             start_time = self.parse_schedule_start(schedule_start)
             base_time = start_time
@@ -504,162 +3746,688 @@ Generator: Memescreamer v0.5-dev
             # Add 2 minutes buffer to ensure scheduling is always in the future
             base_time = datetime.now(LOCAL_TZ) + timedelta(minutes=2)
         
-        first_release = base_time
-        last_release = base_time + timedelta(minutes=schedule_delay * (len(pending_files) - 1))
+        releases = {}
+        if auto_spread:
+            releases = self.plan_releases(upload_history, [file_key for _, file_key, _ in pending_files], base_time,
+                                          schedule_delay, blackouts, daily_cap, dry_run)
+            if releases is None:
+                return False
+            first_release, last_release = min(releases.values()), max(releases.values())
+        else:
+            first_release = base_time
+            last_release = base_time + timedelta(minutes=schedule_delay * (len(pending_files) - 1))
         
         print(_console(f"🕐 First release scheduled for: {first_release.strftime('%Y-%m-%d %H:%M:%S')}"))
         print(_console(f"🕐 Last release scheduled for: {last_release.strftime('%Y-%m-%d %H:%M:%S')}"))
         print()
         
+        plan = []
+        for i, (entry, file_key, content_sha256) in enumerate(pending_files):
+            release_time = releases.get(file_key)
+            plan.append(PlannedUpload(i, Path(entry.path), entry.metadata_path, release_time,
+                                      file_key, content_sha256, channel=channel_of.get(file_key),
+                                      media=media_of.get(file_key)))
+        plan = self.preload_metadata(plan, MetadataManifest(directory / self.manifest_log), save=not dry_run)
+        
+        assigners = []
+        if auto_playlist:
+            playlist_privacy = playlist_privacy or privacy_status
+            targets = ([(shard.uploader, Path(shard.token_path).parent /
+                         f"{Path(self.playlist_log).stem}_{shard.name}.json") for shard in self.channel_pool.shards]
+                       if self.channel_pool else
+                       [(self.uploader, Path(token_path or self.token_path).parent / self.playlist_log)])
+            for target, cache_path in targets:
+                assigner = PlaylistAssigner(target, cache_path, playlist_prefix, playlist_description, playlist_privacy)
+                assigners.append(assigner)
+                if not dry_run:
+                    target.playlists = assigner
+        
+        if faststart and not dry_run:
+            ffmpeg_path = shutil.which(ffmpeg)
+            if ffmpeg_path:
+                self.remuxer = FaststartRemuxer(directory / self.faststart_dir, ffmpeg_path)
+                self.remuxer.start(plan)
+            else:
+                print(_console(f"⚠️ ffmpeg not found ({ffmpeg}); uploading without faststart remux"))
+        
         upload_count = 0
-        for i, video_path in enumerate(pending_files):
-            video_path = Path(video_path)
-            release_time = base_time + timedelta(minutes=schedule_delay * i) if auto_spread else None
-            
-            # Ensure each release time is still in the future
-            if release_time and release_time <= datetime.now(LOCAL_TZ):
-                release_time = datetime.now(LOCAL_TZ) + timedelta(minutes=1)
-            
-            print(_console(f"🎬 Processing [{i+1}/{len(pending_files)}]: {video_path.name}"))
-            
-            if auto_spread:
-                print(_console(f"📅 Scheduled release: {release_time.strftime('%Y-%m-%d %H:%M:%S')}"))
-            
-            metadata_path = self.find_metadata(video_path)
+        if not dry_run and self.claims:
+            upload_count = self._distributed_upload(plan, workers, privacy_status, auto_spread, upload_history,
+                                                    credentials_path, token_path)
+            if upload_count is None:
+                return False
+        elif not dry_run and self.channel_pool:
+            upload_count = self._sharded_upload(plan, privacy_status, auto_spread, upload_history)
+        elif not dry_run and workers > 1:
+            success, setup_msg = self.ensure_authentication(credentials_path, token_path)
+            if not success:
+                print(_console(f"❌ YouTube setup failed: {setup_msg}"))
+                return False
             
-            if dry_run:
-                # Process metadata to show what would be uploaded
-                if metadata_path:
-                    try:
-                        metadata = _safe_read_json(Path(metadata_path))
-                        if metadata:
-                            # Extract GPT script from ai_commentary
-                            ai_commentary = metadata.get('ai_commentary', {})
-                            gpt_script = ai_commentary.get('script', "")
-                            
-                            if gpt_script:
-                                title, description = self.process_gpt_script(gpt_script)
-                                if title and description:
-                                    # Add disclaimer to description
-                                    final_description = description + self.get_disclaimer_template()
-                                    hashtags = self.generate_hashtags(title, description)
-                                    
-                                    print(_console(f"   📝 Title: {title[:50]}..."))
-                                    print(_console(f"   📄 Description: {description[:50]}..."))
-                                    print(_console(f"   🏷️ Hashtags: {', '.join(hashtags[:5])}..."))
-                                    print(_console(f"   ✅ Disclaimer: INCLUDED"))
-                                else:
-                                    print(_console(f"   ⚠️ Could not parse GPT script"))
-                            else:
-                                print(_console(f"   ⚠️ No GPT script found in metadata"))
-                        
-                    except Exception as e:
-                        print(_console(f"   ❌ Failed to load metadata: {e}"))
-                        print(_console(f"   🔄 Would use fallback content"))
-                else:
-                    print(_console(f"   ⚠️ No metadata found - would use fallback"))
+            print(_console(f"🧵 Uploading with {workers} parallel workers"))
+            upload_count = self._parallel_upload(plan, workers, privacy_status, auto_spread, upload_history)
+        else:
+            for planned in plan:
+                i, video_path, metadata_path, release_time = planned[:4]
+                # Ensure each release time is still in the future
+                if release_time and release_time <= datetime.now(LOCAL_TZ):
+                    release_time = datetime.now(LOCAL_TZ) + timedelta(minutes=1)
+                    planned = planned._replace(release_time=release_time)
                 
-                print(_console("   🧪 DRY RUN - Would upload to YouTube"))
-                upload_count += 1
-            else:
-                # Actual upload - skip dry-run purity violations
-                success, setup_msg = self.ensure_authentication(credentials_path, token_path)
-                if not success:
-                    print(_console(f"   ❌ YouTube setup failed: {setup_msg}"))
-                    upload_count += 1
-                    continue
+                print(_console(f"🎬 Processing [{i+1}/{len(pending_files)}]: {video_path.name}"))
                 
-                # Load and process metadata
-                metadata = _safe_read_json(Path(metadata_path)) if metadata_path else None
-                title = f"🎧 Daily signal leakage from Doomscroll.FM - {video_path.stem}"  # Default fallback
-                final_description = "Automated AI content" + self.get_disclaimer_template()  # Default fallback
+                if auto_spread:
+                    print(_console(f"📅 Scheduled release: {release_time.strftime('%Y-%m-%d %H:%M:%S')}"))
+                if planned.channel:
+                    print(_console(f"📺 Channel: {planned.channel}"))
+                if planned.media:
+                    print(_console(f"🎞️ Media: {describe_media(planned.media)}"))
+                if faststart and dry_run:
+                    needed, note = faststart_state(video_path)
+                    print(_console(f"🧰 Faststart: {'would remux (' + note + ')' if needed else note}"))
+                if assigners and dry_run:
+                    title = assigners[0].title_for(release_time)
+                    cached = any(title in assigner.playlists for assigner in assigners)
+                    print(_console(f"📂 Playlist: {title}{'' if cached else ' (new or not cached yet)'}"))
                 
-                if metadata:
-                    # Extract GPT script from ai_commentary
-                    ai_commentary = metadata.get('ai_commentary', {})
-                    gpt_script = ai_commentary.get('script', "")
+                if dry_run:
+                    # Show what would be uploaded from the preloaded metadata
+                    content = planned.content
+                    if content['source'] == 'script':
+                        print(_console(f"   📝 Title: {content['title'][:50]}..."))
+                        print(_console(f"   📄 Description: {content['description'][:50]}..."))
+                        print(_console(f"   🏷️ Hashtags: {', '.join(content['tags'][:5])}..."))
+                        print(_console(f"   ✅ Disclaimer: INCLUDED"))
+                    elif content['source'] == 'unparsed':
+                        print(_console(f"   ⚠️ Could not parse GPT script"))
+                    elif content['source'] == 'no_script':
+                        print(_console(f"   ⚠️ No GPT script found in metadata"))
+                    elif content['source'] == 'unreadable':
+                        print(_console(f"   ❌ Failed to load metadata"))
+                        print(_console(f"   🔄 Would use fallback content"))
+                    else:
+                        print(_console(f"   ⚠️ No metadata found - would use fallback"))
                     
-                    if gpt_script:
-                        processed_title, processed_description = self.process_gpt_script(gpt_script)
-                        if processed_title and processed_description:
-                            # Use processed content
-                            title = processed_title
-                            final_description = processed_description + self.get_disclaimer_template()
-                
-                # Generate hashtags based on final title
-                hashtags = self.generate_hashtags(title, final_description)
-                
-                # Upload to YouTube
-                video_id, upload_result = self.uploader.upload_video(
-                    video_path=str(video_path),
-                    title=title,
-                    description=final_description,
-                    privacy_status=privacy_status,
-                    tags=[tag.replace('#', '') for tag in hashtags],  # Remove # for API
-                    scheduled_publish_time=release_time
-                )
-                
-                if video_id:
-                    print(_console(f"   ✅ Success! Video ID: {video_id}"))
-                    print(_console(f"   🔗 URL: https://www.youtube.com/watch?v={video_id}"))
-                    file_key = _file_key(video_path)
-                    upload_history[file_key] = {
-                        'video_id': video_id,
-                        'upload_time': datetime.now().isoformat(),
-                        'scheduled_time': release_time.isoformat() if release_time else None,
-                        'title': title,
-                        'has_disclaimer': True,
-                        'file_name': video_path.name,
-                        'file_size': video_path.stat().st_size,
-                        'sha256': file_key
-                    }
-                    self.stats['uploaded'] += 1
+                    print(_console("   🧪 DRY RUN - Would upload to YouTube"))
+                    upload_count += 1
                 else:
-                    print(_console(f"   ❌ Upload failed: {upload_result}"))
-                    self.stats['failed'] += 1
-                
-                upload_count += 1
+                    # Actual upload - skip dry-run purity violations
+                    success, setup_msg = self.ensure_authentication(credentials_path, token_path)
+                    if not success:
+                        print(_console(f"   ❌ YouTube setup failed: {setup_msg}"))
+                        upload_count += 1
+                        continue
+                    
+                    self._upload_planned_file(self.uploader, planned, privacy_status, upload_history)
+                    upload_count += 1
+        
+        if self.remuxer:
+            self.remuxer.close()
+            self.remuxer = None
+        if self.claims:
+            self.claims.close()
+        if not dry_run:
+            for assigner in assigners:
+                if assigner.uploader.youtube_service:
+                    assigner.flush(upload_history,
+                                   f"[{assigner.uploader.channel}] " if assigner.uploader.channel else "")
         
-        # Save upload history
+        # Uploads are journaled as they complete; only fold the journal into the snapshot here
         if not dry_run:
-            _safe_write_json(Path(directory) / self.uploaded_log, upload_history)
+            if releases:
+                # Files another node finished keep their slot; only this run's misses give theirs back
+                upload_history.release_slots([key for key in releases if key not in upload_history
+                                              and not (self.claims and self.claims.done(key))])
+            self.save_upload_history(directory, upload_history)
         
         print("-" * 60)
         print(_console("📊 BATCH UPLOAD COMPLETE:"))
         print(_console(f"   📹 Videos processed: {len(pending_files)}"))
         print(_console(f"   ✅ Successful uploads: {self.stats['uploaded']}"))
         print(_console(f"   ❌ Failed uploads: {self.stats['failed']}"))
+        if self.stats['rejected']:
+            print(_console(f"   🚫 Rejected by media check: {self.stats['rejected']}"))
+        shaper = self.uploader.bandwidth
+        throughput = shaper.throughput()
+        if throughput:
+            throttled = f", {shaper.stats['throttled_seconds']:.0f}s throttled" if shaper.stats['throttled_seconds'] >= 1 else ""
+            print(_console(f"   📶 Throughput: {shaper.format_rate(throughput)} "
+                           f"({shaper.stats['bytes'] / 1048576:,.1f} MiB sent{throttled})"))
+        chunking = self.uploader.chunk_sizer.summary()
+        if chunking['chunks']:
+            print(_console(f"   📦 Chunks: {chunking['mode']} {chunking['initial_size'] / 1048576:.2f} -> "
+                           f"{chunking['final_size'] / 1048576:.2f} MiB (mean {chunking['mean_size'] / 1048576:.2f} MiB, "
+                           f"{chunking['errors']} failed of {chunking['chunks'] + chunking['errors']})"))
+            self.record_run(directory, chunking, throughput)
+        retry_stats = self.retry_stats()
+        if self.claims:
+            claims = self.claims.stats
+            print(_console(f"   🤝 Claims: {claims['claimed']} taken ({claims['reclaimed']} from dead nodes), "
+                           f"{claims['done_elsewhere']} finished by other nodes"
+                           + (f", {claims['lost']} lease(s) lost" if claims['lost'] else "")))
+        if retry_stats['retries']:
+            print(_console(f"   🔁 Retries: {retry_stats['retries']} ({retry_stats['backoff_seconds']:.0f}s backoff, "
+                           f"{retry_stats['breaker_trips']} circuit trips)"))
+        if assigners and dry_run:
+            titles = {assigners[0].title_for(planned.release_time) for planned in plan}
+            new = [title for title in titles if not any(title in assigner.playlists for assigner in assigners)]
+            print(_console(f"   📂 Playlists: {len(plan)} video(s) into {len(titles)} daily playlist(s), "
+                           f"{len(new)} not cached; about {(len(plan) + len(new)) * 50 + bool(new)} quota units"))
+        elif assigners:
+            stats = [assigner.stats for assigner in assigners]
+            deferred = sum(stat['deferred'] for stat in stats)
+            print(_console(f"   📂 Playlists: {sum(stat['added'] for stat in stats)} video(s) added, "
+                           f"{sum(stat['created'] for stat in stats)} playlist(s) created, "
+                           f"{sum(stat['list_calls'] for stat in stats)} lookup call(s)"
+                           + (f", {deferred} queued for the next run" if deferred else "")))
         if auto_spread:
-            total_hours = (schedule_delay * (len(pending_files) - 1)) / 60
-            print(_console(f"   🕐 Release schedule: Every {schedule_delay} minutes starting {first_release.strftime('%H:%M')}"))
+            total_hours = (last_release - first_release).total_seconds() / 3600
+            print(_console(f"   🕐 Release schedule: At least {schedule_delay} minutes apart starting {first_release.strftime('%H:%M')}"))
             print(_console(f"   📅 Content will be published over {total_hours:.1f} hours"))
         
+        if track and not dry_run:
+            uploaded = {planned.file_key for planned in plan if planned.file_key in upload_history}
+            if uploaded:
+                self.track_all_channels(upload_history, uploaded, track_timeout)
+        
         return True
     
-    def find_video_files(self, directory):
-        """Find all video files in directory - specifically *-audio.mp4 files for SpiderCat"""
-        video_files = []
+    def record_run(self, directory, chunking, throughput):
+        """Append this run's transfer tuning (chunk sizes, throughput, retries) to the runs log"""
+        record = {
+            'time': datetime.now().isoformat(),
+            'uploaded': self.stats['uploaded'],
+            'failed': self.stats['failed'],
+            'throughput': round(throughput, 1) if throughput else None,
+            'bytes': self.uploader.bandwidth.stats['bytes'],
+            'throttled_seconds': round(self.uploader.bandwidth.stats['throttled_seconds'], 3),
+            'chunking': chunking,
+            'retries': self.retry_stats()
+        }
+        try:
+            with open(Path(directory) / self.runs_log, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print(_console(f"⚠️ Could not record run stats: {e}"))
+    
+    def validate_media(self, directory, pending_files, dry_run, quarantine=None, ffprobe="ffprobe",
+                       min_duration=1.0, workers=None):
+        """Probe pending videos with ffprobe in a process pool and drop the ones YouTube would choke on.
+
+        Runs before quota planning, so bad renders cost neither quota nor
+        uplink. Results are cached by fingerprint. Rejected files are skipped,
+        or moved with their sidecar into the quarantine directory when
+        quarantine is not None ("" means the default hidden folder).
+        Returns the kept files and {file_key: probe result}.
+        """
+        ffprobe_path = shutil.which(ffprobe)
+        if not ffprobe_path:
+            print(_console(f"❌ ffprobe not found ({ffprobe}); install FFmpeg or pass --ffprobe"))
+            return [], {}
+        
+        cache = MediaProbeCache(directory / self.probe_log)
+        results = {}
+        todo = []
+        for entry, file_key, _ in pending_files:
+            cached = cache.get(file_key, entry.size, entry.mtime, min_duration)
+            if cached is None:
+                todo.append((entry, file_key))
+            else:
+                results[file_key] = cached
+        
+        if todo:
+            probe = functools.partial(probe_media, ffprobe=ffprobe_path, min_duration=min_duration)
+            with ProcessPoolExecutor(max_workers=max(1, min(workers or os.cpu_count() or 1, len(todo)))) as pool:
+                for (entry, file_key), result in zip(todo, pool.map(probe, [entry.path for entry, _ in todo])):
+                    results[file_key] = result
+                    cache.put(file_key, entry.size, entry.mtime, min_duration, result)
+            if not dry_run:
+                cache.save()
+        print(_console(f"🎞️ Media check: {len(pending_files) - len(todo)} cached, {len(todo)} probed"))
+        
+        quarantine_path = None
+        if quarantine is not None:
+            quarantine_path = Path(quarantine) if quarantine else directory / self.quarantine_dir
+        
+        kept = []
+        for item in pending_files:
+            entry, file_key, _ = item
+            media = results[file_key]
+            if media['ok']:
+                kept.append(item)
+                continue
+            
+            self.stats['rejected'] += 1
+            name = Path(entry.path).name
+            if quarantine_path is None:
+                print(_console(f"🚫 Rejected {name}: {media['reason']}"))
+            elif dry_run:
+                print(_console(f"🚫 Rejected {name}: {media['reason']} (would quarantine to {quarantine_path})"))
+            else:
+                moved = self.quarantine_file(entry, quarantine_path, file_key, media['reason'])
+                print(_console(f"🚫 Rejected {name}: {media['reason']}" +
+                               (f" (quarantined to {quarantine_path})" if moved else " (quarantine failed, skipped)")))
+        
+        return kept, {file_key: results[file_key] for _, file_key, _ in kept}
+    
+    def quarantine_file(self, entry, quarantine_path, file_key, reason):
+        """Move a rejected video and its sidecar aside and note why in the quarantine log"""
+        try:
+            quarantine_path.mkdir(parents=True, exist_ok=True)
+            moved = []
+            for source in (entry.path, entry.metadata_path):
+                if not source:
+                    continue
+                target = quarantine_path / Path(source).name
+                if target.exists():
+                    target = target.with_name(f"{target.stem}.{datetime.now().strftime('%Y%m%d%H%M%S')}{target.suffix}")
+                shutil.move(source, target)
+                moved.append(target.name)
+            
+            with open(quarantine_path / "spidercat_quarantine.jsonl", 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'time': datetime.now().isoformat(), 'source': entry.path, 'files': moved,
+                                    'fingerprint': file_key, 'reason': reason}, ensure_ascii=False) + "\n")
+            return True
+        except OSError as e:
+            print(_console(f"⚠️ Could not quarantine {Path(entry.path).name}: {e}"))
+            return False
+    
+    def retry_stats(self):
+        """Retry counters summed over the default uploader and any channel shards"""
+        policies = [self.uploader.retry_policy]
+        if self.channel_pool:
+            policies += [shard.uploader.retry_policy for shard in self.channel_pool.shards]
+        totals = {'retries': 0, 'backoff_seconds': 0.0, 'breaker_trips': 0}
+        for policy in policies:
+            for name in totals:
+                totals[name] += policy.stats[name]
+        return totals
+    
+    def shard_quota(self, shard, quota_limit, insert_cost):
+        return QuotaBudget(Path(shard.token_path).parent / f"{Path(self.quota_log).stem}_{shard.name}.json",
+                           daily_limit=shard.quota_limit or quota_limit, costs={'videos.insert': insert_cost})
+    
+    def plan_channels(self, pending_files, session_store, dry_run, quota_limit, quota_wait, insert_cost):
+        """Route pending files to channel shards and fit each shard to its own quota.
+
+        Returns the surviving files in their original order and {file_key: channel name}.
+        """
+        pool = self.channel_pool
+        pinned = {}
+        for entry, file_key, _ in pending_files:
+            value = session_store.channel(file_key)
+            if value is None:
+                value = pool.route_value(self.load_metadata_cached(entry.metadata_path))
+            if value is not None:
+                pinned[file_key] = value
+        
+        capacity = {}
+        for shard in pool.shards:
+            shard.quota = self.shard_quota(shard, quota_limit, insert_cost)
+            capacity[shard.name] = shard.quota.plan(len(pending_files))[0]
+        
+        assignment, unroutable = pool.assign(pending_files, pinned, capacity)
+        for entry, value in unroutable:
+            print(_console(f"⚠️ No channel matches {pool.route_field}={value!r} for {Path(entry.path).name}, skipping"))
+            self.stats['skipped'] += 1
+        
+        kept = set()
+        channel_of = {}
+        for shard in pool.shards:
+            files = [item for item in pending_files if assignment.get(item[1]) is shard]
+            if not files:
+                continue
+            print(_console(f"📺 Channel {shard.name}: {len(files)} video(s), {shard.workers} worker(s)"))
+            for entry, file_key, _ in self.plan_quota(shard.quota, files, quota_wait):
+                kept.add(file_key)
+                channel_of[file_key] = shard.name
+            if not dry_run:
+                shard.uploader.api_root = self.uploader.api_root
+                shard.uploader.bandwidth = self.uploader.bandwidth  # channels share one uplink
+                shard.uploader.chunk_sizer = self.uploader.chunk_sizer
+                shard.uploader.transport = self.uploader.transport
+                shard.uploader.session_store = session_store
+                shard.uploader.quota = shard.quota
+                shard.uploader.quota_wait = quota_wait
+        
+        return [item for item in pending_files if item[1] in kept], channel_of
+    
+    def plan_quota(self, quota, pending_files, quota_wait):
+        """Report how the batch fits the remaining API quota and trim it unless waiting for resets"""
+        today, per_day, completion = quota.plan(len(pending_files))
+        print(_console(f"🎟️ Quota: {quota.remaining()}/{quota.daily_limit} units left today, "
+                       f"room for {today} upload(s) (resets {quota.next_reset().strftime('%Y-%m-%d %H:%M')})"))
+        
+        if today >= len(pending_files):
+            print(_console(f"🏁 Projected completion: today, within quota"))
+            return pending_files
+        
+        if not quota_wait:
+            deferred = len(pending_files) - today
+            print(_console(f"⏸️ Deferring {deferred} upload(s) to a later run (use --quota-wait to sleep through resets)"))
+            if not today:
+                print(_console("❌ No YouTube quota left today"))
+            return pending_files[:today]
+        
+        if completion is None:
+            print(_console(f"❌ Daily quota {quota.daily_limit} is smaller than one upload"))
+            return []
+        print(_console(f"🏁 Projected completion: {completion.strftime('%Y-%m-%d %H:%M')} "
+                       f"({per_day} uploads per quota day)"))
+        return pending_files
+    
+    def dedupe_key(self, entry, fingerprints, upload_history):
+        """Return (history key, full SHA-256 or None) for a video, or (None, None) if already uploaded.
+
+        Legacy history entries are keyed by path and size, so those are still
+        honoured; new entries are keyed by content fingerprint, which survives
+        renames and moves and matches identical renders in other folders.
+        """
+        video_path = Path(entry.path)
+        if _file_key(video_path, entry.size) in upload_history:
+            return None, None
+        
+        file_key = fingerprints.fingerprint(entry.path, entry.size, entry.mtime)
+        if not fingerprints.verify:
+            return (None, None) if file_key in upload_history else (file_key, None)
+        
+        # Verify mode: a sampled match only counts if the full content hash agrees too
+        content_sha256 = fingerprints.content_sha256(entry.path, entry.size, entry.mtime)
+        if content_sha256 in upload_history:
+            return None, None
+        previous = upload_history.get(file_key)
+        if previous is None:
+            return file_key, content_sha256
+        if previous.get('content_sha256') in (None, content_sha256):
+            return None, None
+        print(_console(f"⚠️ Sampled fingerprint collision for {video_path.name}, keying by full SHA-256"))
+        return content_sha256, content_sha256
+    
+    def render_upload_content(self, video_path, metadata_path):
+        """Render title, description (without disclaimer) and hashtags for one video.
+
+        'source' records where the content came from, so dry-run can explain fallbacks.
+        """
+        content = {
+            'title': f"🎧 Daily signal leakage from Doomscroll.FM - {Path(video_path).stem}",  # Default fallback
+            'description': "Automated AI content",  # Default fallback
+            'source': 'no_metadata'
+        }
+        
+        if metadata_path:
+            metadata = self.load_metadata_cached(metadata_path)
+            if not metadata:
+                content['source'] = 'unreadable'
+            else:
+                # Extract GPT script from ai_commentary
+                ai_commentary = metadata.get('ai_commentary', {})
+                gpt_script = ai_commentary.get('script', "") if isinstance(ai_commentary, dict) else ""
+                content['source'] = 'no_script'
+                
+                if gpt_script:
+                    processed_title, processed_description = self.process_gpt_script(gpt_script)
+                    content['source'] = 'unparsed'
+                    if processed_title and processed_description:
+                        # Use processed content
+                        content.update(title=processed_title, description=processed_description, source='script')
+        
+        # Generate hashtags based on final title
+        content['tags'] = self.generate_hashtags(content['title'], content['description'])
+        return content
+    
+    def build_upload_content(self, video_path, metadata_path, content=None):
+        """Build title, description and hashtags for a bulk upload, falling back to defaults"""
+        content = content or self.render_upload_content(video_path, metadata_path)
+        final_description = content['description'] + self.get_disclaimer_template()
+        return content['title'], final_description, content['tags']
+    
+    def preload_metadata(self, plan, manifest, workers=8, save=True):
+        """Render metadata for every planned upload up front, reading only changed sidecars.
+
+        Sidecars are read and parsed in a thread pool (sidecar reads are I/O
+        bound, especially over NFS); results are stored in the manifest keyed
+        by fingerprint and attached to each PlannedUpload.
+        """
+        results = {}
+        todo = []
+        for planned in plan:
+            cached = manifest.get(planned.file_key, planned.metadata_path)
+            if cached:
+                results[planned.file_key] = cached
+            else:
+                todo.append(planned)
+        
+        def render(planned):
+            sidecar_state = manifest.sidecar_state(planned.metadata_path)
+            return planned, sidecar_state, self.render_upload_content(planned.video_path, planned.metadata_path)
+        
+        if todo:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(todo))),
+                                    thread_name_prefix="metadata") as pool:
+                for planned, sidecar_state, content in pool.map(render, todo):
+                    results[planned.file_key] = content
+                    manifest.put(planned.file_key, planned.metadata_path, content, sidecar_state)
+            if save:
+                manifest.save()
+        
+        print(_console(f"🗂️ Metadata: {len(plan) - len(todo)} cached, {len(todo)} sidecar(s) parsed"))
+        return [planned._replace(content=results[planned.file_key]) for planned in plan]
+    
+    def _upload_planned_file(self, uploader, planned, privacy_status, upload_history, log_prefix="", fingerprints=None):
+        """Upload one planned file with the given uploader and record the result in the shared history"""
+        video_path, release_time, file_key = planned.video_path, planned.release_time, planned.file_key
+        title, final_description, hashtags = self.build_upload_content(video_path, planned.metadata_path,
+                                                                       planned.content)
+        # A faststart remux is only the bytes we send; the original stays the file of record
+        upload_path = self.remuxer.upload_path(planned, log_prefix) if self.remuxer else video_path
+        
+        # Upload to YouTube
+        video_id, upload_result = uploader.upload_video(
+            video_path=str(upload_path),
+            title=title,
+            description=final_description,
+            privacy_status=privacy_status,
+            tags=[tag.replace('#', '') for tag in hashtags],  # Remove # for API
+            scheduled_publish_time=release_time,
+            log_prefix=log_prefix,
+            file_key=file_key,
+            growing=planned.growing,
+            stall_timeout=planned.growing.stall_timeout if planned.growing else 600
+        )
+        if self.claims:
+            if video_id:
+                self.claims.complete(file_key, video_id, video_path.name)
+            else:
+                self.claims.release(file_key)
+        if video_id and planned.growing:
+            file_key, title = self._finish_stream(uploader, planned, video_id, title, fingerprints, log_prefix)
+        
+        with self._history_lock:
+            if video_id:
+                print(_console(f"   {log_prefix}✅ Success! Video ID: {video_id}"))
+                print(_console(f"   {log_prefix}🔗 URL: https://www.youtube.com/watch?v={video_id}"))
+                entry = {
+                    'video_id': video_id,
+                    'upload_time': datetime.now().isoformat(),
+                    'scheduled_time': release_time.isoformat() if release_time else None,
+                    'title': title,
+                    'has_disclaimer': True,
+                    'file_name': video_path.name,
+                    'file_size': video_path.stat().st_size,
+                    'sha256': file_key,
+                    'content_sha256': planned.content_sha256
+                }
+                if planned.channel:
+                    entry['channel'] = planned.channel
+                upload_history.record(file_key, entry)
+                if uploader.playlists:
+                    uploader.playlists.queue(file_key, video_id, release_time)
+                if upload_path != video_path:
+                    self.remuxer.discard(planned)
+                self.stats['uploaded'] += 1
+            else:
+                print(_console(f"   {log_prefix}❌ Upload failed: {upload_result}"))
+                self.stats['failed'] += 1
         
-        # Primary pattern: SpiderCat audio files (*-audio.mp4)
-        audio_pattern = "*-audio.mp4"
-        audio_files = list(directory.glob(audio_pattern))
-        video_files.extend([str(f) for f in audio_files if f.is_file()])
+        return video_id
+    
+    def _finish_stream(self, uploader, planned, video_id, title, fingerprints=None, log_prefix=""):
+        """Key a finished streamed upload by its content fingerprint and apply a sidecar that came late.
+
+        Returns the history key and the title the video ended up with.
+        """
+        video_path = planned.video_path
+        st = video_path.stat()
+        if fingerprints:
+            file_key = fingerprints.fingerprint(str(video_path), st.st_size, st.st_mtime)
+        else:
+            file_key = _file_key(video_path, st.st_size)
+        
+        metadata_path = self.find_metadata(video_path)
+        if metadata_path and not planned.metadata_path:
+            late_title, description, hashtags = self.build_upload_content(video_path, metadata_path)
+            updated, message = uploader.update_metadata(video_id, late_title, description,
+                                                        tags=[tag.replace('#', '') for tag in hashtags],
+                                                        log_prefix=log_prefix)
+            if updated:
+                print(_console(f"   {log_prefix}📝 Applied sidecar metadata that arrived during the upload"))
+                title = late_title
+            else:
+                print(_console(f"   {log_prefix}⚠️ Kept fallback metadata: {message}"))
+        return file_key, title
+    
+    def _parallel_upload(self, plan, workers, privacy_status, auto_spread, upload_history, uploader=None, total=None):
+        """Upload planned files through a bounded pool of workers, each with its own YouTube service"""
+        local = threading.local()
+        base_uploader = uploader or self.uploader
+        total = total or len(plan)
+        
+        def worker_uploader():
+            if not hasattr(local, 'uploader'):
+                local.uploader = base_uploader.clone()
+            return local.uploader
         
-        # Fallback: other video extensions if no -audio.mp4 files found
-        if not video_files:
-            other_extensions = ['.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']
-            for ext in other_extensions:
-                pattern = f"*{ext}"
-                files = list(directory.glob(pattern))
-                video_files.extend([str(f) for f in files if f.is_file()])
+        def upload_task(planned):
+            if self.stop_daemon:
+                return False
+            if self.claims and not self.claims.claim(planned.file_key, planned.video_path.name):
+                return False
+            if self.claims and planned.file_key in upload_history:
+                # Finished by a node that died after recording it but before marking it done
+                self.claims.complete(planned.file_key, upload_history.get(planned.file_key, {}).get('video_id'),
+                                     planned.video_path.name)
+                return False
+            
+            i, video_path, release_time = planned.index, planned.video_path, planned.release_time
+            # Ensure each release time is still in the future
+            if release_time and release_time <= datetime.now(LOCAL_TZ):
+                release_time = datetime.now(LOCAL_TZ) + timedelta(minutes=1)
+                planned = planned._replace(release_time=release_time)
+            
+            log_prefix = f"[{i+1}/{total} {planned.channel}] " if planned.channel else f"[{i+1}/{total}] "
+            lines = [f"🎬 Processing {log_prefix}{video_path.name}"]
+            if auto_spread:
+                lines.append(f"   {log_prefix}📅 Scheduled release: {release_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            with self._history_lock:
+                print(_console("\n".join(lines)))
+            
+            try:
+                uploader = worker_uploader()
+            except Exception as e:
+                print(_console(f"   {log_prefix}❌ Worker setup failed: {e}"))
+                with self._history_lock:
+                    self.stats['failed'] += 1
+                return False
             
-            # Only include regular .mp4 files if no -audio.mp4 files exist
-            if not video_files:
-                mp4_pattern = "*.mp4"
-                mp4_files = list(directory.glob(mp4_pattern))
-                video_files.extend([str(f) for f in mp4_files if f.is_file() and not f.name.endswith('-audio.mp4')])
+            return self._upload_planned_file(uploader, planned, privacy_status, upload_history,
+                                             log_prefix) is not None
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="upload") as pool:
+            futures = [pool.submit(upload_task, planned) for planned in plan]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(_console(f"❌ Upload worker error: {e}"))
+        
+        return len(plan)
+    
+    def _distributed_upload(self, plan, workers, privacy_status, auto_spread, upload_history,
+                            credentials_path="", token_path=""):
+        """Upload the plan while other nodes work the same directory, then help finish their files.
+
+        Each node walks the plan from a different starting point so nodes
+        rarely contend for the same file. Files leased by other nodes are
+        retried every heartbeat until they are done somewhere or their
+        node stops heartbeating and this node reclaims them.
+        """
+        if not self.channel_pool:
+            success, setup_msg = self.ensure_authentication(credentials_path, token_path)
+            if not success:
+                print(_console(f"❌ YouTube setup failed: {setup_msg}"))
+                return None
+        
+        start = int(hashlib.sha256(self.claims.owner.encode('utf-8')).hexdigest(), 16) % len(plan)
+        ordered = plan[start:] + plan[:start]
         
-        return sorted(video_files)
+        def upload(part):
+            if self.channel_pool:
+                return self._sharded_upload(part, privacy_status, auto_spread, upload_history)
+            return self._parallel_upload(part, workers, privacy_status, auto_spread, upload_history, total=len(plan))
+        
+        print(_console(f"🧵 Uploading with {workers} worker(s) on node {self.claims.node}"))
+        upload(ordered)
+        announced = False
+        while not self.stop_daemon:
+            waiting = [planned for planned in ordered if planned.file_key in self.claims.waiting]
+            if not waiting:
+                break
+            if not announced:
+                print(_console(f"⏳ {len(waiting)} file(s) are being uploaded by other nodes; "
+                               f"standing by to reclaim any whose node stops heartbeating"))
+                announced = True
+            if not self.uploader.retry_policy.sleep(self.claims.heartbeat_interval):
+                break
+            upload(waiting)
+        return len(plan)
+    
+    def _sharded_upload(self, plan, privacy_status, auto_spread, upload_history):
+        """Run every channel shard's worker pool side by side, all recording into the one shared history"""
+        shards = [(shard, [planned for planned in plan if planned.channel == shard.name])
+                  for shard in self.channel_pool.shards]
+        shards = [(shard, shard_plan) for shard, shard_plan in shards if shard_plan]
+        
+        runnable = []
+        for shard, shard_plan in shards:
+            if not shard.authenticated:
+                success, setup_msg = shard.uploader.setup_youtube_service(shard.credentials_path, shard.token_path)
+                if not success:
+                    print(_console(f"❌ YouTube setup failed for channel {shard.name}: {setup_msg}"))
+                    self.stats['failed'] += len(shard_plan)
+                    continue
+                shard.authenticated = True
+            runnable.append((shard, shard_plan))
+        
+        if not runnable:
+            return len(plan)
+        
+        print(_console(f"🧵 Uploading to {len(runnable)} channel(s) with "
+                       f"{sum(shard.workers for shard, _ in runnable)} workers in total"))
+        with ThreadPoolExecutor(max_workers=len(runnable), thread_name_prefix="channel") as pool:
+            futures = [pool.submit(self._parallel_upload, shard_plan, shard.workers, privacy_status, auto_spread,
+                                   upload_history, shard.uploader, len(plan))
+                       for shard, shard_plan in runnable]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(_console(f"❌ Channel worker error: {e}"))
+        
+        return len(plan)
+    
+    def find_video_files(self, directory, recursive=False):
+        """Find all video files in directory - specifically *-audio.mp4 files for SpiderCat"""
+        return [entry.path for entry in scan_video_directory(directory, recursive=recursive)]
     
     def find_metadata(self, video_path):
         """Find corresponding JSON metadata for video"""
@@ -700,26 +4468,111 @@ Generator: Memescreamer v0.5-dev
             self._metadata_cache[cache_key] = metadata
         return metadata
     
-    def load_upload_history(self, directory):
-        """Load upload history"""
-        log_path = Path(directory) / self.uploaded_log
-        if log_path.exists():
-            history = _safe_read_json(log_path)
-            if history:
-                return history
-            else:
-                log_path.unlink(missing_ok=True)
-        return {}
+    def history_paths(self, directory, history_path=None):
+        """(SQLite database, legacy JSON snapshot) for a directory or an explicit --history path"""
+        path = Path(history_path) if history_path else Path(directory) / self.uploaded_log
+        if path.suffix.lower() in ('.json', '.jsonl'):
+            return path.with_suffix('.db'), path.with_suffix('.json')
+        return path, path.with_suffix('.json')
+    
+    def load_upload_history(self, directory, history_path=None, read_only=False):
+        """Open the SQLite upload history, importing any legacy JSON snapshot and journal.
+
+        read_only (dry runs) leaves the directory untouched; see UploadHistoryDB.
+        """
+        db_path, legacy_path = self.history_paths(directory, history_path)
+        return UploadHistoryDB(db_path, legacy_path, read_only=read_only).load()
     
-    def save_upload_history(self, directory, history):
-        """Save upload history"""
+    def save_upload_history(self, directory, history, force=False):
+        """Checkpoint upload history; completed uploads are already durable when recorded"""
+        if isinstance(history, (UploadLedger, UploadHistoryDB)):
+            return history.compact(force=force)
         log_path = Path(directory) / self.uploaded_log
         return _safe_write_json(log_path, history)
     
+    def query_history(self, directory, kind, hours=24, match=None, history_path=None):
+        """Print upload history rows: scheduled releases or uploads within `hours`, or lookups by video/title/file.
+
+        Read-only: the directory is left as it was, even if its history is still legacy JSON.
+        """
+        history = self.load_upload_history(directory, history_path, read_only=True)
+        now = datetime.now(UTC)
+        try:
+            if kind == 'scheduled':
+                rows = history.scheduled_between(now, now + timedelta(hours=hours))
+                heading = f"📅 Scheduled releases in the next {hours:g}h"
+            elif kind == 'recent':
+                since = (datetime.now() - timedelta(hours=hours)).isoformat()
+                rows = history.query("upload_time >= ?", (since,))
+                heading = f"🕘 Uploaded in the last {hours:g}h"
+            elif kind == 'processing':
+                since = (datetime.now() - timedelta(hours=hours)).isoformat()
+                rows = history.query("processing_state IN ('pending', 'failed') AND upload_time >= ?", (since,))
+                heading = f"⚙️ Not yet processed by YouTube, uploaded in the last {hours:g}h"
+            elif not match:
+                print(f"❌ --query {kind} needs --match")
+                return []
+            elif kind == 'video':
+                rows = history.query("video_id = ?", (match,))
+                heading = f"🔎 Video {match}"
+            else:
+                column = 'title' if kind == 'title' else 'file_name'
+                rows = history.query(f"{column} LIKE ?", (f"%{match}%",))
+                heading = f"🔎 {column} containing '{match}'"
+        finally:
+            total = len(history)
+            history.close()
+        
+        print(_console(f"{heading}: {len(rows)} of {total} recorded upload(s)"))
+        for entry in rows:
+            when = entry.get('scheduled_time') or 'immediate'
+            if when != 'immediate':
+                when = datetime.fromisoformat(when.replace('Z', '+00:00')).astimezone(LOCAL_TZ).strftime('%Y-%m-%d %H:%M')
+            channel = f" [{entry['channel']}]" if entry.get('channel') else ""
+            processing = entry.get('processing') or {}
+            state = ""
+            if processing:
+                detail = (processing.get('rejection_reason') or processing.get('failure_reason')
+                          or processing.get('processing_failure_reason') or processing.get('upload_status'))
+                state = f"  <{processing.get('state')}: {detail}>"
+            print(_console(f"   {when:<16}  {entry.get('video_id', '?'):<11}{channel}  "
+                           f"{entry.get('file_name', '?')}  {entry.get('title', '')}{state}"))
+        return rows
+    
+    def track_all_channels(self, upload_history, keys=None, timeout=3600):
+        """track_processing for the default channel, or for every authenticated shard of the channel pool"""
+        deadline = time.monotonic() + timeout
+        uploaders = ([shard.uploader for shard in self.channel_pool.shards if shard.authenticated]
+                     if self.channel_pool else [self.uploader])
+        settled = True
+        for target in uploaders:
+            if target.youtube_service:
+                settled = self.track_processing(upload_history, keys, max(0.0, deadline - time.monotonic()),
+                                                target) and settled
+        return settled
+    
+    def track_processing(self, upload_history, keys=None, timeout=3600, uploader=None):
+        """Poll YouTube processing for recent uploads (or just `keys`) until they settle or timeout passes"""
+        tracker = ProcessingTracker(uploader or self.uploader, upload_history)
+        pending = [key for key, _ in tracker.candidates(datetime.now() - timedelta(days=tracker.track_days))
+                   if keys is None or key in keys]
+        if not pending:
+            return True
+        channel = f" on channel {tracker.uploader.channel}" if tracker.uploader.channel else ""
+        print(_console(f"⚙️ Tracking YouTube processing of {len(pending)} video(s){channel}, "
+                       f"up to {timeout / 60:.0f} min"))
+        settled = tracker.wait(keys, timeout)
+        stats = tracker.stats
+        print(_console(f"   ⚙️ Processing: {stats['processed']} processed, {stats['failed']} failed, "
+                       f"{'all settled' if settled else 'some still pending'} "
+                       f"({stats['checks']} checks in {stats['calls']} videos.list call(s), {stats['calls']} quota units)"))
+        return settled
+    
     def upload_single_video(self, video_path, privacy_status="private", algorithm_optimization="trending", 
                            category_id="25", custom_title="", custom_description="", custom_hashtags="",
                            credentials_path="", token_path="", dry_run=False, auto_playlist=False,
-                           playlist_prefix="Uploaded Content", playlist_description="Automated content uploads"):
+                           playlist_prefix="Uploaded Content", playlist_description="Automated content uploads",
+                           playlist_privacy=None):
         """Upload a single video with SpiderCat metadata and disclaimers"""
         try:
             video_path = str(video_path)
@@ -825,18 +4678,30 @@ Generator: Memescreamer v0.5-dev
             print(_console(f"   📄 Description length: {len(final_description)} chars"))
             print(_console(f"   ✅ Disclaimer: INCLUDED"))
             
-            # Upload to YouTube
+            # Upload to YouTube, resuming an interrupted session for this file if one was saved
+            self.uploader.session_store = UploadSessionStore(Path(video_path).parent / self.sessions_log)
+            fingerprints = FingerprintIndex(Path(video_path).parent / self.fingerprint_log)
+            file_key = fingerprints.fingerprint(video_path)
+            fingerprints.save()
             video_id, upload_result = self.uploader.upload_video(
                 video_path=video_path,
                 title=title,
                 description=final_description,
                 privacy_status=privacy_status,
-                tags=[tag.replace('#', '').strip() for tag in hashtags if tag.strip()]
+                tags=[tag.replace('#', '').strip() for tag in hashtags if tag.strip()],
+                file_key=file_key
             )
             
             if video_id:
                 print(_console(f"   ✅ Success! Video ID: {video_id}"))
                 print(_console(f"   🔗 URL: https://www.youtube.com/watch?v={video_id}"))
+                if auto_playlist:
+                    playlists = PlaylistAssigner(self.uploader, Path(token_path).parent / self.playlist_log,
+                                                 playlist_prefix, playlist_description,
+                                                 playlist_privacy or privacy_status)
+                    playlists.queue(file_key, video_id)
+                    if playlists.flush():
+                        print(_console(f"   📂 Added to playlist: {playlists.title_for()}"))
                 return {
                     "success": True,
                     "video_id": video_id,
@@ -882,6 +4747,8 @@ def main():
     parser.add_argument('--token', default="../youtube_config/token.json",
                        help='Path to YouTube API token file')
     
+    parser.add_argument('--api-root', help='Send API calls to this root URL instead of Google, without OAuth '
+                       '(for local stand-ins such as benchmarks/fake_youtube_api.py)')
     parser.add_argument('--batch', action='store_true', help='Non-interactive batch mode')
     parser.add_argument('--ascii-console', action='store_true', help='Strip non-ASCII from console output')
     
@@ -891,11 +4758,98 @@ def main():
     parser.add_argument('--auto-spread', action='store_true', help='Automatically spread uploads over time')
     parser.add_argument('--schedule-delay', type=int, default=10, help='Minutes between uploads (default: 10)')
     parser.add_argument('--schedule-start', help='Start time for uploads in HH:MM format')
+    parser.add_argument('--blackout', metavar='WINDOWS',
+                       help='With --auto-spread, never schedule releases in these local times, e.g. "00:30-07:00,12:00-12:30"')
+    parser.add_argument('--daily-cap', type=int,
+                       help='With --auto-spread, at most this many releases per local day, counting earlier runs')
     parser.add_argument('--daemon', action='store_true', help='Run in daemon mode')
+    parser.add_argument('--settle-seconds', type=float, default=15,
+                       help='Daemon: seconds a file size must stay unchanged before upload (default: 15)')
+    parser.add_argument('--poll-interval', type=float, default=30,
+                       help='Daemon: rescan interval when inotify is unavailable (default: 30)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Daemon: start uploading renders while they are still being written and finish '
+                            'when the completion marker or the JSON sidecar appears')
+    parser.add_argument('--stream-marker', default='.done',
+                       help='Daemon --stream: suffix of the completion marker file, e.g. video.mp4.done (default: .done)')
+    parser.add_argument('--stall-timeout', type=float, default=600,
+                       help='Daemon --stream: give up (keeping the session resumable) on a render that has not '
+                            'grown for this many seconds (default: 600)')
+    parser.add_argument('--recursive', action='store_true',
+                       help='Also scan date-partitioned subdirectories in bulk mode')
+    parser.add_argument('--history', help='Shared upload history database, to dedupe across directories '
+                       '(default: spidercat_uploaded_videos.db in the upload directory; a .json path '
+                       'uses the .db beside it and imports the JSON)')
+    parser.add_argument('--query', choices=['scheduled', 'recent', 'processing', 'video', 'title', 'file'],
+                       help='Query the upload history of the directory (or --history) instead of uploading: '
+                            'releases scheduled in the next --hours, uploads in the last --hours, uploads '
+                            'YouTube has not finished or failed processing, or lookups by video id / title / '
+                            'file name with --match')
+    parser.add_argument('--track', action='store_true',
+                       help='Follow YouTube processing of uploads with batched videos.list calls (1 quota unit '
+                            'per 50 videos) and record it in the history: after a bulk run, inside the daemon, '
+                            'or on its own for a directory')
+    parser.add_argument('--track-timeout', type=float, default=60,
+                       help='Minutes to keep polling processing after a bulk run or on its own (default: 60)')
+    parser.add_argument('--hours', type=float, default=24, help='Window for --query scheduled/recent/processing (default: 24)')
+    parser.add_argument('--match', help='Video id, or title / file name substring, for --query')
+    parser.add_argument('--verify-hash', action='store_true',
+                       help='Confirm fingerprint matches with a full-file SHA-256 before skipping')
+    parser.add_argument('--quota-limit', type=int, default=10000,
+                       help='Daily YouTube Data API quota units for this project (default: 10000)')
+    parser.add_argument('--insert-cost', type=int, default=1600,
+                       help='Quota units charged per videos.insert (default: 1600)')
+    parser.add_argument('--quota-wait', action='store_true',
+                       help='Sleep until the Pacific-midnight quota reset instead of deferring uploads')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Number of parallel upload workers for bulk mode (default: 1)')
+    
+    parser.add_argument('--validate', action='store_true',
+                       help='Check every video with ffprobe (container, duration, codecs, resolution) '
+                            'before uploading and skip broken renders')
+    parser.add_argument('--quarantine', nargs='?', const='', metavar='DIR',
+                       help='With --validate, move rejected videos and sidecars here '
+                            '(default: .spidercat_quarantine in the upload directory)')
+    parser.add_argument('--ffprobe', default='ffprobe', help='ffprobe executable for --validate (default: ffprobe)')
+    parser.add_argument('--min-duration', type=float, default=1.0,
+                       help='With --validate, reject videos shorter than this many seconds (default: 1)')
+    parser.add_argument('--max-upload-rate', metavar='RATE',
+                       help='Cap combined upload bandwidth of all workers, e.g. 2M (bytes/s), 500K or 20Mbit')
+    parser.add_argument('--per-upload-rate', metavar='RATE', help='Cap the bandwidth of each individual upload')
+    parser.add_argument('--bandwidth-profile', metavar='PROFILES',
+                       help='Time-of-day upload rates in local time overriding --max-upload-rate, '
+                            'e.g. "18:00-23:30=1M,23:30-07:00=unlimited"')
+    parser.add_argument('--chunk-size', default='auto', metavar='MB',
+                       help='Upload chunk size in MiB (rounded to 256 KiB), or "auto" to tune it '
+                            'from measured throughput and error rate (default: auto, starting at 8)')
+    parser.add_argument('--transport', choices=['httplib2', 'pooled'], default='httplib2',
+                       help='HTTP transport: httplib2 (one connection per worker) or pooled '
+                            '(keep-alive connection pool shared by all workers; default: httplib2)')
+    parser.add_argument('--faststart', action='store_true',
+                       help='Remux videos whose moov atom is at the end (stream copy, +faststart) '
+                            'ahead of the uploaders; originals are never modified')
+    parser.add_argument('--ffmpeg', default='ffmpeg', help='ffmpeg executable for --faststart (default: ffmpeg)')
+    parser.add_argument('--distributed', action='store_true',
+                       help='Bulk: share the directory with uploader processes on other nodes (or this host); '
+                            'files are claimed through lease files in .spidercat_claims')
+    parser.add_argument('--node-id', help='With --distributed, a stable name for this instance so its interrupted '
+                       'upload sessions resume after a restart (default: host name)')
+    parser.add_argument('--lease-seconds', type=float, default=120,
+                       help='With --distributed, reclaim a file once this node has seen its lease go unrenewed '
+                            'for this long (default: 120)')
+    parser.add_argument('--channels', metavar='FILE',
+                       help='JSON credentials pool: upload to several channels, each with its own token, '
+                            'quota and workers, routed by sidecar field or round-robin')
     
-    parser.add_argument('--auto-playlist', action='store_true', help='Automatically assign videos to daily playlists')
+    parser.add_argument('--auto-playlist', action='store_true',
+                       help='Add videos to a daily playlist ("<prefix> YYYY-MM-DD" of their release day); playlist '
+                            'ids are cached next to the token and additions queued until the batch is done')
     parser.add_argument('--playlist-prefix', default="Doomscroll.FM", help="Playlist name prefix")
     parser.add_argument('--playlist-description', default="AI-generated content from Doomscroll.FM", help='Playlist description')
+    parser.add_argument('--playlist-privacy', choices=['private', 'public', 'unlisted'],
+                       help='Privacy of playlists --auto-playlist creates (default: same as --privacy). Videos '
+                            'scheduled with --auto-spread upload as private, so pick public here if their '
+                            'playlist should be visible once they go live')
     
     args = parser.parse_args()
     
@@ -910,12 +4864,59 @@ def main():
         print("🔒 Videos upload as PRIVATE and become PUBLIC on their scheduled release times")
         print("✅ All uploads will include standard Doomscroll.FM disclaimers")
     
+    if args.daemon:
+        # run_daemon has no counterpart for these; refuse them rather than silently dropping them
+        ignored = [flag for flag, value in (('--validate', args.validate), ('--faststart', args.faststart),
+                                            ('--channels', args.channels), ('--distributed', args.distributed),
+                                            ('--auto-playlist', args.auto_playlist),
+                                            ('--schedule-start', args.schedule_start), ('--limit', args.limit),
+                                            ('--quota-wait', args.quota_wait)) if value]
+        if ignored:
+            parser.error(f"--daemon does not support {', '.join(ignored)}")
+    
     path = Path(args.path)
     if not path.exists():
         print(f"❌ Path not found: {args.path}", file=sys.stderr)
         sys.exit(1)
     
+    if args.query:
+        directory = path if path.is_dir() else path.parent
+        uploader = SpiderCatYouTubeUploaderCLI()
+        uploader.query_history(directory, args.query, hours=args.hours, match=args.match, history_path=args.history)
+        return
+    
+    # Real uploads still fail fast without the Google client; dry runs never import it
+    if not args.dry_run and not load_youtube_api():
+        sys.exit(1)
+    
     uploader = SpiderCatYouTubeUploaderCLI()
+    uploader.uploader.api_root = args.api_root
+    uploader.uploader.request_scopes(YouTubeUploader.feature_scopes(args.track, args.auto_playlist), args.token)
+    uploader.uploader.transport = args.transport
+    uploader.uploader.pool_size = max(16, args.workers * 2)
+    try:
+        uploader.uploader.bandwidth = BandwidthShaper(
+            max_rate=BandwidthShaper.parse_rate(args.max_upload_rate or 0),
+            per_upload_rate=BandwidthShaper.parse_rate(args.per_upload_rate or 0),
+            profiles=BandwidthShaper.parse_profiles(args.bandwidth_profile)
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    if args.chunk_size == 'auto':
+        uploader.uploader.chunk_sizer = ChunkSizer()
+    else:
+        try:
+            uploader.uploader.chunk_sizer = ChunkSizer(float(args.chunk_size) * 1024 * 1024, fixed=True)
+        except ValueError:
+            parser.error(f"--chunk-size must be a number of MiB or 'auto', not {args.chunk_size!r}")
+    try:
+        blackouts = ReleaseSlotAllocator.parse_blackouts(args.blackout)
+    except ValueError as e:
+        parser.error(str(e))
+    shaper = uploader.uploader.bandwidth
+    if shaper.max_rate or shaper.per_upload_rate or shaper.profiles:
+        print(_console(f"🚦 Upload bandwidth now: {shaper.format_rate(shaper.rate_now())} total, "
+                       f"{shaper.format_rate(shaper.per_upload_rate)} per upload"))
     
     if path.is_file():
         result = uploader.upload_single_video(
@@ -926,7 +4927,8 @@ def main():
             dry_run=args.dry_run,
             auto_playlist=args.auto_playlist,
             playlist_prefix=args.playlist_prefix,
-            playlist_description=args.playlist_description
+            playlist_description=args.playlist_description,
+            playlist_privacy=args.playlist_privacy
         )
         
         if result and result["success"]:
@@ -938,11 +4940,61 @@ def main():
             sys.exit(1)
             
     elif path.is_dir():
-        if not args.bulk:
+        if args.track and not args.bulk and not args.daemon:
+            if args.channels:
+                try:
+                    uploader.channel_pool = ChannelPool.load(args.channels, args.credentials,
+                                                             YouTubeUploader.feature_scopes(track=True))
+                except ValueError as e:
+                    print(_console(f"❌ Invalid channels config: {e}"), file=sys.stderr)
+                    sys.exit(1)
+                for shard in uploader.channel_pool.shards:
+                    shard.uploader.api_root = args.api_root
+                    success, setup_msg = shard.uploader.setup_youtube_service(shard.credentials_path, shard.token_path)
+                    if not success:
+                        print(_console(f"❌ YouTube setup failed for channel {shard.name}: {setup_msg}"), file=sys.stderr)
+                        continue
+                    shard.authenticated = True
+                    shard.uploader.quota = uploader.shard_quota(shard, args.quota_limit, args.insert_cost)
+            else:
+                success, setup_msg = uploader.ensure_authentication(args.credentials, args.token)
+                if not success:
+                    print(f"❌ YouTube setup failed: {setup_msg}", file=sys.stderr)
+                    sys.exit(1)
+                uploader.uploader.quota = QuotaBudget(Path(args.token).parent / uploader.quota_log,
+                                                      daily_limit=args.quota_limit, costs={'videos.insert': args.insert_cost})
+            history = uploader.load_upload_history(path, args.history)
+            uploader.track_all_channels(history, timeout=args.track_timeout * 60)
+            history.close()
+        elif not args.bulk and not args.daemon:
             print("❌ Invalid usage:", file=sys.stderr)
             print("   - For single file: python spidercat_youtube_uploader_cli.py video.mp4", file=sys.stderr)
             print("   - For bulk upload: python spidercat_youtube_uploader_cli.py directory/ --bulk", file=sys.stderr)
             sys.exit(1)
+        elif args.daemon:
+            uploader.run_daemon(
+                directory_path=str(path),
+                privacy_status=args.privacy,
+                credentials_path=args.credentials,
+                token_path=args.token,
+                dry_run=args.dry_run,
+                auto_spread=args.auto_spread,
+                schedule_delay=args.schedule_delay,
+                workers=max(1, args.workers),
+                recursive=args.recursive,
+                history_path=args.history,
+                verify_hash=args.verify_hash,
+                quota_limit=args.quota_limit,
+                insert_cost=args.insert_cost,
+                settle_seconds=args.settle_seconds,
+                poll_interval=args.poll_interval,
+                blackouts=blackouts,
+                daily_cap=args.daily_cap,
+                stream=args.stream,
+                stream_marker=args.stream_marker,
+                stall_timeout=args.stall_timeout,
+                track=args.track
+            )
         else:
             uploader.bulk_upload(
                 directory_path=str(path),
@@ -955,7 +5007,31 @@ def main():
                 schedule_start=args.schedule_start,
                 batch=args.batch,
                 auto_playlist=args.auto_playlist,
-                limit=args.limit
+                playlist_prefix=args.playlist_prefix,
+                playlist_description=args.playlist_description,
+                playlist_privacy=args.playlist_privacy,
+                limit=args.limit,
+                workers=max(1, args.workers),
+                recursive=args.recursive,
+                history_path=args.history,
+                verify_hash=args.verify_hash,
+                quota_limit=args.quota_limit,
+                quota_wait=args.quota_wait,
+                insert_cost=args.insert_cost,
+                channels_config=args.channels,
+                validate=args.validate,
+                quarantine=args.quarantine,
+                ffprobe=args.ffprobe,
+                min_duration=args.min_duration,
+                faststart=args.faststart,
+                ffmpeg=args.ffmpeg,
+                blackouts=blackouts,
+                daily_cap=args.daily_cap,
+                distributed=args.distributed,
+                node_id=args.node_id,
+                lease_seconds=args.lease_seconds,
+                track=args.track,
+                track_timeout=args.track_timeout * 60
             )
     else:
         print(f"❌ Invalid path: {args.path}", file=sys.stderr)
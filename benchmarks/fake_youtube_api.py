@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Memescreamer Youtube Bulk Uploader - local fake YouTube Data API
+Copyright (c) 2025 Creative Mayhem Ltd. Licensed under the same dual license
+terms as Memescreamer_Bulk_Youtube_uploader.py (CC BY-NC-SA 4.0 / commercial).
+
+A small stand-in for the parts of YouTube Data API v3 the uploader talks to:
+resumable videos.insert (session start, chunk PUTs, status probes, 308/Range
+semantics), videos.list, videos.update, playlists.list/insert and
+playlistItems.insert. Misbehaviour is configurable so retry, resume and
+quota handling can be exercised without the network:
+
+    --latency      seconds added to every response
+    --bandwidth    server-wide ingest cap in bytes/sec, shared by all sessions
+    --error-rate   fraction of chunk PUTs answered with a 5xx
+    --rate-limit   fraction of chunk PUTs answered with 403 rateLimitExceeded
+    --quota        daily quota units; videos.insert costs 1600, then 403 quotaExceeded
+    --processing-seconds  how long a finished upload stays 'uploaded' before it is 'processed'
+
+Received bytes are counted, not stored. GET /_stats returns counters as JSON.
+
+Usage:
+    python benchmarks/fake_youtube_api.py --port 8765 --error-rate 0.05
+    python Memescreamer_Bulk_Youtube_uploader.py --bulk DIR --api-root http://127.0.0.1:8765/
+"""
+
+import re
+import json
+import time
+import uuid
+import random
+import argparse
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+INSERT_COST = 1600
+LIST_COST = 1
+UPDATE_COST = 50
+PLAYLIST_INSERT_COST = 50
+PLAYLIST_ITEM_COST = 50
+READ_BLOCK = 256 * 1024
+
+
+class TokenBucket:
+    """Shared byte budget refilled at `rate` bytes/sec (None = unlimited)"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = float(rate or 0)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, amount):
+        if not self.rate:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            deficit = -self.tokens
+        if deficit > 0:
+            time.sleep(deficit / self.rate)
+
+
+class FakeYouTubeServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.0, bandwidth=None, error_rate=0.0, rate_limit=0.0,
+                 quota=None, retry_after=None, seed=None, processing_seconds=0.0):
+        super().__init__(address, FakeYouTubeHandler)
+        self.latency = latency
+        self.bucket = TokenBucket(bandwidth)
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.quota = quota
+        self.retry_after = retry_after
+        self.processing_seconds = processing_seconds
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.videos = {}
+        self.playlists = {}  # id -> {"snippet": ..., "items": [video ids]}
+        self.stats = {
+            "connections": 0,
+            "sessions_started": 0,
+            "videos_completed": 0,
+            "chunk_requests": 0,
+            "status_probes": 0,
+            "list_calls": 0,
+            "playlist_list_calls": 0,
+            "playlists_created": 0,
+            "playlist_items_added": 0,
+            "bytes_received": 0,
+            "bytes_committed": 0,
+            "injected_5xx": 0,
+            "injected_rate_limit": 0,
+            "quota_rejections": 0,
+            "quota_used": 0,
+            "started": time.time()
+        }
+
+    @property
+    def root_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.stats[name] += amount
+
+    def charge(self, units):
+        """Spend quota units; False once the daily limit is reached"""
+        with self.lock:
+            if self.quota is not None and self.stats["quota_used"] + units > self.quota:
+                self.stats["quota_rejections"] += 1
+                return False
+            self.stats["quota_used"] += units
+            return True
+
+    def inject(self):
+        """Pick an injected failure for a chunk PUT: None, 'error' or 'rate_limit'"""
+        with self.lock:
+            roll = self.rng.random()
+        if roll < self.error_rate:
+            return "error"
+        if roll < self.error_rate + self.rate_limit:
+            return "rate_limit"
+        return None
+
+    def video_view(self, video):
+        """The video as videos.list reports it now: 'uploaded' with processingDetails until processing ends"""
+        view = {key: value for key, value in video.items() if not key.startswith("_")}
+        left = video.get("_processed_at", 0) - time.time()
+        if left > 0:
+            view["status"] = dict(video["status"], uploadStatus="uploaded")
+            view["processingDetails"] = {"processingStatus": "processing",
+                                         "processingProgress": {"timeLeftMs": str(int(left * 1000))}}
+        else:
+            view["processingDetails"] = {"processingStatus": "succeeded"}
+        return view
+    
+    def snapshot(self):
+        with self.lock:
+            stats = dict(self.stats)
+        stats["uptime_seconds"] = round(time.time() - stats.pop("started"), 3)
+        return stats
+
+
+class FakeYouTubeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.count("connections")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, code, payload=None, headers=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(code)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, code, reason, message, headers=None):
+        self._send(code, {"error": {"code": code, "message": message,
+                                    "errors": [{"domain": "youtube.quota" if reason == "quotaExceeded" else "global",
+                                                "reason": reason, "message": message}]}}, headers)
+
+    def _read_body(self, throttle=False):
+        """Drain the request body in blocks, honouring the shared bandwidth cap"""
+        remaining = int(self.headers.get("Content-Length") or 0)
+        received = 0
+        while remaining > 0:
+            block = self.rfile.read(min(READ_BLOCK, remaining))
+            if not block:
+                break
+            if throttle:
+                self.server.bucket.consume(len(block))
+            remaining -= len(block)
+            received += len(block)
+        return received
+
+    def _delay(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self._delay()
+        if url.path == "/_stats":
+            return self._send(200, self.server.snapshot())
+        if url.path == "/youtube/v3/videos":
+            if not self.server.charge(LIST_COST):
+                return self._error(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+            ids = parse_qs(url.query).get("id", [""])[0].split(",")
+            self.server.count("list_calls")
+            with self.server.lock:
+                items = [self.server.video_view(self.server.videos[i]) for i in ids if i in self.server.videos]
+            return self._send(200, {"kind": "youtube#videoListResponse", "items": items,
+                                    "pageInfo": {"totalResults": len(items), "resultsPerPage": len(items)}})
+        if url.path == "/youtube/v3/playlists":
+            if not self.server.charge(LIST_COST):
+                return self._error(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+            self.server.count("playlist_list_calls")
+            query = parse_qs(url.query)
+            size = int(query.get("maxResults", ["5"])[0])
+            start = int(query.get("pageToken", ["0"])[0])
+            with self.server.lock:
+                playlists = [{"kind": "youtube#playlist", "id": playlist_id, "snippet": playlist["snippet"]}
+                             for playlist_id, playlist in self.server.playlists.items()]
+            payload = {"kind": "youtube#playlistListResponse", "items": playlists[start:start + size],
+                       "pageInfo": {"totalResults": len(playlists), "resultsPerPage": size}}
+            if start + size < len(playlists):
+                payload["nextPageToken"] = str(start + size)
+            return self._send(200, payload)
+        self._error(404, "notFound", f"No fake handler for GET {url.path}")
+
+    def _insert_playlist(self, body):
+        if not self.server.charge(PLAYLIST_INSERT_COST):
+            return self._error(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+        playlist_id = "PL" + uuid.uuid4().hex[:16]
+        with self.server.lock:
+            self.server.playlists[playlist_id] = {"snippet": body.get("snippet", {}), "items": []}
+        self.server.count("playlists_created")
+        self._send(200, {"kind": "youtube#playlist", "id": playlist_id, "snippet": body.get("snippet", {}),
+                         "status": body.get("status", {})})
+
+    def _insert_playlist_item(self, body):
+        snippet = body.get("snippet", {})
+        if not self.server.charge(PLAYLIST_ITEM_COST):
+            return self._error(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+        video_id = snippet.get("resourceId", {}).get("videoId")
+        with self.server.lock:
+            playlist = self.server.playlists.get(snippet.get("playlistId"))
+            if playlist is not None:
+                playlist["items"].append(video_id)
+        if playlist is None:
+            return self._error(404, "playlistNotFound", f"Playlist not found: {snippet.get('playlistId')}")
+        self.server.count("playlist_items_added")
+        self._send(200, {"kind": "youtube#playlistItem", "id": uuid.uuid4().hex, "snippet": snippet})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path in ("/youtube/v3/playlists", "/youtube/v3/playlistItems"):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+            self._delay()
+            if url.path == "/youtube/v3/playlists":
+                return self._insert_playlist(body)
+            return self._insert_playlist_item(body)
+        self._read_body()
+        self._delay()
+        if url.path != "/upload/youtube/v3/videos" or parse_qs(url.query).get("uploadType") != ["resumable"]:
+            return self._error(404, "notFound", f"No fake handler for POST {url.path}")
+        if not self.server.charge(INSERT_COST):
+            return self._error(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+
+        session_id = uuid.uuid4().hex
+        total = self.headers.get("X-Upload-Content-Length")
+        with self.server.lock:
+            self.server.sessions[session_id] = {"committed": 0, "total": int(total) if total else None}
+        self.server.count("sessions_started")
+        self._send(200, headers={"Location": f"{self.server.root_url}upload/youtube/v3/videos/session/{session_id}"})
+
+    def _update_video(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self._delay()
+        if not self.server.charge(UPDATE_COST):
+            return self._error(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+        with self.server.lock:
+            video = self.server.videos.get(body.get("id"))
+            if video is not None:
+                video["snippet"] = body.get("snippet", {})
+                video = self.server.video_view(video)
+        if video is None:
+            return self._error(404, "videoNotFound", f"Video not found: {body.get('id')}")
+        self._send(200, video)
+
+    def do_PUT(self):
+        if urlparse(self.path).path == "/youtube/v3/videos":
+            return self._update_video()
+        match = re.match(r"^/upload/youtube/v3/videos/session/([0-9a-f]+)$", urlparse(self.path).path)
+        content_range = self.headers.get("Content-Range", "")
+        probe = content_range.startswith("bytes */")
+        received = self._read_body(throttle=not probe)
+        self._delay()
+
+        with self.server.lock:
+            session = self.server.sessions.get(match.group(1)) if match else None
+        if session is None:
+            return self._error(404, "notFound", "Upload session not found or expired")
+
+        if probe:
+            self.server.count("status_probes")
+            # "bytes */N" announces the total, which finalizes an upload whose bytes all arrived
+            announced = content_range[len("bytes */"):]
+            if announced.isdigit():
+                with self.server.lock:
+                    session["total"] = int(announced)
+        else:
+            self.server.count("chunk_requests")
+            self.server.count("bytes_received", received)
+            failure = self.server.inject()
+            if failure == "error":
+                self.server.count("injected_5xx")
+                headers = {"Retry-After": str(self.server.retry_after)} if self.server.retry_after is not None else None
+                return self._error(503, "backendError", "Injected backend error", headers)
+            if failure == "rate_limit":
+                self.server.count("injected_rate_limit")
+                return self._error(403, "rateLimitExceeded", "Injected rate limit")
+
+            chunk = re.match(r"bytes (\d+)-(\d+)/(\d+|\*)", content_range)
+            if not chunk:
+                return self._error(400, "badContent", f"Unparseable Content-Range: {content_range!r}")
+            start, end, total = int(chunk.group(1)), int(chunk.group(2)), chunk.group(3)
+            with self.server.lock:
+                if total != "*":
+                    session["total"] = int(total)
+                # Bytes behind the committed offset are a retransmission; gaps are ignored like the real API
+                if start <= session["committed"] <= end:
+                    self.server.stats["bytes_committed"] += end + 1 - session["committed"]
+                    session["committed"] = end + 1
+
+        with self.server.lock:
+            committed, total = session["committed"], session["total"]
+            done = total is not None and committed >= total
+            if done and "video" not in session:
+                video_id = uuid.uuid4().hex[:11]
+                session["video"] = {"kind": "youtube#video", "id": video_id,
+                                    "status": {"uploadStatus": "processed", "privacyStatus": "private"}}
+                if self.server.processing_seconds:
+                    session["video"]["_processed_at"] = time.time() + self.server.processing_seconds
+                self.server.videos[video_id] = session["video"]
+                self.server.stats["videos_completed"] += 1
+
+        if done:
+            with self.server.lock:
+                video = self.server.video_view(session["video"])
+            return self._send(200, video)
+        headers = {"Range": f"bytes=0-{committed - 1}"} if committed else None
+        self._send(308, headers=headers)
+
+
+def serve(host="127.0.0.1", port=0, **options):
+    """Start a fake server on a background thread; call .shutdown() when done"""
+    server = FakeYouTubeServer((host, port), **options)
+    threading.Thread(target=server.serve_forever, name="fake-youtube-api", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local fake YouTube Data API for upload testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--bandwidth", type=float, help="Server-wide ingest cap in bytes/sec")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of chunk PUTs answered with 503")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Fraction of chunk PUTs answered with 403 rateLimitExceeded")
+    parser.add_argument("--retry-after", type=int, help="Retry-After seconds sent with injected 503s")
+    parser.add_argument("--quota", type=int, help="Quota units before 403 quotaExceeded (default: unlimited)")
+    parser.add_argument("--seed", type=int, help="Random seed for injected failures")
+    parser.add_argument("--processing-seconds", type=float, default=0.0,
+                        help="Seconds a finished upload reports 'uploaded' before 'processed' (default: 0)")
+    args = parser.parse_args()
+
+    server = FakeYouTubeServer((args.host, args.port), latency=args.latency, bandwidth=args.bandwidth,
+                               error_rate=args.error_rate, rate_limit=args.rate_limit, quota=args.quota,
+                               retry_after=args.retry_after, seed=args.seed,
+                               processing_seconds=args.processing_seconds)
+    print(f"🧪 Fake YouTube API listening on {server.root_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.snapshot(), indent=2))
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
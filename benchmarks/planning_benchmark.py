@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Memescreamer Youtube Bulk Uploader - offline planning benchmark
+Copyright (c) 2025 Creative Mayhem Ltd. Licensed under the same dual license
+terms as Memescreamer_Bulk_Youtube_uploader.py (CC BY-NC-SA 4.0 / commercial).
+
+Builds synthetic SpiderCat trees (*-audio.mp4 renders plus JSON sidecars) of
+1k, 10k and 100k files in a temp directory and times every planning stage of
+a bulk upload on its own - directory scan, _file_key stat/resolve, content
+fingerprints, sidecar lookup and parsing, title/description rendering and
+the per-file console output through _console - followed by a dry-run bulk
+upload end to end, first with empty caches and then with the fingerprint and
+metadata caches a real run would have written.
+Nothing touches the network. Results are written as JSON; pass an earlier
+results file to --compare to see the change per stage between commits.
+
+Usage:
+    python benchmarks/planning_benchmark.py
+    python benchmarks/planning_benchmark.py --sizes 1000,10000 --per-dir 500 --output planning_results.json
+    python benchmarks/planning_benchmark.py --output new.json --compare planning_results.json
+"""
+
+import io
+import os, sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import contextlib
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+from render_benchmark import synthetic_script, timed, git_commit
+
+
+def build_tree(directory, count, per_dir, size_kb, seed):
+    """Write `count` renders with sidecars, flat or in subdirectories of `per_dir` files"""
+    rng = random.Random(seed)
+    padding = os.urandom(max(0, size_kb * 1024 - 8))
+    for i in range(count):
+        folder = directory / f"{i // per_dir:04d}" if per_dir else directory
+        if per_dir and i % per_dir == 0:
+            folder.mkdir()
+        stem = f"render_{i:06d}"
+        with open(folder / f"{stem}-audio.mp4", "wb") as f:
+            f.write(i.to_bytes(8, "big"))
+            f.write(padding)
+        with open(folder / f"{stem}.json", "w", encoding="utf-8") as f:
+            json.dump({"ai_commentary": {"script": synthetic_script(rng)}}, f, ensure_ascii=False)
+
+
+def reset_state(directory, workdir):
+    """Drop every cache and history file, so the next run starts cold"""
+    for path in list(directory.glob("spidercat_*")) + list(workdir.glob("spidercat_*")):
+        path.unlink()
+
+
+def console_lines(entries, contents):
+    """The per-file lines a bulk dry run prints, through _console into a discarded stream"""
+    sink = io.StringIO()
+    for i, (entry, content) in enumerate(zip(entries, contents)):
+        print(uploader._console(f"🎬 Processing [{i + 1}/{len(entries)}]: {os.path.basename(entry.path)}"), file=sink)
+        print(uploader._console(f"   📝 Title: {content['title'][:50]}..."), file=sink)
+        print(uploader._console(f"   📄 Description: {content['description'][:50]}..."), file=sink)
+        print(uploader._console(f"   🏷️ Hashtags: {', '.join(content.get('tags', [])[:5])}..."), file=sink)
+        print(uploader._console(f"   ✅ Disclaimer: INCLUDED"), file=sink)
+        print(uploader._console("   🧪 DRY RUN - Would upload to YouTube"), file=sink)
+        if sink.tell() > 1 << 20:
+            sink.seek(0)
+            sink.truncate()
+
+
+def warm_caches(directory, recursive):
+    """Write the fingerprint and metadata caches a real run would leave; dry runs never save them"""
+    cli = uploader.SpiderCatYouTubeUploaderCLI()
+    history = cli.load_upload_history(str(directory), read_only=True)
+    fingerprints = uploader.FingerprintIndex(directory / cli.fingerprint_log)
+    plan = []
+    for entry in uploader.scan_video_directory(directory, recursive=recursive):
+        file_key, content_sha256 = cli.dedupe_key(entry, fingerprints, history)
+        plan.append(uploader.PlannedUpload(len(plan), Path(entry.path), entry.metadata_path, None,
+                                           file_key, content_sha256))
+    fingerprints.save()
+    with contextlib.redirect_stdout(io.StringIO()):
+        cli.preload_metadata(plan, uploader.MetadataManifest(directory / cli.manifest_log))
+
+
+def dry_run(directory, workdir, recursive):
+    cli = uploader.SpiderCatYouTubeUploaderCLI()
+    with contextlib.redirect_stdout(io.StringIO()):
+        cli.bulk_upload(str(directory), dry_run=True, batch=True, recursive=recursive,
+                        token_path=str(workdir / "token.json"), quota_limit=10 ** 12)
+
+
+def run_size(count, per_dir, size_kb, repeat, seed, root):
+    workdir = root / f"tree_{count}"
+    directory = workdir / "batch"
+    directory.mkdir(parents=True)
+    recursive = bool(per_dir)
+
+    start = time.perf_counter()
+    build_tree(directory, count, per_dir, size_kb, seed)
+    build_seconds = time.perf_counter() - start
+
+    entries = uploader.scan_video_directory(directory, recursive=recursive)
+    assert len(entries) == count, f"scan found {len(entries)} of {count} renders"
+    paths = [entry.path for entry in entries]
+
+    def scan():
+        uploader.scan_video_directory(directory, recursive=recursive)
+
+    def file_keys():
+        for entry in entries:
+            uploader._file_key(Path(entry.path), entry.size)
+
+    def fingerprint_cold():
+        index = uploader.FingerprintIndex()
+        for entry in entries:
+            index.fingerprint(entry.path, entry.size, entry.mtime)
+
+    warm_index = uploader.FingerprintIndex()
+    for entry in entries:
+        warm_index.fingerprint(entry.path, entry.size, entry.mtime)
+
+    def fingerprint_warm():
+        for entry in entries:
+            warm_index.fingerprint(entry.path, entry.size, entry.mtime)
+
+    def find_metadata():
+        cli = uploader.SpiderCatYouTubeUploaderCLI()
+        for path in paths:
+            cli.find_metadata(path)
+
+    def parse_sidecars():
+        for entry in entries:
+            uploader._safe_read_json(Path(entry.metadata_path))
+
+    def render():
+        cli = uploader.SpiderCatYouTubeUploaderCLI()
+        for entry in entries:
+            cli.render_upload_content(entry.path, entry.metadata_path)
+
+    renderer = uploader.SpiderCatYouTubeUploaderCLI()
+    contents = [renderer.render_upload_content(entry.path, entry.metadata_path) for entry in entries]
+
+    def console():
+        console_lines(entries, contents)
+
+    def console_ascii():
+        previous = uploader.args
+        uploader.args = argparse.Namespace(ascii_console=True)
+        try:
+            console_lines(entries, contents)
+        finally:
+            uploader.args = previous
+
+    def dry_run_cold():
+        reset_state(directory, workdir)
+        dry_run(directory, workdir, recursive)
+
+    def dry_run_warm():
+        dry_run(directory, workdir, recursive)
+
+    stages = {}
+    print(f"📁 {count:,} renders ({'flat' if not per_dir else f'{per_dir} per folder'}), built in {build_seconds:.1f}s")
+    for name, fn, runs in (("scan", scan, repeat), ("file_key", file_keys, repeat),
+                           ("fingerprint_cold", fingerprint_cold, repeat), ("fingerprint_warm", fingerprint_warm, repeat),
+                           ("find_metadata", find_metadata, repeat), ("parse_sidecars", parse_sidecars, repeat),
+                           ("render", render, repeat), ("console", console, repeat),
+                           ("console_ascii", console_ascii, repeat),
+                           ("dry_run_cold", dry_run_cold, 1), ("dry_run_warm", dry_run_warm, repeat)):
+        if name == "dry_run_warm":
+            warm_caches(directory, recursive)
+        seconds = timed(fn, runs)
+        stages[name] = {"seconds": round(seconds, 6), "per_second": round(count / seconds, 1) if seconds else None}
+        print(f"   ⏱️ {name:<18} {seconds:8.3f}s  {count / seconds:>12,.0f} files/s")
+
+    shutil.rmtree(workdir, ignore_errors=True)
+    return {"files": count, "per_dir": per_dir, "build_seconds": round(build_seconds, 3), "stages": stages}
+
+
+def compare(results, baseline_path):
+    """Print the time change per stage against an earlier results file"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {size["files"]: size["stages"] for size in baseline.get("sizes", [])}
+    print(f"📈 Against {baseline_path} (commit {baseline.get('commit') or '?'}); negative is faster")
+    for size in results["sizes"]:
+        before = previous.get(size["files"])
+        if not before:
+            print(f"   {size['files']:,} renders: not in baseline")
+            continue
+        changes = []
+        for name, stage in size["stages"].items():
+            if name in before and before[name]["seconds"]:
+                changes.append(f"{name} {stage['seconds'] / before[name]['seconds'] - 1:+.1%}")
+        print(f"   {size['files']:,} renders: {', '.join(changes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk-upload planning stages on synthetic trees, offline")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="Comma-separated tree sizes in renders (default: 1000,10000,100000)")
+    parser.add_argument("--per-dir", type=int, default=0,
+                        help="Renders per subdirectory, scanned recursively (default: 0 = one flat folder)")
+    parser.add_argument("--size-kb", type=int, default=4, help="Size of each synthetic render in KiB (default: 4)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage, best time is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=1337, help="Random seed for the synthetic scripts")
+    parser.add_argument("--tmpdir", help="Where to build the trees (default: system temp directory)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    try:
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        parser.error(f"--sizes must be comma-separated integers, not {args.sizes!r}")
+
+    root = Path(tempfile.mkdtemp(prefix="spidercat_plan_", dir=args.tmpdir))
+    try:
+        print(f"🧪 Planning benchmark on {', '.join(f'{size:,}' for size in sizes)} renders (best of {args.repeat})")
+        results = {
+            "benchmark": "planning",
+            "timestamp": datetime.now().isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "per_dir": args.per_dir,
+            "size_kb": args.size_kb,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "sizes": [run_size(size, args.per_dir, args.size_kb, args.repeat, args.seed, root) for size in sizes]
+        }
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    if args.compare:
+        compare(results, args.compare)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Memescreamer Youtube Bulk Uploader - metadata rendering benchmark
+Copyright (c) 2025 Creative Mayhem Ltd. Licensed under the same dual license
+terms as Memescreamer_Bulk_Youtube_uploader.py (CC BY-NC-SA 4.0 / commercial).
+
+Renders synthetic SpiderCat sidecars (ai_commentary.script) through the same
+path bulk uploads use - script -> title/description -> hashtags -> API title
+- and reports throughput per stage, so a nightly job can track regressions.
+
+Usage:
+    python benchmarks/render_benchmark.py
+    python benchmarks/render_benchmark.py --count 100000 --repeat 3 --output render_results.json
+"""
+
+import os, sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+
+WORDS = ("signal", "doomscroll", "markets", "senate", "climate", "robots", "breaking", "latest",
+         "satellite", "election", "weather", "crypto", "football", "summit", "outage", "daily",
+         "news", "update", "pipeline", "memescreamer", "spider", "cat", "broadcast", "static")
+DECORATIONS = ("—", "–", "“", "”", "‘", "’", "#", "🎧", "é", "...", "!", "?")
+
+
+def synthetic_script(rng):
+    """One GPT script shaped like the SpiderCat sidecars: title line, then commentary"""
+    def sentence(lo, hi):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(lo, hi))]
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words)), rng.choice(DECORATIONS))
+        return " ".join(words).capitalize()
+    
+    title = ("# " if rng.random() < 0.3 else "") + sentence(3, 12)
+    lines = [sentence(6, 30) for _ in range(rng.randint(3, 25))]
+    for i in range(min(3, len(lines))):
+        if rng.random() < 0.2:
+            lines[i] = "## " + lines[i]
+    return title + "\n" + "\n".join(lines)
+
+
+def synthetic_sidecars(count, seed, unique_ratio):
+    """Serialized sidecars; unique_ratio < 1 repeats scripts the way reruns do"""
+    rng = random.Random(seed)
+    unique = max(1, int(count * unique_ratio))
+    scripts = [synthetic_script(rng) for _ in range(unique)]
+    return [json.dumps({"ai_commentary": {"script": scripts[i % unique]}}, ensure_ascii=False)
+            for i in range(count)]
+
+
+def timed(fn, repeat):
+    """Best wall-clock time of `repeat` runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run(count, repeat, seed, unique_ratio):
+    sidecars = synthetic_sidecars(count, seed, unique_ratio)
+    disclaimer = uploader.DISCLAIMER_TEMPLATE
+    scripts = [json.loads(raw)["ai_commentary"]["script"] for raw in sidecars]
+    
+    def parse():
+        for raw in sidecars:
+            json.loads(raw)
+    
+    def render_cold():
+        renderer = uploader.MetadataRenderer(cache_size=count + 1)
+        for script in scripts:
+            renderer.render_script(script)
+    
+    warm_renderer = uploader.MetadataRenderer(cache_size=count + 1)
+    for script in scripts:
+        warm_renderer.render_script(script)
+    
+    def render_warm():
+        for script in scripts:
+            warm_renderer.render_script(script)
+    
+    rendered = [warm_renderer.render_script(script) for script in scripts]
+    
+    def hashtags_and_title():
+        for title, _description in rendered:
+            warm_renderer.hashtags(title)
+            uploader.MetadataRenderer.sanitize_title(title)
+    
+    def end_to_end():
+        renderer = uploader.MetadataRenderer(cache_size=count + 1)
+        for raw in sidecars:
+            script = json.loads(raw)["ai_commentary"]["script"]
+            title, description = renderer.render_script(script)
+            renderer.hashtags(title)
+            uploader.MetadataRenderer.sanitize_title(title)
+            description + disclaimer
+    
+    # MetadataRenderer._clean uses chained str.replace; str.translate is the obvious alternative
+    punctuation = uploader.MetadataRenderer._PUNCTUATION
+    table = str.maketrans(dict(punctuation))
+    
+    def punctuation_replace():
+        for script in scripts:
+            for old, new in punctuation:
+                script = script.replace(old, new)
+    
+    def punctuation_translate():
+        for script in scripts:
+            script.translate(table)
+    
+    stages = {}
+    for name, fn in (("parse_sidecar_json", parse), ("render_cold", render_cold), ("render_memoized", render_warm),
+                     ("hashtags_and_api_title", hashtags_and_title), ("end_to_end", end_to_end),
+                     ("punctuation_replace", punctuation_replace), ("punctuation_translate", punctuation_translate)):
+        seconds = timed(fn, repeat)
+        stages[name] = {"seconds": round(seconds, 6), "per_second": round(count / seconds, 1) if seconds else None}
+        print(f"   ⏱️ {name:<24} {seconds:8.3f}s  {count / seconds:>12,.0f}/s")
+    
+    return {
+        "benchmark": "metadata_render",
+        "timestamp": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "count": count,
+        "unique_scripts": max(1, int(count * unique_ratio)),
+        "repeat": repeat,
+        "seed": seed,
+        "stages": stages
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SpiderCat metadata rendering")
+    parser.add_argument("--count", type=int, default=100000, help="Synthetic sidecars to render (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage, best time is reported (default: 3)")
+    parser.add_argument("--seed", type=int, default=1337, help="Random seed for the synthetic scripts")
+    parser.add_argument("--unique-ratio", type=float, default=1.0,
+                        help="Fraction of distinct scripts; lower values model reruns (default: 1.0)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+    
+    print(f"🧪 Rendering {args.count:,} synthetic sidecars (best of {args.repeat})")
+    results = run(args.count, args.repeat, args.seed, args.unique_ratio)
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
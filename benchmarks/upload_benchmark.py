@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Memescreamer Youtube Bulk Uploader - end-to-end upload benchmark
+Copyright (c) 2025 Creative Mayhem Ltd. Licensed under the same dual license
+terms as Memescreamer_Bulk_Youtube_uploader.py (CC BY-NC-SA 4.0 / commercial).
+
+Builds a synthetic batch (videos + SpiderCat sidecars) in a temp directory,
+starts benchmarks/fake_youtube_api.py in a child process and runs the real
+bulk upload path against it - scan, plan, render, resumable upload, retry,
+ledger. Nothing touches the network. Reports uploads/hour, bytes/sec and
+retry overhead (backoff time, retransmitted bytes) so runs are comparable
+between commits. An untimed one-file run goes first so that one-off client
+setup does not count against whichever mode is measured first.
+
+Usage:
+    python benchmarks/upload_benchmark.py
+    python benchmarks/upload_benchmark.py --files 20 --size-mb 32 --workers 4 --error-rate 0.05 --output upload_results.json
+"""
+
+import io
+import os, sys
+import json
+import time
+import shutil
+import random
+import argparse
+import platform
+import tempfile
+import contextlib
+import urllib.request
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+import fake_youtube_api
+from render_benchmark import synthetic_script, git_commit
+
+
+def run_server(ready, options):
+    """Child process entry point: serve until terminated"""
+    server = fake_youtube_api.FakeYouTubeServer(("127.0.0.1", 0), **options)
+    ready.put(server.root_url)
+    server.serve_forever()
+
+
+def build_batch(directory, files, size_mb, seed):
+    """Write `files` videos of `size_mb` MiB with sidecars; content differs per file so fingerprints do too"""
+    rng = random.Random(seed)
+    block = os.urandom(1024 * 1024)
+    for i in range(files):
+        video = directory / f"spidercat_bench_{i:05d}.mp4"
+        with open(video, "wb") as f:
+            f.write(i.to_bytes(8, "big"))
+            for _ in range(size_mb):
+                f.write(block)
+        sidecar = video.with_suffix(".json")
+        sidecar.write_text(json.dumps({"ai_commentary": {"script": synthetic_script(rng)}}), encoding="utf-8")
+
+
+def fetch_stats(root_url):
+    with urllib.request.urlopen(root_url + "_stats", timeout=10) as response:
+        return json.loads(response.read())
+
+
+def run(files, size_mb, workers, server_options, seed, retry_base_delay, verbose, max_upload_rate=None,
+        chunk_size="auto", transport="httplib2"):
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(target=run_server, args=(ready, server_options), daemon=True)
+    server.start()
+    root_url = ready.get(timeout=30)
+    workdir = Path(tempfile.mkdtemp(prefix="spidercat_bench_"))
+    try:
+        batch_dir = workdir / "batch"
+        batch_dir.mkdir()
+        build_batch(batch_dir, files, size_mb, seed)
+        payload = sum(p.stat().st_size for p in batch_dir.glob("*.mp4"))
+
+        cli = uploader.SpiderCatYouTubeUploaderCLI()
+        cli.uploader.api_root = root_url
+        cli.uploader.retry_policy.base_delay = retry_base_delay
+        cli.uploader.bandwidth = uploader.BandwidthShaper(max_rate=max_upload_rate)
+        cli.uploader.transport = transport
+        cli.uploader.chunk_sizer = (uploader.ChunkSizer() if chunk_size == "auto" else
+                                    uploader.ChunkSizer(float(chunk_size) * 1024 * 1024, fixed=True))
+        token_path = str(workdir / "token.json")
+
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        start = time.perf_counter()
+        with output:
+            cli.bulk_upload(str(batch_dir), privacy_status="private", token_path=token_path, batch=True,
+                            workers=workers, quota_limit=10 ** 9)
+        elapsed = time.perf_counter() - start
+        server_stats = fetch_stats(root_url)
+    finally:
+        server.terminate()
+        server.join(5)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    retry_stats = cli.uploader.retry_policy.stats
+    uploaded = cli.stats["uploaded"]
+    retransmitted = max(0, server_stats["bytes_received"] - server_stats["bytes_committed"])
+    return {
+        "benchmark": "upload_end_to_end",
+        "timestamp": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "files": files,
+        "size_mb": size_mb,
+        "workers": workers,
+        "seed": seed,
+        "max_upload_rate": max_upload_rate,
+        "chunk_size": chunk_size,
+        "transport": transport,
+        "server": server_options,
+        "results": {
+            "seconds": round(elapsed, 3),
+            "uploaded": uploaded,
+            "failed": cli.stats["failed"],
+            "payload_bytes": payload,
+            "uploads_per_hour": round(uploaded * 3600 / elapsed, 1) if elapsed else None,
+            "bytes_per_second": round(server_stats["bytes_committed"] / elapsed, 1) if elapsed else None,
+            "throttled_seconds": round(cli.uploader.bandwidth.stats["throttled_seconds"], 3),
+            "retries": retry_stats["retries"],
+            "backoff_seconds": round(retry_stats["backoff_seconds"], 3),
+            "breaker_trips": retry_stats["breaker_trips"],
+            "retransmitted_bytes": retransmitted,
+            "retransmit_overhead": round(retransmitted / payload, 4) if payload else 0.0,
+            "chunking": cli.uploader.chunk_sizer.summary(),
+            "server": server_stats
+        }
+    }
+
+
+def report(label, r):
+    chunking = r["chunking"]
+    print(f"   [{label} chunks] ⏱️ {r['seconds']:.2f}s  ✅ {r['uploaded']} uploaded  ❌ {r['failed']} failed")
+    print(f"   🚀 {r['uploads_per_hour']:,.0f} uploads/hour  📶 {r['bytes_per_second'] / 1048576:,.1f} MiB/s")
+    print(f"   🔁 {r['retries']} retries, {r['backoff_seconds']:.1f}s backoff, "
+          f"{r['retransmitted_bytes'] / 1048576:.1f} MiB retransmitted ({r['retransmit_overhead']:.1%})")
+    print(f"   🔌 {r['server']['connections']} connections for {r['server']['chunk_requests']} chunk requests")
+    if chunking["mean_size"]:
+        print(f"   📦 {chunking['chunks']} chunks, mean {chunking['mean_size'] / 1048576:.2f} MiB, "
+              f"final {chunking['final_size'] / 1048576:.2f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk uploads against a local fake YouTube API")
+    parser.add_argument("--files", type=int, default=10, help="Synthetic videos in the batch (default: 10)")
+    parser.add_argument("--size-mb", type=int, default=16, help="Size of each video in MiB (default: 16)")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel upload workers (default: 1)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake server latency per response in seconds")
+    parser.add_argument("--bandwidth", type=float, help="Fake server ingest cap in bytes/sec")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of chunks answered with 503")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Fraction of chunks answered with 403 rateLimitExceeded")
+    parser.add_argument("--max-upload-rate", help="Uploader bandwidth cap, e.g. 2M or 20Mbit (default: unlimited)")
+    parser.add_argument("--chunk-size", default="auto", help="Chunk size in MiB or 'auto' (default: auto)")
+    parser.add_argument("--transport", choices=["httplib2", "pooled"], default="httplib2",
+                        help="Uploader HTTP transport (default: httplib2)")
+    parser.add_argument("--compare", action="store_true",
+                        help="Also run with the old fixed 8 MiB chunks and report the difference")
+    parser.add_argument("--retry-base-delay", type=float, default=1.0,
+                        help="Uploader backoff base delay in seconds (default: 1.0, as in production)")
+    parser.add_argument("--seed", type=int, default=1337, help="Random seed for content and injected failures")
+    parser.add_argument("--verbose", action="store_true", help="Show the uploader's own output")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    server_options = {"latency": args.latency, "bandwidth": args.bandwidth, "error_rate": args.error_rate,
+                      "rate_limit": args.rate_limit, "seed": args.seed}
+    max_upload_rate = uploader.BandwidthShaper.parse_rate(args.max_upload_rate or 0)
+    print(f"🧪 Uploading {args.files} x {args.size_mb} MiB with {args.workers} worker(s) to a local fake API")
+    # The first run in a process pays for imports and client setup; keep that out of the timed runs
+    run(1, 1, 1, {"seed": args.seed}, args.seed, args.retry_base_delay, False, transport=args.transport)
+    results = run(args.files, args.size_mb, args.workers, server_options, args.seed,
+                  args.retry_base_delay, args.verbose, max_upload_rate, args.chunk_size, args.transport)
+    report(args.chunk_size, results["results"])
+
+    if args.compare:
+        baseline = run(args.files, args.size_mb, args.workers, server_options, args.seed,
+                       args.retry_base_delay, args.verbose, max_upload_rate, "8", args.transport)
+        report("8", baseline["results"])
+        gain = results["results"]["bytes_per_second"] / baseline["results"]["bytes_per_second"] - 1
+        print(f"   📈 {args.chunk_size} vs fixed 8 MiB chunks: {gain:+.1%} bytes/sec, "
+              f"{results['results']['retransmit_overhead']:.1%} vs {baseline['results']['retransmit_overhead']:.1%} "
+              f"retransmitted")
+        results["baseline"] = baseline["results"]
+        results["gain_vs_baseline"] = round(gain, 4)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
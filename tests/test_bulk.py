@@ -0,0 +1,73 @@
+import os, sys
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+
+
+def write_render(directory, stem, sidecar=True, payload=b"render"):
+    video = directory / f"{stem}-audio.mp4"
+    video.write_bytes(payload * 1000)
+    if sidecar:
+        (directory / f"{stem}.json").write_text(json.dumps({"ai_commentary": {"script": f"{stem}\nBody"}}),
+                                                encoding="utf-8")
+    return video
+
+
+def tree(root):
+    return {path: (path.stat().st_size, path.stat().st_mtime_ns) for path in root.rglob("*")}
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    batch = tmp_path / "batch"
+    batch.mkdir()
+    for i in range(3):
+        write_render(batch, f"v{i}", payload=bytes([i]) * 8)
+    (batch / "spidercat_uploaded_videos.json").write_text(json.dumps(
+        {"old": {"video_id": "vid00000000", "upload_time": "2025-01-01T00:00:00", "file_name": "old.mp4"}}),
+        encoding="utf-8")
+    before = tree(tmp_path)
+
+    cli = uploader.SpiderCatYouTubeUploaderCLI()
+    cli.bulk_upload(str(batch), dry_run=True, batch=True, auto_spread=True,
+                    token_path=str(tmp_path / "token.json"))
+
+    assert tree(tmp_path) == before
+
+
+def test_duplicate_render_keeps_copy_with_sidecar(tmp_path, capsys):
+    write_render(tmp_path, "copy", sidecar=False)
+    original = write_render(tmp_path, "v1")
+
+    cli = uploader.SpiderCatYouTubeUploaderCLI()
+    planned = []
+    preload = cli.preload_metadata
+
+    def record(plan, manifest, save=True):
+        planned.extend(plan)
+        return preload(plan, manifest, save=save)
+
+    cli.preload_metadata = record
+    cli.bulk_upload(str(tmp_path), dry_run=True, batch=True, token_path=str(tmp_path / "token.json"))
+
+    assert [p.video_path for p in planned] == [original]
+    assert planned[0].metadata_path == str(tmp_path / "v1.json")
+    assert "Skipping duplicate render: copy-audio.mp4" in capsys.readouterr().out
+
+
+def test_query_reads_legacy_history_without_writing(tmp_path, capsys):
+    (tmp_path / "spidercat_uploaded_videos.json").write_text(json.dumps(
+        {"old": {"video_id": "vid00000000", "upload_time": "2025-01-01T00:00:00", "file_name": "old.mp4"}}),
+        encoding="utf-8")
+    (tmp_path / "spidercat_uploaded_videos.jsonl").write_text(json.dumps(
+        {"key": "new", "entry": {"video_id": "vid00000001", "upload_time": "2025-01-02T00:00:00",
+                                 "file_name": "new.mp4"}}) + "\n", encoding="utf-8")
+    before = tree(tmp_path)
+
+    cli = uploader.SpiderCatYouTubeUploaderCLI()
+    rows = cli.query_history(str(tmp_path), "file", match=".mp4")
+
+    assert sorted(row["video_id"] for row in rows) == ["vid00000000", "vid00000001"]
+    assert "2 of 2 recorded upload(s)" in capsys.readouterr().out
+    assert tree(tmp_path) == before
@@ -0,0 +1,78 @@
+import os, sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+
+MIB = 1024 * 1024
+
+
+def test_clean_slow_link_keeps_initial_chunk_size():
+    sizer = uploader.ChunkSizer()
+    for _ in range(5):
+        sizer.record_chunk(sizer.current(), sizer.current() / MIB)  # 1 MiB/s, target would be 4 MiB
+    assert sizer.current() == 8 * MIB
+
+
+def test_errors_halve_down_to_min_chunk():
+    sizer = uploader.ChunkSizer()
+    sizer.record_error()
+    assert sizer.current() <= 4 * MIB
+    for _ in range(10):
+        sizer.record_error()
+    assert sizer.current() == uploader.ChunkSizer.MIN_CHUNK
+
+
+def test_fast_flaky_link_does_not_grow_past_initial_size():
+    sizer = uploader.ChunkSizer()
+    for i in range(40):
+        if i % 3 == 0:
+            sizer.record_error(dropped=False)  # server-side failures: size does not change the odds
+        else:
+            sizer.record_chunk(sizer.current(), 0.01)  # 800 MiB/s would otherwise mean MAX_CHUNK
+        assert sizer.current() <= 8 * MIB
+
+
+def test_sustained_errors_shrink_chunks():
+    sizer = uploader.ChunkSizer()
+    for _ in range(6):
+        sizer.record_error()
+        sizer.record_chunk(sizer.current(), sizer.current() / MIB)
+    assert sizer.current() < 8 * MIB
+
+
+def retransmitted(sizer, drop_per_mib, payload=2048 * MIB, seed=1337):
+    """Bytes sent again while pushing `payload` over a fast link that drops with `drop_per_mib` per MiB"""
+    rng = random.Random(seed)
+    wasted = done = 0
+    while done < payload:
+        size = min(sizer.current(), payload - done)
+        sent = 0
+        while sent < size and rng.random() >= drop_per_mib * min(MIB, size - sent) / MIB:
+            sent += min(MIB, size - sent)
+        if sent < size:
+            wasted += sent
+            sizer.record_error(size)
+        else:
+            done += size
+            sizer.record_chunk(size, size / (500 * MIB))
+    return wasted / payload
+
+
+def test_drops_waste_less_than_fixed_chunks():
+    for drop_per_mib in (0.05, 0.1):
+        adaptive = retransmitted(uploader.ChunkSizer(), drop_per_mib)
+        fixed = retransmitted(uploader.ChunkSizer(8 * MIB, fixed=True), drop_per_mib)
+        assert adaptive < fixed / 2, (drop_per_mib, adaptive, fixed)
+
+
+def test_link_that_dropped_stays_at_or_below_initial_size():
+    sizer = uploader.ChunkSizer()
+    for _ in range(3):
+        sizer.record_chunk(sizer.current(), 0.01)
+    assert sizer.current() == uploader.ChunkSizer.MAX_CHUNK
+    sizer.record_error()
+    for _ in range(20):
+        sizer.record_chunk(sizer.current(), 0.01)
+        assert sizer.current() <= 8 * MIB
@@ -0,0 +1,24 @@
+import os, sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+
+
+def test_old_lease_is_only_reclaimed_after_watching_it_stall(tmp_path):
+    dead = uploader.WorkClaims(tmp_path, node_id="dead", lease_seconds=0.5)
+    assert dead.claim("key", "v1-audio.mp4")
+    dead._stop.set()  # the node dies holding its lease
+    # Far in the past by this host's clock, as a skewed host's heartbeat could look
+    lease = tmp_path / "key.lease"
+    os.utime(lease, (time.time() - 3600, time.time() - 3600))
+
+    claims = uploader.WorkClaims(tmp_path, node_id="live", lease_seconds=0.5)
+    assert not claims.claim("key", "v1-audio.mp4")
+    assert "key" in claims.waiting
+
+    time.sleep(0.6)
+    assert claims.claim("key", "v1-audio.mp4")
+    assert claims.stats['reclaimed'] == 1
+    claims.close()
@@ -0,0 +1,52 @@
+import os, sys
+import json
+import signal
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+
+
+def test_failed_daemon_upload_is_retried(tmp_path):
+    video = tmp_path / "v1-audio.mp4"
+    video.write_bytes(b"render" * 1000)
+    (tmp_path / "v1.json").write_text(json.dumps({"ai_commentary": {"script": "Title\nBody"}}), encoding="utf-8")
+
+    cli = uploader.SpiderCatYouTubeUploaderCLI()
+    cli.ensure_authentication = lambda *args: (True, "ok")
+    attempts = []
+
+    def upload(worker, planned, privacy_status, history, log_prefix="", fingerprints=None):
+        attempts.append(planned.video_path)
+        if len(attempts) == 1:
+            return None  # e.g. retries exhausted
+        history.record(planned.file_key, {"video_id": "vid00000001", "upload_time": "2025-01-01T00:00:00",
+                                          "file_name": planned.video_path.name})
+        cli.stop_daemon = True
+        return "vid00000001"
+
+    cli._upload_planned_file = upload
+    guard = threading.Timer(20, lambda: setattr(cli, "stop_daemon", True))
+    handlers = signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM)
+    guard.start()
+    try:
+        cli.run_daemon(str(tmp_path), token_path=str(tmp_path / "token.json"), settle_seconds=0,
+                       sidecar_timeout=0, poll_interval=0.2)
+    finally:
+        guard.cancel()
+        signal.signal(signal.SIGINT, handlers[0])
+        signal.signal(signal.SIGTERM, handlers[1])
+
+    assert attempts == [video, video]
+
+
+def test_daemon_rejects_flags_it_would_ignore(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["uploader", str(tmp_path), "--daemon", "--validate", "--channels", "pool.json"])
+    try:
+        uploader.main()
+    except SystemExit as e:
+        assert e.code == 2
+    else:
+        raise AssertionError("--daemon --validate was accepted")
+    assert "--daemon does not support --validate, --channels" in capsys.readouterr().err
@@ -0,0 +1,89 @@
+import os, sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+import fake_youtube_api
+
+LOCAL = uploader.LOCAL_TZ
+
+
+def connect(server, tmp_path, daily_limit=10000):
+    youtube = uploader.YouTubeUploader()
+    youtube.api_root = server.root_url
+    assert youtube.setup_youtube_service(str(tmp_path / "credentials.json"), str(tmp_path / "token.json"))[0]
+    youtube.quota = uploader.QuotaBudget(daily_limit=daily_limit)
+    youtube.retry_policy = uploader.RetryPolicy(max_delay=0.001)
+    return youtube
+
+
+def items_by_title(server):
+    with server.lock:
+        return {playlist["snippet"]["title"]: playlist["items"] for playlist in server.playlists.values()}
+
+
+def test_daily_playlists_are_cached_across_runs(tmp_path):
+    server = fake_youtube_api.serve()
+    cache = tmp_path / "playlists.json"
+    try:
+        playlists = uploader.PlaylistAssigner(connect(server, tmp_path), cache, prefix="Daily")
+        # Queued out of order; each playlist is filled in release order
+        playlists.queue("c", "vid00000003", datetime(2030, 1, 1, 18, 0, tzinfo=LOCAL))
+        playlists.queue("a", "vid00000001", datetime(2030, 1, 1, 9, 0, tzinfo=LOCAL))
+        playlists.queue("b", "vid00000002", datetime(2030, 1, 2, 9, 0, tzinfo=LOCAL))
+        playlists.queue("a", "vid00000001", datetime(2030, 1, 1, 9, 0, tzinfo=LOCAL))  # queued twice, added once
+        assert playlists.flush() == 3
+
+        stats = server.snapshot()
+        assert (stats["playlist_list_calls"], stats["playlists_created"], stats["playlist_items_added"]) == (1, 2, 3)
+        assert items_by_title(server) == {"Daily 2030-01-01": ["vid00000001", "vid00000003"],
+                                          "Daily 2030-01-02": ["vid00000002"]}
+
+        # The next run finds the day's playlist in the cache: no playlists.list, no playlists.insert
+        playlists = uploader.PlaylistAssigner(connect(server, tmp_path), cache, prefix="Daily")
+        playlists.queue("d", "vid00000004", datetime(2030, 1, 1, 20, 0, tzinfo=LOCAL))
+        assert playlists.flush() == 1
+        stats = server.snapshot()
+        assert (stats["playlist_list_calls"], stats["playlists_created"], stats["playlist_items_added"]) == (1, 2, 4)
+        assert playlists.uploader.quota.used == 50
+    finally:
+        server.shutdown()
+
+
+def test_playlists_made_elsewhere_are_found_not_duplicated(tmp_path):
+    server = fake_youtube_api.serve()
+    try:
+        with server.lock:
+            server.playlists["PLexisting"] = {"snippet": {"title": "Daily 2030-01-01"}, "items": []}
+        playlists = uploader.PlaylistAssigner(connect(server, tmp_path), tmp_path / "playlists.json", prefix="Daily")
+        playlists.queue("a", "vid00000001", datetime(2030, 1, 1, 9, 0, tzinfo=LOCAL))
+        assert playlists.flush() == 1
+        assert server.snapshot()["playlists_created"] == 0
+        assert playlists.stats["found"] == 1
+        assert items_by_title(server) == {"Daily 2030-01-01": ["vid00000001"]}
+    finally:
+        server.shutdown()
+
+
+def test_additions_beyond_the_quota_wait_for_the_next_run(tmp_path):
+    server = fake_youtube_api.serve()
+    cache = tmp_path / "playlists.json"
+    try:
+        # playlists.list (1) + playlists.insert (50) + two playlistItems.insert (50 each)
+        playlists = uploader.PlaylistAssigner(connect(server, tmp_path, daily_limit=151), cache, prefix="Daily")
+        for i in range(4):
+            playlists.queue(f"k{i}", f"vid0000000{i}", datetime(2030, 1, 1, 9, i, tzinfo=LOCAL))
+        assert playlists.flush() == 2
+        assert [item["video_id"] for item in playlists.pending] == ["vid00000002", "vid00000003"]
+
+        playlists = uploader.PlaylistAssigner(connect(server, tmp_path), cache, prefix="Daily")
+        assert len(playlists.pending) == 2
+        assert playlists.flush() == 2
+        assert playlists.pending == []
+        stats = server.snapshot()
+        assert (stats["playlist_list_calls"], stats["playlists_created"]) == (1, 1)
+        assert items_by_title(server) == {"Daily 2030-01-01": [f"vid0000000{i}" for i in range(4)]}
+    finally:
+        server.shutdown()
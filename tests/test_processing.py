@@ -0,0 +1,87 @@
+import os, sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+import fake_youtube_api
+
+
+def connect(server, tmp_path):
+    youtube = uploader.YouTubeUploader()
+    youtube.api_root = server.root_url
+    assert youtube.setup_youtube_service(str(tmp_path / "credentials.json"), str(tmp_path / "token.json"))[0]
+    youtube.quota = uploader.QuotaBudget(tmp_path / "quota.json")
+    youtube.retry_policy = uploader.RetryPolicy(max_delay=0.001)
+    return youtube
+
+
+def add_video(server, video_id, processing_seconds=0):
+    video = {"kind": "youtube#video", "id": video_id,
+             "status": {"uploadStatus": "processed", "privacyStatus": "private"}}
+    if processing_seconds:
+        video["_processed_at"] = time.time() + processing_seconds
+    with server.lock:
+        server.videos[video_id] = video
+
+
+def record(history, key, video_id, minutes_ago=5):
+    uploaded = (datetime.now() - timedelta(minutes=minutes_ago)).isoformat()
+    history.record(key, {"video_id": video_id, "upload_time": uploaded, "file_name": f"{key}.mp4"})
+
+
+def test_poll_checks_fifty_ids_per_videos_list_call(tmp_path):
+    server = fake_youtube_api.serve()
+    history = uploader.UploadHistoryDB(tmp_path / "history.db").load()
+    try:
+        for i in range(120):
+            video_id = f"vid{i:08d}"
+            if i < 110:  # the last ten never reached YouTube
+                add_video(server, video_id, processing_seconds=600 if i < 10 else 0)
+            record(history, f"k{i}", video_id)
+
+        tracker = uploader.ProcessingTracker(connect(server, tmp_path), history)
+        assert tracker.poll() == 20
+
+        assert server.snapshot()["list_calls"] == 3
+        assert tracker.stats == {"calls": 3, "checks": 120, "processed": 100, "failed": 0}
+        assert tracker.uploader.quota.used == 3
+        processing = history.get("k0")["processing"]
+        assert processing["state"] == "pending" and processing["processing_status"] == "processing"
+        # The next check follows YouTube's own estimate of the time left
+        next_check = datetime.fromisoformat(processing["next_check"]) - datetime.now()
+        assert timedelta(minutes=9) < next_check <= timedelta(minutes=10)
+        assert history.get("k115")["processing"]["upload_status"] == "missing"
+        assert history.get("k50")["processing"]["state"] == "done"
+    finally:
+        history.close()
+        server.shutdown()
+
+
+def test_videos_not_due_ride_along_with_a_due_one(tmp_path):
+    server = fake_youtube_api.serve()
+    history = uploader.UploadHistoryDB(tmp_path / "history.db").load()
+    try:
+        for i in range(30):
+            add_video(server, f"vid{i:08d}", processing_seconds=600)
+            record(history, f"k{i}", f"vid{i:08d}")
+        tracker = uploader.ProcessingTracker(connect(server, tmp_path), history)
+        assert tracker.poll() == 30
+        assert server.snapshot()["list_calls"] == 1
+
+        # Nothing is due until YouTube's estimate runs out
+        assert tracker.poll() == 30
+        assert server.snapshot()["list_calls"] == 1
+
+        # One new upload is due; the 30 that are not fill up the same call
+        add_video(server, "vidnew00000")
+        record(history, "new", "vidnew00000")
+        assert tracker.poll() == 30
+        assert server.snapshot()["list_calls"] == 2
+        assert tracker.stats["checks"] == 61
+        assert history.get("new")["processing"]["state"] == "done"
+    finally:
+        history.close()
+        server.shutdown()
@@ -0,0 +1,76 @@
+import os, sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+import fake_youtube_api
+
+
+def pacific_days(monkeypatch, day):
+    """Make QuotaBudget see the Pacific calendar day held in day[0]"""
+    monkeypatch.setattr(uploader.QuotaBudget, "_pacific_day", staticmethod(lambda: day[0]))
+
+
+def test_budget_is_shared_through_state_and_resets_at_pacific_midnight(tmp_path, monkeypatch):
+    day = ["2030-01-01"]
+    pacific_days(monkeypatch, day)
+    state = tmp_path / "quota.json"
+    budget = uploader.QuotaBudget(state)
+    for _ in range(6):
+        assert budget.try_acquire('videos.insert')
+    assert not budget.try_acquire('videos.insert')
+    assert budget.remaining() == 400
+
+    # A later run on the same Pacific day continues from the saved usage
+    assert uploader.QuotaBudget(state).remaining() == 400
+
+    day[0] = "2030-01-02"
+    assert budget.remaining() == 10000
+    assert budget.try_acquire('videos.insert')
+    assert uploader.QuotaBudget(state).remaining() == 8400
+
+
+def test_next_reset_is_the_coming_pacific_midnight():
+    reset = uploader.QuotaBudget().next_reset()
+    pacific = reset.astimezone(uploader.PACIFIC_TZ)
+    assert (pacific.hour, pacific.minute, pacific.second) == (0, 0, 0)
+    assert timedelta(0) < reset - datetime.now(uploader.LOCAL_TZ) <= timedelta(hours=25)
+
+
+def test_plan_projects_completion_by_day(tmp_path, monkeypatch):
+    pacific_days(monkeypatch, ["2030-01-01"])
+    budget = uploader.QuotaBudget(tmp_path / "quota.json")
+    budget.try_acquire('videos.insert', count=5)
+
+    today, per_day, done = budget.plan(1)
+    assert (today, per_day) == (1, 6)
+    assert abs((done - datetime.now(uploader.LOCAL_TZ)).total_seconds()) < 60
+
+    # 1 fits today, 6 tomorrow, the last 3 the day after
+    today, per_day, done = budget.plan(10)
+    assert (today, per_day) == (1, 6)
+    assert done == budget.next_reset() + timedelta(days=1)
+
+    assert uploader.QuotaBudget(daily_limit=1000).plan(2)[1:] == (0, None)
+
+
+def test_quota_exceeded_from_the_api_exhausts_the_budget(tmp_path):
+    server = fake_youtube_api.serve(quota=1000)
+    try:
+        video = tmp_path / "v1-audio.mp4"
+        video.write_bytes(b"render" * 1000)
+        youtube = uploader.YouTubeUploader()
+        youtube.api_root = server.root_url
+        assert youtube.setup_youtube_service(str(tmp_path / "credentials.json"), str(tmp_path / "token.json"))[0]
+        youtube.quota = uploader.QuotaBudget(tmp_path / "quota.json")
+        youtube.retry_policy = uploader.RetryPolicy(base_delay=0.01)
+
+        video_id, message = youtube.upload_video(str(video), "Title", "Body")
+
+        assert video_id is None and "quotaExceeded" in message
+        assert youtube.quota.remaining() == 0
+        assert server.snapshot()["quota_rejections"] == 1
+    finally:
+        server.shutdown()
@@ -0,0 +1,114 @@
+import os, sys
+import io
+import random
+import contextlib
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+
+LOCAL = uploader.LOCAL_TZ
+
+
+def local(day, hour, minute=0):
+    return datetime(2030, 1, day, hour, minute, tzinfo=LOCAL)
+
+
+def test_blocked_intervals_merge_and_report_ends():
+    blocked = uploader.BlockedIntervals()
+    blocked.add(100, 200)
+    blocked.add(300, 400)
+    assert len(blocked) == 2
+    assert blocked.blocked_until(150) == 200
+    assert blocked.blocked_until(100) is None  # open interval
+    assert blocked.blocked_until(250) is None
+    blocked.add(150, 350)
+    assert len(blocked) == 1
+    assert blocked.blocked_until(101) == 400
+    blocked.add(50, 1000)
+    assert len(blocked) == 1
+    assert blocked.blocked_until(999) == 1000
+
+
+def test_blocked_intervals_match_a_plain_list():
+    rng = random.Random(7)
+    blocked, spans = uploader.BlockedIntervals(), []
+    for _ in range(500):
+        start = rng.randrange(10000)
+        end = start + rng.randrange(1, 60)
+        blocked.add(start, end)
+        spans.append((start, end))
+    merged = []
+    for start, end in sorted(spans):
+        if merged and merged[-1][1] > start:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    assert len(blocked) == len(merged)
+    for t in range(10100):
+        expected = next((end for start, end in merged if start < t < end), None)
+        assert blocked.blocked_until(t) == expected
+
+
+def test_slots_keep_spacing_from_earlier_bookings():
+    allocator = uploader.ReleaseSlotAllocator(spacing_minutes=10)
+    allocator.book(local(1, 12, 0))
+    allocator.book(local(1, 12, 10))
+    assert allocator.allocate(local(1, 11, 55)) == local(1, 12, 20)
+    assert allocator.allocate(local(1, 11, 0)) == local(1, 11, 0)
+    assert allocator.allocate(local(1, 11, 5)) == local(1, 11, 10)
+    assert allocator.allocate(local(1, 11, 5)) == local(1, 11, 20)
+
+
+def test_slots_skip_blackout_windows():
+    blackouts = uploader.ReleaseSlotAllocator.parse_blackouts("22:00-07:00,12:00-12:30")
+    allocator = uploader.ReleaseSlotAllocator(spacing_minutes=10, blackouts=blackouts)
+    assert allocator.allocate(local(1, 23, 0)) == local(2, 7, 0)
+    assert allocator.allocate(local(2, 12, 5)) == local(2, 12, 30)
+    slots = [allocator.allocate(local(2, 21, 30)) for _ in range(4)]
+    assert slots == [local(2, 21, 30), local(2, 21, 40), local(2, 21, 50), local(3, 7, 0)]
+
+
+def test_daily_cap_counts_earlier_bookings():
+    allocator = uploader.ReleaseSlotAllocator(spacing_minutes=10, daily_cap=3)
+    allocator.book(local(1, 9, 0))
+    allocator.book(local(1, 10, 0))
+    assert allocator.allocate(local(1, 8, 0)) == local(1, 8, 0)
+    assert allocator.allocate(local(1, 8, 0)) == local(2, 0, 0)
+    assert allocator.per_day[local(1, 0).date()] == 3
+
+
+def test_booked_days_are_crossed_in_one_jump():
+    blackouts = uploader.ReleaseSlotAllocator.parse_blackouts("00:00-07:00")
+    allocator = uploader.ReleaseSlotAllocator(spacing_minutes=10, blackouts=blackouts, daily_cap=5)
+    for _ in range(5 * 200):
+        allocator.allocate(local(1, 0))
+    steps = []
+    blocked_until = allocator._blocked_until
+    allocator._blocked_until = lambda t: steps.append(t) or blocked_until(t)
+    assert allocator.allocate(local(1, 0)) == local(1, 7) + timedelta(days=200)
+    assert len(steps) <= 3
+    assert len(allocator.blocked) == 3  # the day before's blackout, the booked run, the next day's blackout
+
+
+def test_plan_avoids_release_times_of_earlier_runs(tmp_path):
+    history = uploader.UploadHistoryDB(tmp_path / "history.db").load()
+    for i, minute in enumerate((0, 10, 20)):
+        history.record(f"earlier{i}", {"video_id": f"vid0000000{i}", "upload_time": "2029-12-31T00:00:00",
+                                       "scheduled_time": local(1, 12, minute).isoformat(),
+                                       "file_name": f"earlier{i}.mp4"})
+
+    cli = uploader.SpiderCatYouTubeUploaderCLI()
+    with contextlib.redirect_stdout(io.StringIO()):
+        releases = cli.plan_releases(history, ["a", "b"], local(1, 12, 5), 10)
+    assert releases == {"a": local(1, 12, 30), "b": local(1, 12, 40)}
+
+    # The first plan's reservations block a second, concurrent run too
+    with contextlib.redirect_stdout(io.StringIO()):
+        releases = cli.plan_releases(history, ["c"], local(1, 12, 5), 10, daily_cap=6)
+    assert releases == {"c": local(1, 12, 50)}
+    with contextlib.redirect_stdout(io.StringIO()):
+        releases = cli.plan_releases(history, ["d"], local(1, 12, 5), 10, daily_cap=6)
+    assert releases == {"d": local(2, 0, 0)}
+    history.close()
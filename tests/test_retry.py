@@ -0,0 +1,115 @@
+import os, sys
+import json
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta
+
+import httplib2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+import fake_youtube_api
+
+uploader.load_youtube_api()
+RetryPolicy = uploader.RetryPolicy
+
+
+def http_error(status, reason="", retry_after=None):
+    headers = {"status": str(status)}
+    if retry_after is not None:
+        headers["retry-after"] = retry_after
+    content = json.dumps({"error": {"code": status, "errors": [{"reason": reason}]}}).encode()
+    return uploader.HttpError(httplib2.Response(headers), content)
+
+
+def test_classify_separates_quota_rate_limits_and_server_errors():
+    policy = RetryPolicy()
+    assert policy.classify(http_error(403, "quotaExceeded")) == (RetryPolicy.QUOTA, None)
+    assert policy.classify(http_error(403, "rateLimitExceeded")) == (RetryPolicy.RATE_LIMIT, None)
+    assert policy.classify(http_error(429, retry_after="7")) == (RetryPolicy.RATE_LIMIT, 7.0)
+    assert policy.classify(http_error(503, "backendError", retry_after="2")) == (RetryPolicy.TRANSIENT, 2.0)
+    assert policy.classify(http_error(500)) == (RetryPolicy.TRANSIENT, None)
+    assert policy.classify(http_error(403, "forbidden")) == (RetryPolicy.FATAL, None)
+    assert policy.classify(http_error(404, "notFound")) == (RetryPolicy.FATAL, None)
+    assert policy.classify(ConnectionResetError()) == (RetryPolicy.TRANSIENT, None)
+    assert policy.classify(ValueError("bad metadata")) == (RetryPolicy.FATAL, None)
+
+
+def test_retry_after_accepts_an_http_date():
+    when = format_datetime(datetime.now(uploader.UTC) + timedelta(seconds=30), usegmt=True)
+    kind, retry_after = RetryPolicy().classify(http_error(429, retry_after=when))
+    assert kind == RetryPolicy.RATE_LIMIT
+    assert 25 <= retry_after <= 30
+
+
+def test_backoff_waits_at_least_retry_after_and_stops_on_quota():
+    policy = RetryPolicy(max_delay=0.001)
+    assert policy.handle_error(http_error(429, retry_after="0.2"), 1) == (True, RetryPolicy.RATE_LIMIT)
+    assert policy.stats["backoff_seconds"] == 0.2
+    assert policy.handle_error(http_error(403, "quotaExceeded"), 1) == (False, RetryPolicy.QUOTA)
+    assert policy.handle_error(http_error(503), policy.max_retries + 1) == (False, RetryPolicy.TRANSIENT)
+    assert policy.stats["retries"] == 1
+
+
+def test_breaker_opens_half_opens_and_backs_off_longer():
+    policy = RetryPolicy(max_delay=0.001, breaker_threshold=2, breaker_cooldown=0.2, max_breaker_cooldown=1.0)
+    policy.handle_error(http_error(503), 1)
+    # Rate limits never trip the breaker
+    policy.handle_error(http_error(429), 1)
+    assert policy.stats["breaker_trips"] == 0
+
+    started = time.monotonic()
+    assert policy.handle_error(http_error(503), 2) == (True, RetryPolicy.TRANSIENT)
+    assert policy.stats["breaker_trips"] == 1
+    assert time.monotonic() - started >= 0.2
+
+    # Half-open: a single failure after the cooldown reopens it, for twice as long
+    started = time.monotonic()
+    policy.handle_error(http_error(503), 3)
+    assert policy.stats["breaker_trips"] == 2
+    assert time.monotonic() - started >= 0.4
+
+    # A success closes it and restores the initial cooldown
+    policy.record_success()
+    policy.handle_error(http_error(503), 1)
+    assert policy.stats["breaker_trips"] == 2
+    started = time.monotonic()
+    policy.handle_error(http_error(503), 2)
+    assert policy.stats["breaker_trips"] == 3
+    assert 0.2 <= time.monotonic() - started < 0.4
+
+
+def test_cancel_interrupts_an_open_circuit():
+    policy = RetryPolicy(max_delay=0.001, breaker_threshold=1, breaker_cooldown=60)
+    policy.cancel()
+    started = time.monotonic()
+    assert policy.handle_error(http_error(503), 1) == (False, RetryPolicy.TRANSIENT)
+    assert policy.stats["breaker_trips"] == 1
+    assert not policy.wait_for_circuit()
+    assert time.monotonic() - started < 1
+
+
+def test_upload_survives_injected_server_errors_and_rate_limits(tmp_path):
+    server = fake_youtube_api.serve(error_rate=0.3, rate_limit=0.2, retry_after=0.05, seed=7)
+    try:
+        video = tmp_path / "v1-audio.mp4"
+        video.write_bytes(os.urandom(3 * 1024 * 1024))
+        youtube = uploader.YouTubeUploader()
+        youtube.api_root = server.root_url
+        assert youtube.setup_youtube_service(str(tmp_path / "credentials.json"), str(tmp_path / "token.json"))[0]
+        youtube.retry_policy = RetryPolicy(max_delay=0.001, breaker_threshold=100)
+        youtube.chunk_sizer = uploader.ChunkSizer(initial=uploader.ChunkSizer.MIN_CHUNK)
+
+        video_id, message = youtube.upload_video(str(video), "Title", "Body")
+
+        assert video_id, message
+        stats = server.snapshot()
+        injected = stats["injected_5xx"] + stats["injected_rate_limit"]
+        assert injected > 0
+        assert youtube.retry_policy.stats["retries"] == injected
+        # 503s carry Retry-After; rate limits back off by max_delay only
+        assert youtube.retry_policy.stats["backoff_seconds"] >= 0.05 * stats["injected_5xx"]
+    finally:
+        server.shutdown()
@@ -0,0 +1,74 @@
+import os, sys
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import Memescreamer_Bulk_Youtube_uploader as uploader
+import fake_youtube_api
+
+MIB = 1024 * 1024
+
+
+def open_session(server, payload, sent):
+    """Start a resumable upload on the fake server and send its first `sent` bytes, like an interrupted run"""
+    start = urllib.request.Request(f"{server.root_url}upload/youtube/v3/videos?uploadType=resumable&part=snippet",
+                                   data=b"{}", method="POST",
+                                   headers={"X-Upload-Content-Length": str(len(payload))})
+    with urllib.request.urlopen(start) as response:
+        uri = response.headers["Location"]
+    chunk = urllib.request.Request(uri, data=payload[:sent], method="PUT",
+                                   headers={"Content-Range": f"bytes 0-{sent - 1}/{len(payload)}"})
+    try:
+        urllib.request.urlopen(chunk)
+    except urllib.error.HTTPError as e:
+        assert e.code == 308 and e.headers["Range"] == f"bytes=0-{sent - 1}"
+    return uri
+
+
+def test_stored_session_resumes_from_committed_offset(tmp_path):
+    server = fake_youtube_api.serve()
+    try:
+        video = tmp_path / "v1-audio.mp4"
+        payload = os.urandom(5 * MIB)
+        video.write_bytes(payload)
+        sessions = uploader.UploadSessionStore(tmp_path / "sessions.json")
+        sessions.save("v1", open_session(server, payload, 2 * MIB), 0, video)
+
+        youtube = uploader.YouTubeUploader()
+        youtube.api_root = server.root_url
+        assert youtube.setup_youtube_service(str(tmp_path / "credentials.json"), str(tmp_path / "token.json"))[0]
+        youtube.session_store = sessions
+        video_id, message = youtube.upload_video(str(video), "Title", "Body", file_key="v1")
+
+        assert video_id, message
+        stats = server.snapshot()
+        assert stats["status_probes"] == 1
+        assert stats["sessions_started"] == 1
+        assert stats["bytes_received"] == len(payload)  # nothing before the committed offset is sent again
+        assert sessions.get("v1", len(payload)) is None
+    finally:
+        server.shutdown()
+
+
+def test_expired_session_restarts_from_byte_zero(tmp_path):
+    server = fake_youtube_api.serve()
+    try:
+        video = tmp_path / "v1-audio.mp4"
+        video.write_bytes(os.urandom(MIB))
+        sessions = uploader.UploadSessionStore(tmp_path / "sessions.json")
+        sessions.save("v1", f"{server.root_url}upload/youtube/v3/videos/session/0123abcd", MIB // 2, video)
+
+        youtube = uploader.YouTubeUploader()
+        youtube.api_root = server.root_url
+        assert youtube.setup_youtube_service(str(tmp_path / "credentials.json"), str(tmp_path / "token.json"))[0]
+        youtube.session_store = sessions
+        video_id, message = youtube.upload_video(str(video), "Title", "Body", file_key="v1")
+
+        assert video_id, message
+        stats = server.snapshot()
+        assert stats["sessions_started"] == 1
+        assert stats["bytes_received"] == MIB
+        assert sessions.get("v1", MIB) is None
+    finally:
+        server.shutdown()